@@ -0,0 +1,59 @@
+"""
+Compares the encoders against a plain normalize-and-translate pass for
+ASCII, mostly ASCII and densely accented input.
+
+Run from the repository root::
+
+    python benchmarks/ascii_fast_path.py
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import os
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import translitcodec  # noqa: E402
+
+
+SAMPLES = [
+    ('ascii record', 'Jane Doe, 42 Main Street, Springfield'),
+    ('ascii 100k', 'The quick brown fox jumps over the lazy dog. ' * 2200),
+    ('mostly ascii 100k',
+     ('The quick brown fox jumps over the lazy dog. ' * 60 + 'café ') * 37),
+    ('accented 100k', 'Zażółć gęślą jaźń. ' * 5200),
+]
+
+MODES = [
+    ('long', translitcodec.long_encode, translitcodec.long_table),
+    ('short', translitcodec.short_encode, translitcodec.short_table),
+    ('one', translitcodec.single_encode, translitcodec.single_table),
+]
+
+
+def reference(input, table):
+    return unicodedata.normalize('NFKC', input).translate(table)
+
+
+def best_of(func, number, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main():
+    print('%-6s %-18s %12s %12s %8s' % (
+        'mode', 'input', 'before (us)', 'after (us)', 'speedup'))
+    for mode, encoder, table in MODES:
+        for name, data in SAMPLES:
+            assert encoder(data)[0] == reference(data, table)
+            number = 20000 if len(data) < 100 else 50
+            before = best_of(lambda: reference(data, table), number)
+            after = best_of(lambda: encoder(data), number)
+            print('%-6s %-18s %12.2f %12.2f %7.1fx' % (
+                mode, name, before * 1e6, after * 1e6, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Measures how the number of error handler callbacks and the encoding time
+scale with the length of runs of unencodable characters, compared to a
+handler that resolves one character per callback, and, for isolated
+characters, what the character cache of the handlers saves and how often
+it is hit.
+
+Run from the repository root::
+
+    python benchmarks/error_handlers.py
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import codecs
+import os
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import translitcodec  # noqa: E402
+
+
+RUN_LENGTHS = [1, 10, 100, 1000, 10000]
+RUN = '€☺™“”另'
+
+
+def per_character(exc):
+    """The handler of translitcodec 0.7, one character per callback."""
+    char = unicodedata.normalize('NFKC', exc.object[exc.start:exc.end])[0]
+    new_char = char.translate(translitcodec.long_table)
+    if char == new_char:
+        new_char = '?'
+    return new_char, exc.start + 1
+
+
+def counting(handler):
+    calls = [0]
+
+    def count(exc):
+        calls[0] += 1
+        return handler(exc)
+    return count, calls
+
+
+def main():
+    print('%8s %-10s %10s %12s' % ('run', 'handler', 'callbacks', 'time (ms)'))
+    for length in RUN_LENGTHS:
+        data = 'text ' + (RUN * length)[:length] + ' text'
+        for name, handler in (('per-char', per_character),
+                              ('batch', translitcodec.replace_long)):
+            count, calls = counting(handler)
+            codecs.register_error('benchmark/' + name, count)
+            data.encode('ascii', 'benchmark/' + name)
+            callbacks = calls[0]
+            number = max(1, 10000 // length)
+            elapsed = min(timeit.repeat(
+                lambda: data.encode('ascii', 'benchmark/' + name),
+                number=number, repeat=3)) / number
+            print('%8d %-10s %10d %12.3f' % (length, name, callbacks, elapsed * 1e3))
+
+    data = 'Price 10€ ™ “quoted” ☺ and so on. ' * 10000
+    resolve = translitcodec._resolvers['long']
+    for name, handler, resolver in (('per-char', per_character, resolve),
+                                    ('uncached', translitcodec.replace_long,
+                                     resolve.__wrapped__),
+                                    ('batch', translitcodec.replace_long, resolve)):
+        codecs.register_error('benchmark/' + name, handler)
+        translitcodec.clear_caches()
+        translitcodec._resolvers['long'] = resolver
+        try:
+            elapsed = min(timeit.repeat(
+                lambda: data.encode('ascii', 'benchmark/' + name),
+                number=5, repeat=5)) / 5
+        finally:
+            translitcodec._resolvers['long'] = resolve
+        print('isolated %-10s %23.3f' % (name, elapsed * 1e3))
+    print(translitcodec.handler_cache_info()['long'])
+
+
+if __name__ == '__main__':
+    main()
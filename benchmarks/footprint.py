@@ -0,0 +1,178 @@
+"""
+Reports the startup cost and memory footprint of translitcodec for each
+way the long, short and single tables can be loaded: mapped from
+tables/transtab.bin, the default, or imported from the generated
+tables/transtab.py module, the fallback.  For comparison, the same is
+reported for the three tables as dict literals imported with the module,
+as in translitcodec 0.7.
+
+For each, in fresh interpreters: the wall time of ``import
+translitcodec`` and of loading the three tables, the memory retained
+according to tracemalloc after the import, one call per mode of the
+'translit/<mode>/ascii' codecs and error handlers, one encode call per
+mode and loading every table, the size of each table, and the peak memory
+of one ``codecs.encode(..., 'translit/long/ascii')`` call on a large
+input.
+Run from the repository root::
+
+    python benchmarks/footprint.py
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import compileall
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+REPRESENTATIONS = {
+    'mapped': '',
+    'module': 'translitcodec.tables.map_transtab = lambda *args: None\n',
+}
+
+RUNS = 10
+
+TIMING = '''
+import time
+start = time.perf_counter()
+import translitcodec, translitcodec.tables
+imported = time.perf_counter()
+%s
+translitcodec.long_table, translitcodec.short_table, translitcodec.single_table
+print((imported - start) * 1e6, (time.perf_counter() - imported) * 1e6)
+'''
+
+MEMORY = '''
+import codecs, gc, json, sys, tracemalloc
+# Grow the table of interned strings beforehand: a resize would count
+# against whatever step of the measurement triggers it.
+interned = [sys.intern('interned %%d' %% i) for i in range(100000)]
+tracemalloc.start()
+import translitcodec, translitcodec.tables
+gc.collect()
+imported = tracemalloc.get_traced_memory()[0]
+%s
+for mode in ('long', 'short', 'one'):
+    codecs.encode('caf\\xe9', 'translit/%%s/ascii' %% mode)
+    codecs.encode('caf\\xe9 \\u20ac', 'ascii', 'replace/translit/' + mode)
+gc.collect()
+charset = tracemalloc.get_traced_memory()[0]
+for mode in ('long', 'short', 'one'):
+    codecs.encode('caf\\xe9', 'translit/' + mode)
+gc.collect()
+encoded = tracemalloc.get_traced_memory()[0]
+def size(table):
+    if isinstance(table, dict):
+        values = {id(value): value for value in table.values()}
+        return sys.getsizeof(table) + sum(map(sys.getsizeof, values.values()))
+    return sys.getsizeof(table) + sum(map(sys.getsizeof, table))
+tables = {}
+for name in sorted(translitcodec._table_modules):
+    tables[name] = size(getattr(translitcodec, name))
+for mode in ('long', 'short', 'one'):
+    tables['translation %%s' %% mode] = size(translitcodec._translation_table(mode))
+gc.collect()
+loaded = tracemalloc.get_traced_memory()[0]
+data = 'Za\\u017c\\xf3\\u0142\\u0107 g\\u0119\\u015bl\\u0105 ja\\u017a\\u0144 \\u20ac \\u2122 ' * 400000
+codecs.encode(data[:100], 'translit/long/ascii')
+before = tracemalloc.get_traced_memory()[0]
+tracemalloc.reset_peak()
+codecs.encode(data, 'translit/long/ascii')
+peak = tracemalloc.get_traced_memory()[1] - before
+print(json.dumps({'imported': imported, 'charset': charset, 'encoded': encoded,
+                  'loaded': loaded, 'tables': tables, 'input': len(data), 'peak': peak}))
+'''
+
+# The 0.7 module: the tables as dict literals, normalized then translated.
+LITERALS_TIMING = '''
+import time
+start = time.perf_counter()
+import translit_literals
+print((time.perf_counter() - start) * 1e6, 0)
+'''
+
+LITERALS_MEMORY = '''
+import gc, json, sys, tracemalloc, unicodedata
+interned = [sys.intern('interned %d' % i) for i in range(100000)]
+tracemalloc.start()
+import translit_literals
+gc.collect()
+imported = charset = encoded = loaded = tracemalloc.get_traced_memory()[0]
+def size(table):
+    values = {id(value): value for value in table.values()}
+    return sys.getsizeof(table) + sum(map(sys.getsizeof, values.values()))
+tables = {name: size(getattr(translit_literals, name))
+          for name in ('long_table', 'short_table', 'single_table')}
+def encode(data):
+    return unicodedata.normalize('NFKC', data).translate(translit_literals.long_table).encode('ascii')
+data = 'Za\\u017c\\xf3\\u0142\\u0107 g\\u0119\\u015bl\\u0105 ja\\u017a\\u0144 \\u20ac \\u2122 ' * 400000
+encode(data[:100])
+before = tracemalloc.get_traced_memory()[0]
+tracemalloc.reset_peak()
+encode(data)
+peak = tracemalloc.get_traced_memory()[1] - before
+print(json.dumps({'imported': imported, 'charset': charset, 'encoded': encoded,
+                  'loaded': loaded, 'tables': tables, 'input': len(data), 'peak': peak}))
+'''
+
+
+def python(code, path=ROOT):
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return subprocess.check_output([sys.executable, '-c', code], cwd=path, env=env,
+                                   universal_newlines=True)
+
+
+def write_literals(directory):
+    """Write the long, short and single tables as dict literals, like 0.7."""
+    sys.path.insert(0, ROOT)
+    import translitcodec
+    with open(os.path.join(directory, 'translit_literals.py'), 'w') as fh:
+        for name in ('long_table', 'short_table', 'single_table'):
+            fh.write('%s = {\n' % name)
+            for pair in sorted(getattr(translitcodec, name).items()):
+                fh.write('    %r: %r,\n' % pair)
+            fh.write('}\n\n')
+    compileall.compile_dir(directory, quiet=1)
+
+
+def main():
+    compileall.compile_dir(os.path.join(ROOT, 'translitcodec'), quiet=1)
+    reports = {}
+    for name, setup in REPRESENTATIONS.items():
+        timings = [python(TIMING % setup).split() for _ in range(RUNS)]
+        reports[name] = json.loads(python(MEMORY % setup))
+        reports[name]['import_time'] = min(float(timing[0]) for timing in timings)
+        reports[name]['load_time'] = min(float(timing[1]) for timing in timings)
+    with tempfile.TemporaryDirectory() as directory:
+        write_literals(directory)
+        timings = [python(LITERALS_TIMING, directory).split() for _ in range(RUNS)]
+        report = reports['0.7 literals'] = json.loads(python(LITERALS_MEMORY, directory))
+        report['import_time'] = min(float(timing[0]) for timing in timings)
+        report['load_time'] = 0
+    names = list(reports)
+    print('%-34s' % '' + ''.join('%14s' % name for name in names))
+    rows = [('import time (us)', 'import_time'),
+            ('long, short, single load (us)', 'load_time'),
+            ('retained after import (kB)', 'imported'),
+            ('retained after charset codecs (kB)', 'charset'),
+            ('retained after encoding (kB)', 'encoded'),
+            ('retained with tables (kB)', 'loaded'),
+            ('encode peak (kB)', 'peak')]
+    for label, key in rows:
+        scale = 1 if key.endswith('_time') else 1e-3
+        print('%-34s' % label + ''.join('%14.1f' % (reports[name][key] * scale)
+                                        for name in names))
+    print('%-34s' % ('  for an input of %d chars' % reports[names[0]]['input']))
+    for table in reports[names[0]]['tables']:
+        print('%-34s' % ('%s (kB)' % table) + ''.join(
+            '%14.1f' % (reports[name]['tables'][table] / 1e3)
+            if table in reports[name]['tables'] else '%14s' % '-' for name in names))
+
+
+if __name__ == '__main__':
+    main()
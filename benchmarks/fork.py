@@ -0,0 +1,81 @@
+"""
+Measures the memory of forked workers that transliterate text, when the
+master process did not call translitcodec.prepare_for_fork(), called it
+with the default freeze=False, and called it with freeze=True.
+
+Linux only, the figures come from /proc/self/smaps_rollup.  Run from the
+repository root::
+
+    python benchmarks/fork.py
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import codecs
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import translitcodec  # noqa: E402
+
+
+WORKERS = 4
+TEXT = 'Zażółć gęślą jaźń, café № 5 ½ € ™ “quoted” ﬁ ☺ ' * 200
+FIELDS = ('Rss', 'Pss', 'Private_Dirty')
+
+
+def memory():
+    """Return the FIELDS of this process, in kB."""
+    values = {}
+    with open('/proc/self/smaps_rollup') as fh:
+        for line in fh:
+            name, _, value = line.partition(':')
+            if name in FIELDS:
+                values[name] = int(value.split()[0])
+    return [values[name] for name in FIELDS]
+
+
+def work():
+    for mode in ('long', 'short', 'one'):
+        codecs.encode(TEXT, 'translit/' + mode)
+        TEXT.encode('translit/%s/ascii' % mode, 'replace')
+        TEXT.encode('ascii', 'replace/translit/' + mode)
+
+
+def run(scenario):
+    """Fork the workers and print their average memory figures."""
+    if scenario != 'lazy':
+        translitcodec.prepare_for_fork(charsets=('ascii',), freeze=scenario == 'frozen')
+    readers = []
+    for _ in range(WORKERS):
+        read, write = os.pipe()
+        if os.fork() == 0:
+            os.close(read)
+            work()
+            os.write(write, ' '.join(map(str, memory())).encode('ascii'))
+            os._exit(0)
+        os.close(write)
+        readers.append(read)
+    results = []
+    for read in readers:
+        results.append([int(value) for value in os.read(read, 100).split()])
+        os.close(read)
+        os.wait()
+    print(' '.join(str(sum(column) // WORKERS) for column in zip(*results)))
+
+
+def main():
+    print('%-10s %9s %9s %19s' % ('master', 'RSS (kB)', 'PSS (kB)', 'private dirty (kB)'))
+    for scenario in ('lazy', 'prepared', 'frozen'):
+        output = subprocess.check_output([sys.executable, __file__, scenario],
+                                         universal_newlines=True)
+        print('%-10s %9s %9s %19s' % ((scenario,) + tuple(output.split())))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,72 @@
+"""
+Measures the cost of importing translitcodec, alone and followed by the
+first use of one codec, with ``python -X importtime``.
+
+Run from the repository root::
+
+    python benchmarks/import_time.py
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import compileall
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+SCENARIOS = [
+    ('import', ''),
+    ('translit/one', "'caf\\xe9 \\u20ac'.encode('translit/one/ascii')"),
+    ('translit/long', "'caf\\xe9 \\u20ac'.encode('translit/long/ascii')"),
+]
+
+RUNS = 20
+
+
+def measure(statement):
+    """Best of RUNS fresh interpreters, in microseconds: the time spent in
+    the translitcodec modules themselves and including their dependencies,
+    as reported by -X importtime, and the time until *statement* has run.
+
+    Table modules imported on first use go through importlib, which
+    -X importtime does not report, so only the last figure includes them.
+    """
+    code = ('import time\n'
+            'start = time.perf_counter()\n'
+            'import translitcodec\n'
+            '%s\n'
+            'print((time.perf_counter() - start) * 1e6)' % statement)
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    own, imports, first_use = [], [], []
+    for _ in range(RUNS):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True,
+            universal_newlines=True)
+        own_total = total = 0
+        for line in process.stderr.splitlines()[1:]:
+            self_us, cumulative, name = line.split('|')
+            if name.strip().split('.')[0] == 'translitcodec':
+                own_total += int(self_us.split(':')[1])
+                # Top level imports include the nested ones.
+                if not name.startswith('  '):
+                    total += int(cumulative)
+        own.append(own_total)
+        imports.append(total)
+        first_use.append(float(process.stdout))
+    return min(own), min(imports), min(first_use)
+
+
+def main():
+    compileall.compile_dir(os.path.join(ROOT, 'translitcodec'), quiet=1)
+    print('%-14s %10s %15s %15s' % (
+        'scenario', 'own (us)', 'with deps (us)', 'first use (us)'))
+    for name, statement in SCENARIOS:
+        print('%-14s %10d %15d %15d' % ((name,) + measure(statement)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Measures how translitcodec.parallel.transliterate_many() scales from one
+process to the number of CPUs.
+
+Run from the repository root::
+
+    python benchmarks/parallel.py
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from translitcodec.parallel import transliterate_many  # noqa: E402
+
+
+CORPUS = ['Zażółć gęślą jaźń, café № 5 ½ € ™ “quoted” %d' % i
+          for i in range(200000)]
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, 32, 64, cpus} & set(range(1, cpus + 1)))
+    print('%9s %10s %8s' % ('processes', 'time (s)', 'speedup'))
+    base = None
+    for processes in counts:
+        start = time.perf_counter()
+        transliterate_many(CORPUS, processes=processes)
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print('%9d %10.3f %7.2fx' % (processes, elapsed, base / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Measures how translitcodec.parallel.transliterate_file() scales from one
+process to the number of CPUs on one large UTF-8 file, against the
+sequential translitcodec.transliterate_file(), and checks that the
+outputs are identical.
+
+Run from the repository root::
+
+    python benchmarks/parallel_file.py
+    python benchmarks/parallel_file.py --size 1G --slice-size 64M
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import argparse
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import suite  # noqa: E402
+import translitcodec  # noqa: E402
+import translitcodec.parallel  # noqa: E402
+
+
+def write_input(path, size):
+    """Write *size* bytes of the mixed corpus, a megabyte at a time."""
+    sample = suite.sized(suite.generate_corpora()['mixed'], 1 << 20).encode('utf-8')
+    with open(path, 'wb') as fh:
+        written = 0
+        while written < size:
+            fh.write(sample[:size - written])
+            written += len(sample)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--size', default='256M', help='input size in bytes, with k, M or G')
+    parser.add_argument('--slice-size', default='16M',
+                        help='bytes per task, with k, M or G')
+    parser.add_argument('--mode', default='long', choices=('long', 'short', 'one'))
+    args = parser.parse_args(argv)
+    size = suite.parse_size(args.size)
+    slice_size = suite.parse_size(args.slice_size)
+
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, 32, 64, cpus} & set(range(1, cpus + 1)))
+    with tempfile.TemporaryDirectory() as directory:
+        src = os.path.join(directory, 'in.txt')
+        expected = os.path.join(directory, 'expected.txt')
+        dst = os.path.join(directory, 'out.txt')
+        write_input(src, size)
+
+        start = time.perf_counter()
+        translitcodec.transliterate_file(src, expected, args.mode)
+        sequential = time.perf_counter() - start
+        print('%-22s %10s %10s %8s' % ('', 'time (s)', 'MB/s', 'speedup'))
+        print('%-22s %10.3f %10.1f %7.2fx' % (
+            'sequential', sequential, size / sequential / 1e6, 1))
+        for processes in counts:
+            start = time.perf_counter()
+            translitcodec.parallel.transliterate_file(
+                src, dst, args.mode, processes=processes, slice_size=slice_size)
+            elapsed = time.perf_counter() - start
+            identical = filecmp.cmp(expected, dst, shallow=False)
+            print('%-22s %10.3f %10.1f %7.2fx%s' % (
+                '%d processes' % processes, elapsed, size / elapsed / 1e6,
+                sequential / elapsed, '' if identical else '  DIFFERENT OUTPUT'))
+
+
+if __name__ == '__main__':
+    main()
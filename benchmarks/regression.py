@@ -0,0 +1,128 @@
+"""
+Compares the speed of the encoders and error handlers against the
+committed baseline, benchmarks/baseline.json, and exits with status 1
+when a case got slower than the threshold allows.
+
+Each case is timed relative to a reference workload run alongside it,
+a plain ``str.translate`` with a dict, which makes the figures mostly
+independent of the machine and of its current load.  Run from the
+repository root::
+
+    python benchmarks/regression.py
+    python benchmarks/regression.py --threshold 0.1
+    python benchmarks/regression.py --update
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import suite  # noqa: E402
+import translitcodec  # noqa: E402
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def cases(corpora):
+    """Return the guarded calls, as (name, function, input)."""
+    result = []
+    for encoder in (translitcodec.long_encode, translitcodec.short_encode,
+                    translitcodec.single_encode):
+        for corpus in ('latin', 'mixed'):
+            result.append(('%s/%s' % (encoder.__name__, corpus), encoder,
+                           suite.sized(corpora[corpus], 100000)))
+    data = suite.sized(corpora['symbols'], 10000)
+    for kind in ('replace', 'ignore', 'strict'):
+        for mode in ('long', 'short', 'one'):
+            name = '%s/translit/%s' % (kind, mode)
+            result.append((name, lambda data, name=name: data.encode('ascii', name), data))
+    return result
+
+
+def reference(data, table={code: '-' for code in range(0x80, 0x3000)}):
+    return data.translate(table)
+
+
+def run(repeat, min_time, warmup):
+    """Time every case against the reference, in interleaved rounds.
+
+    Returns the median ratio of each case to the reference, and the
+    median absolute deviation of the ratios relative to that median.
+    """
+    corpora = suite.generate_corpora()
+    results = {}
+    for name, func, data in cases(corpora):
+        ratios = []
+        for _ in range(repeat):
+            case_time = min(suite.measure(func, data, repeat=1, min_time=min_time,
+                                          warmup=warmup))
+            reference_time = min(suite.measure(reference, data, repeat=1,
+                                               min_time=min_time, warmup=warmup))
+            ratios.append(case_time / reference_time)
+        median = statistics.median(ratios)
+        deviation = statistics.median(abs(ratio - median) for ratio in ratios)
+        results[name] = {'ratio': median, 'spread': deviation / median}
+    return results
+
+
+def compare(baseline, results, threshold):
+    """Print the comparison, returning the names of the slower cases."""
+    slower = []
+    print('%-28s %10s %10s %8s %7s' % ('case', 'baseline', 'current', 'change', 'spread'))
+    for name, result in results.items():
+        if name not in baseline:
+            print('%-28s %10s %10.3f %8s %6.1f%%' % (
+                name, '-', result['ratio'], 'new', result['spread'] * 100))
+            continue
+        change = result['ratio'] / baseline[name]['ratio'] - 1
+        status = ''
+        if change > threshold:
+            slower.append(name)
+            status = '  SLOWER'
+        print('%-28s %10.3f %10.3f %+7.1f%% %6.1f%%%s' % (
+            name, baseline[name]['ratio'], result['ratio'], change * 100,
+            result['spread'] * 100, status))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='largest accepted slowdown, 0.25 for 25%%')
+    parser.add_argument('--repeat', type=int, default=7,
+                        help='rounds per case, the median is kept')
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='seconds each timing lasts at least')
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--update', action='store_true',
+                        help='write the results to the baseline instead')
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat, args.min_time, args.warmup)
+    if args.update:
+        with open(args.baseline, 'w') as fh:
+            json.dump({'environment': suite.environment(), 'cases': results},
+                      fh, indent=1, sort_keys=True)
+            fh.write('\n')
+        print('Wrote %s.' % args.baseline)
+        return 0
+    with open(args.baseline) as fh:
+        baseline = json.load(fh)['cases']
+    slower = compare(baseline, results, args.threshold)
+    if slower:
+        print('%d of %d cases are more than %d%% slower than the baseline.' % (
+            len(slower), len(results), args.threshold * 100))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Measures the latency and throughput of every codec name and error
+handler on generated multilingual corpora, and writes the results as
+JSON for comparison between commits.
+
+The corpora are generated from the characters of
+transtab/transtab.repertoire with a fixed seed, so runs are comparable.
+Run from the repository root::
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --corpora latin,cjk --cases 'translit/long*' \\
+        --sizes 10,1k,1M,100M
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+"""
+import argparse
+import codecs
+import fnmatch
+import json
+import os
+import platform
+import random
+import statistics
+import string
+import subprocess
+import sys
+import time
+import unicodedata
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+
+import translitcodec  # noqa: E402
+
+
+REPERTOIRE = os.path.join(ROOT, 'transtab', 'transtab.repertoire')
+SAMPLE_SIZE = 1 << 16
+SIZES = ['10', '1k', '100k', '1M']
+UNITS = {'': 1, 'k': 10 ** 3, 'M': 10 ** 6, 'G': 10 ** 9}
+
+
+def read_repertoire(path=REPERTOIRE):
+    """Return the letters and the other characters of the repertoire.
+
+    Characters with a replacement that is not ASCII, like U+00B5 MICRO
+    SIGN to GREEK SMALL LETTER MU in the long table, are left out, as
+    the error handlers can not encode them to ASCII.
+    """
+    tables = (translitcodec.long_table, translitcodec.short_table,
+              translitcodec.single_table)
+    letters, symbols = [], []
+    with open(path, encoding='utf-8') as fh:
+        for line in fh:
+            if line.startswith('U+'):
+                char = chr(int(line.split()[0][2:], 16))
+                normalized = unicodedata.normalize('NFKC', char)
+                if not all(normalized.translate(table).isascii() for table in tables):
+                    continue
+                if unicodedata.category(char).startswith('L'):
+                    letters.append(char)
+                elif not char.isspace():
+                    symbols.append(char)
+    return letters, symbols
+
+
+def _words(rng, count, letter, separator=' '):
+    """Generate *count* words whose letters are drawn by *letter*."""
+    words = (''.join(letter() for _ in range(rng.randint(2, 9))) for _ in range(count))
+    return separator.join(words)
+
+
+def generate_corpora(seed=0):
+    """Return samples of SAMPLE_SIZE characters of each corpus, by name."""
+    rng = random.Random(seed)
+    letters, symbols = read_repertoire()
+    ascii_letters = string.ascii_letters
+    cjk = [chr(code) for code in range(0x4e00, 0x9fa6)]
+
+    def pick(*choices):
+        """Draw from the character lists of *choices*, (weight, list) pairs."""
+        weights = [weight for weight, _ in choices]
+        pools = [pool for _, pool in choices]
+        return lambda: rng.choice(rng.choices(pools, weights)[0])
+
+    generators = {
+        'ascii': pick((98, ascii_letters), (1, letters), (1, symbols)),
+        'latin': pick((75, ascii_letters), (25, letters)),
+        'symbols': pick((50, ascii_letters), (50, symbols)),
+        'cjk': pick((90, cjk), (5, symbols), (5, ascii_letters)),
+    }
+    corpora = {}
+    for name, letter in generators.items():
+        separator = '' if name == 'cjk' else ' '
+        text = ''
+        while len(text) < SAMPLE_SIZE:
+            text += _words(rng, 12, letter, separator) + '. \n'
+        corpora[name] = text[:SAMPLE_SIZE]
+    # Sentences of every other corpus in turn.
+    lines = [corpus.split('\n') for corpus in corpora.values()]
+    mixed = '\n'.join(line for group in zip(*lines) for line in group)
+    corpora['mixed'] = mixed[:SAMPLE_SIZE]
+    return corpora
+
+
+def sized(sample, size):
+    """Repeat *sample* up to *size* bytes of UTF-8."""
+    data = sample.encode('utf-8')
+    data = data * (size // len(data) + 1)
+    return data[:size].decode('utf-8', 'ignore')
+
+
+def parse_size(text):
+    unit = text[-1] if text[-1] in UNITS else ''
+    return int(float(text[:len(text) - len(unit)]) * UNITS[unit])
+
+
+def cases():
+    """Return the benchmarked calls, as (name, function of the input)."""
+    result = []
+    for mode in ('long', 'short', 'one'):
+        name = 'translit/' + mode
+        result.append((name, lambda data, name=name: codecs.encode(data, name)))
+    for mode in ('long', 'short', 'one'):
+        name = 'translit/%s/ascii' % mode
+        result.append((name, lambda data, name=name: data.encode(name, 'replace')))
+    for kind in ('replace', 'ignore', 'strict'):
+        for mode in ('long', 'short', 'one'):
+            name = '%s/translit/%s' % (kind, mode)
+            result.append((name, lambda data, name=name: data.encode('ascii', name)))
+    return result
+
+
+def measure(func, data, repeat=5, min_time=0.1, warmup=1):
+    """Time ``func(data)``, running it enough times per repeat to last
+    *min_time*.  Returns the seconds per call of each repeat."""
+    for _ in range(warmup):
+        func(data)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(data)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(data)
+        timings.append((time.perf_counter() - start) / number)
+    return timings
+
+
+def summarize(timings, size):
+    timings = sorted(timings)
+    median = statistics.median(timings)
+    return {
+        'latency': {
+            'min': timings[0],
+            'median': median,
+            'max': timings[-1],
+        },
+        'throughput': size / median if median else None,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=ROOT, stderr=subprocess.DEVNULL,
+            universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    return {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'translitcodec': translitcodec.__version__,
+    }
+
+
+def run(corpora, patterns, sizes, repeat, min_time, log=None):
+    """Run the selected cases, returning one result per corpus, size and case."""
+    results = []
+    for corpus, sample in corpora.items():
+        for size in sizes:
+            data = sized(sample, size)
+            for name, func in cases():
+                if not any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+                    continue
+                result = {'corpus': corpus, 'size': size, 'case': name}
+                try:
+                    func(data)
+                except UnicodeError as exc:
+                    result['error'] = type(exc).__name__
+                else:
+                    result.update(summarize(measure(func, data, repeat, min_time), size))
+                results.append(result)
+                if log is not None:
+                    log(result)
+    return results
+
+
+def _print(result):
+    if 'error' in result:
+        figures = result['error']
+    else:
+        figures = '%12.3f us %10.2f MB/s' % (result['latency']['median'] * 1e6,
+                                          result['throughput'] / 1e6)
+    print('%-8s %10d %-22s %s' % (result['corpus'], result['size'], result['case'], figures),
+          file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--corpora', default='ascii,latin,symbols,cjk,mixed',
+                        help='comma separated corpus names')
+    parser.add_argument('--cases', default='*',
+                        help='comma separated glob patterns of case names')
+    parser.add_argument('--sizes', default=','.join(SIZES),
+                        help='comma separated input sizes in bytes, with k, M or G')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help='seconds each repeat lasts at least')
+    parser.add_argument('--output', help='JSON file to write, standard output by default')
+    args = parser.parse_args(argv)
+
+    samples = generate_corpora()
+    corpora = {name: samples[name] for name in args.corpora.split(',')}
+    sizes = [parse_size(size) for size in args.sizes.split(',')]
+    results = run(corpora, args.cases.split(','), sizes, args.repeat, args.min_time,
+                  log=_print)
+    report = {'environment': environment(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(report, fh, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+
+
+if __name__ == '__main__':
+    main()
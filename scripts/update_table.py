@@ -1,20 +1,31 @@
 """
-Updates translitcodec/__init__.py with translation table information
-built from the 'transtab' database.
+Writes the translitcodec.tables modules with translation table
+information built from the 'transtab' database.
 
 :copyright: the translitcodec authors and developers, see AUTHORS.
 :license: MIT, see LICENSE for more details.
 """
+import contextlib
 import csv
+import io
+import itertools
 import os
+import struct
 import sys
+import unicodedata
 
 
 csv.register_dialect('transtab', delimiter=';')
 
+# Local corrections to the transtab data, as (long, short, single).
+overrides = {
+    # LATIN SMALL LETTER SHARP S, transtab's short form is a Greek beta.
+    0xdf: ('ss', 'ss', 's'),
+}
+
 
 def read_table(path='transtab/transtab'):
-    long, short, single = {}, {}, {}
+    long, short, single, alternatives = {}, {}, {}, {}
 
     with open(path) as fh:
         for line in fh.readlines():
@@ -36,7 +47,14 @@ def read_table(path='transtab/transtab'):
             short[from_ord] = short_char
             if len(short_char) == 1:
                 single[from_ord] = short_char
-    return long, short, single
+            if len(raw) > 1:
+                alternatives[from_ord] = tuple(_unpack_uchrs(alt) for alt in raw)
+
+    for from_ord, (long_char, short_char, single_char) in overrides.items():
+        long[from_ord] = long_char
+        short[from_ord] = short_char
+        single[from_ord] = single_char
+    return long, short, single, alternatives
 
 
 def _unpack_uchrs(packed):
@@ -44,25 +62,128 @@ def _unpack_uchrs(packed):
     return ''.join(chr(int(spec[:-1], 16)) for spec in chunks)
 
 
-def update_inclusion(long, short, single, path="translitcodec/__init__.py"):
-    with open(path, 'r') as fh:
-        preamble, old, postamble = [], [], []
-        bucket = preamble
-        for line in fh.readlines():
-            if line.startswith('### <'):
-                bucket = postamble
-            bucket.append(line)
-            if line.startswith('### >'):
-                bucket = old
-
-    with open(path, 'w') as fh:
-        fh.writelines(preamble)
-        fh.write("\n")
-        _dump_dict(fh, 'long_table', long)
-        _dump_dict(fh, 'short_table', short)
-        _dump_dict(fh, 'single_table', single)
-        fh.write("\n")
-        fh.writelines(postamble)
+def composition_seconds():
+    """Characters that can combine with a preceding character under NFC."""
+    seconds = set()
+    for code in range(sys.maxunicode + 1):
+        decomposition = unicodedata.decomposition(chr(code)).split()
+        if len(decomposition) == 2 and not decomposition[0].startswith('<'):
+            seconds.add(chr(int(decomposition[1], 16)))
+    # Hangul syllables compose algorithmically from conjoining jamo:
+    # leading consonants take a vowel, and LV syllables a trailing one.
+    seconds.update(chr(code) for code in range(0x1161, 0x1176))
+    seconds.update(chr(code) for code in range(0x11a8, 0x11c3))
+    return seconds
+
+
+def read_nfkc(seconds):
+    """Per-character NFKC data for the Basic Multilingual Plane.
+
+    Returns the ranges of code points whose NFKC form differs from
+    themselves, and the ranges of code points that may interact with
+    their neighbours during normalization (combining marks, characters
+    that compose with a preceding one, and code points unassigned in this
+    Unicode version).  Strings free of the latter normalize one character
+    at a time, so the first can be folded into the transliteration
+    tables.
+    """
+    nfkc, sensitive = [], []
+    for code in range(0x10000):
+        char = chr(code)
+        head = unicodedata.normalize('NFKD', char)[0]
+        if (unicodedata.category(char) == 'Cn' or
+                unicodedata.combining(char) or unicodedata.combining(head) or
+                char in seconds or head in seconds):
+            _extend_ranges(sensitive, code)
+        elif unicodedata.normalize('NFKC', char) != char:
+            _extend_ranges(nfkc, code)
+    return [tuple(pair) for pair in nfkc], [tuple(pair) for pair in sensitive]
+
+
+def _extend_ranges(ranges, code):
+    if ranges and ranges[-1][1] == code - 1:
+        ranges[-1][1] = code
+    else:
+        ranges.append([code, code])
+
+
+def compact(long, short, single):
+    """Range encode the three tables over one pool of replacement strings.
+
+    Returns the sorted replacements, and runs of consecutive code points
+    with the same replacements as (first, last, long, short, single),
+    the last three being indexes in the replacements, or -1 for none.
+    """
+    values = sorted(set(long.values()) | set(short.values()) | set(single.values()))
+    index = {value: i for i, value in enumerate(values)}
+    runs = []
+    for code in sorted(set(long) | set(short) | set(single)):
+        row = tuple(index[table[code]] if code in table else -1
+                    for table in (long, short, single))
+        if runs and runs[-1][1] == code - 1 and runs[-1][2:] == row:
+            runs[-1][1] = code
+        else:
+            runs.append([code, code] + list(row))
+    return values, [tuple(run) for run in runs]
+
+
+def write_tables(long, short, single, alternatives,
+                 directory='translitcodec/tables'):
+    values, runs = compact(long, short, single)
+    with _module(directory, 'transtab') as fh:
+        fh.write("from array import array\n\n")
+        _dump_values(fh, values)
+        _dump_runs(fh, runs)
+    write_binary(values, runs, os.path.join(directory, 'transtab.bin'))
+    with _module(directory, 'alternatives') as fh:
+        _dump_dict(fh, 'alternatives_table', alternatives)
+    nfkc, sensitive = read_nfkc(composition_seconds())
+    with _module(directory, 'nfkc') as fh:
+        fh.write("from array import array\n\n")
+        fh.write("# Ranges of code points, as their first and last code point.\n")
+        _dump_ranges(fh, 'nfkc_codes', nfkc)
+        _dump_ranges(fh, 'nfkc_sensitive', sensitive)
+
+
+def write_binary(values, runs, path):
+    """Write the runs and replacements in the format translitcodec maps
+    into memory, see translitcodec/tables/__init__.py."""
+    pool = [value.encode('utf-8') for value in values]
+    offsets = [0]
+    for value in pool:
+        offsets.append(offsets[-1] + len(value))
+    with open(path, 'wb') as fh:
+        fh.write(struct.pack('<4sIII', b'TLTB', 1, len(runs), len(values)))
+        fh.write(struct.pack('<%di' % (len(runs) * 5), *itertools.chain(*runs)))
+        fh.write(struct.pack('<%dI' % len(offsets), *offsets))
+        fh.write(b''.join(pool))
+
+
+@contextlib.contextmanager
+def _module(directory, name):
+    fh = io.StringIO()
+    fh.write('"""Generated by scripts/update_table.py; do not edit."""\n\n')
+    yield fh
+    with open(os.path.join(directory, name + '.py'), 'w') as out:
+        out.write(fh.getvalue().rstrip('\n') + '\n')
+
+
+def _dump_values(fh, values):
+    fh.write("# Replacements shared by the long, short and single tables.\n")
+    fh.write("values = (\n")
+    for value in values:
+        fh.write("  %r,\n" % value)
+    fh.write(")\n\n")
+
+
+def _dump_runs(fh, runs):
+    fh.write("# Runs of code points with the same replacements, as five integers:\n"
+             "# the first and last code point, and the indexes in values of their\n"
+             "# long, short and single replacement, or -1 for none.\n")
+    fh.write("runs = array('i', (\n")
+    for run in runs:
+        fh.write("  %d, %d, %d, %d, %d,\n" % run)
+    fh.write("))\n\n")
 
 
 def _dump_dict(fh, name, data):
@@ -71,10 +192,17 @@ def _dump_dict(fh, name, data):
         fh.write("  %r: %r,\n" % pair)
     fh.write("}\n\n")
 
+
+def _dump_ranges(fh, name, data):
+    fh.write("%s = array('i', (\n" % name)
+    for pair in data:
+        fh.write("  %d, %d,\n" % pair)
+    fh.write("))\n\n")
+
 if __name__ == '__main__':
     if not (os.path.exists('translitcodec') and os.path.exists('transtab')):
         print("Can not find translitcodec/ and transtab/ directories.")
         sys.exit(-1)
     tables = read_table()
-    update_inclusion(*tables)
+    write_tables(*tables)
     print("Updated.")
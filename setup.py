@@ -18,9 +18,13 @@ setup(name='translitcodec',
       author='Jason Kirtland',
       author_email='jek@discorporate.us',
       url='https://github.com/claudep/translitcodec',
-      packages=['translitcodec'],
+      packages=['translitcodec', 'translitcodec.tables'],
+      package_data={'translitcodec.tables': ['transtab.bin']},
+      entry_points={
+          'console_scripts': ['translitcodec = translitcodec.__main__:main'],
+          },
       license='MIT License',
-      python_requires='>=3',
+      python_requires='>=3.7',
       classifiers=[
           'Development Status :: 5 - Production/Stable',
           'Intended Audience :: Developers',
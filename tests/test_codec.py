@@ -5,8 +5,19 @@
 
 """
 import codecs
+import contextlib
+import gc
+import io
+import lzma
+import os
+import subprocess
+import sys
+import tempfile
 import translitcodec
-from unittest import TestCase
+import translitcodec.__main__
+import translitcodec.parallel
+import unicodedata
+from unittest import TestCase, mock
 
 
 class CodecTests(TestCase):
@@ -39,6 +50,32 @@ class CodecTests(TestCase):
 
         assert codecs.encode(self.data, 'translit/one/ascii', 'replace') == b'? ? woof meaw'
 
+    def test_translit_one_single_byte(self):
+        assert self.data.encode('translit/one/latin-1', 'replace') == b'\xa3 ? w\xf8\xf3f m\xe9\xe5w'
+        assert self.data.encode('translit/one/cp1252', 'ignore') == b'\xa3  w\xf8\xf3f m\xe9\xe5w'
+        assert 'ﬁ €'.encode('translit/one/cp1252') == b'fi \x80'
+
+    def test_translit_long_single_byte(self):
+        assert 'Zażółć ¼ €'.encode('translit/long/cp1252') == b'Zaz\xf3lc \xbc \x80'
+        assert 'Zażółć ¼ €'.encode('translit/long/iso-8859-2') == b'Za\xbf\xf3\xb3\xe6 1/4 EUR'
+
+    def test_single_byte_error_after_blocks(self):
+        data = 'Za\u017c\u00f3\u0142\u0107 ' * 300 + '\u53e6 \u20ac'
+        assert data.encode('translit/long/ascii', 'replace') == b'Zazolc ' * 300 + b'? EUR'
+        with self.assertRaises(UnicodeEncodeError) as raised:
+            data.encode('translit/long/ascii')
+        assert raised.exception.object is data
+        assert raised.exception.start == 2100
+
+    def test_translit_single_byte_alternatives(self):
+        # MICRO SIGN is transliterated to a GREEK SMALL LETTER MU, or to u.
+        assert 'µ'.encode('translit/long/latin-1') == b'\xb5'
+        assert 'µ'.encode('translit/long/iso-8859-7') == b'\xec'
+        assert 'µ'.encode('translit/long/ascii') == b'u'
+
+    def test_hyphenated_byte_encoding(self):
+        assert 'wøóf ☹'.encode('translit/short/iso-8859-1') == b'w\xf8\xf3f :-('
+
     def test_ascii_level_characters_remain(self):
         assert codecs.encode("'", 'translit/long') == "'"
 
@@ -50,6 +87,543 @@ class CodecTests(TestCase):
             assert False
 
 
+class TablesTests(TestCase):
+    def test_tables_are_imported_on_first_use(self):
+        code = ('import codecs, sys, translitcodec\n'
+                'print(sorted(m for m in sys.modules if m.startswith("translitcodec.tables.")))\n'
+                'codecs.encode("caf\\xe9", "translit/one")\n'
+                '"\\u53e6".encode("ascii", "replace/translit/one")\n'
+                'print(sorted(m for m in sys.modules if m.startswith("translitcodec.tables.")))\n'
+                'print(sorted(n for n in translitcodec._table_modules if n in vars(translitcodec)))\n')
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], universal_newlines=True,
+            cwd=os.path.join(os.path.dirname(__file__), os.pardir))
+        # The encoders and error handlers only keep the translation tables.
+        assert output.splitlines() == [
+            '[]', "['translitcodec.tables.nfkc']", "['nfkc_codes', 'nfkc_sensitive']"]
+
+    def test_charset_codecs_and_handlers_build_no_tables(self):
+        code = ('import codecs, translitcodec\n'
+                'print("Za\\u017c\\xf3\\u0142\\u0107 \\u20ac".encode("translit/long/ascii"))\n'
+                'print("\\u20ac\\ufb01\\u53e6".encode("ascii", "replace/translit/short"))\n'
+                'print(translitcodec._translation_table.cache_info().currsize)\n'
+                'print(sorted(n for n in translitcodec._table_modules if n in vars(translitcodec)))\n')
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], universal_newlines=True,
+            cwd=os.path.join(os.path.dirname(__file__), os.pardir))
+        # They look the replacements up in the runs of the transtab data.
+        assert output.splitlines() == [
+            "b'Zazolc EUR'", "b'Efi?'", '0', "['alternatives_table', 'nfkc_sensitive']"]
+
+    def test_lookup(self):
+        for mode, name in translitcodec._mode_tables.items():
+            table = translitcodec._build(name)
+            # Look up in the runs, even if the table was loaded.
+            with mock.patch.dict(vars(translitcodec)):
+                vars(translitcodec).pop(name, None)
+                for code in range(0x10000):
+                    assert translitcodec._lookup(mode, code) == table.get(code), hex(code)
+
+    def test_module_attributes(self):
+        assert translitcodec.long_table is translitcodec._load('long_table')
+        with self.assertRaises(AttributeError):
+            translitcodec.medium_table
+
+    def test_binary_tables(self):
+        from translitcodec.tables import map_transtab, transtab
+        runs, values = map_transtab()
+        assert runs.readonly
+        assert list(runs) == list(transtab.runs)
+        assert values == list(transtab.values)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'transtab.bin')
+            assert map_transtab(path) is None
+            with open(path, 'wb') as fh:
+                fh.write(b'TLTB\x02\x00\x00\x00')
+            assert map_transtab(path) is None
+
+    def test_prepare_for_fork(self):
+        translitcodec.clear_caches()
+        freeze_count = gc.get_freeze_count() if hasattr(gc, 'freeze') else 0
+        translitcodec.prepare_for_fork(charsets=('cp1252',))
+        assert translitcodec._translation_table.cache_info().currsize == 3
+        assert translitcodec._encoding_map.cache_info().currsize == 3
+        if hasattr(gc, 'freeze'):
+            assert gc.get_freeze_count() == freeze_count
+            try:
+                translitcodec.prepare_for_fork(freeze=True)
+                assert gc.get_freeze_count() > 0
+            finally:
+                gc.unfreeze()
+
+    def test_shared_replacements(self):
+        from translitcodec.tables import transtab
+        assert len(transtab.values) == len(set(transtab.values))
+        tables = (translitcodec.long_table, translitcodec.short_table,
+                  translitcodec.single_table)
+        for code in range(0x2500, 0x254c):
+            assert tables[0][code] is tables[1][code] is tables[2][code]
+
+
+class FastPathTests(TestCase):
+    def test_ascii_input_is_returned_unchanged(self):
+        data = 'plain ascii text'
+        for encoder in (translitcodec.long_encode,
+                        translitcodec.short_encode,
+                        translitcodec.single_encode):
+            output, length = encoder(data)
+            assert output is data
+            assert length == len(data)
+
+    def test_ascii_blocks_in_long_input(self):
+        data = 'a' * 3000 + 'wöóf ☹' + 'b' * 3000 + '£'
+        for encoder, table in ((translitcodec.long_encode, translitcodec.long_table),
+                               (translitcodec.short_encode, translitcodec.short_table),
+                               (translitcodec.single_encode, translitcodec.single_table)):
+            expected = unicodedata.normalize('NFKC', data).translate(table)
+            assert encoder(data)[0] == expected
+
+
+class NormalizationTests(TestCase):
+    modes = ((translitcodec.long_encode, translitcodec.long_table),
+             (translitcodec.short_encode, translitcodec.short_table),
+             (translitcodec.single_encode, translitcodec.single_table))
+
+    def test_matches_normalized_translation(self):
+        data = ('caf\u00e9 cafe\u0301 \ufb01n \u00bd\u2026\u00a0\uff21 wo\u0308\u0301f '
+                '\u326d\u3160 \u1112\u1161')
+        for encoder, table in self.modes:
+            expected = unicodedata.normalize('NFKC', data).translate(table)
+            assert encoder(data)[0] == expected
+
+    def test_every_table_character(self):
+        for encoder, table in self.modes:
+            for code in table:
+                data = 'a%s\u0301 %s' % (chr(code), chr(code))
+                expected = unicodedata.normalize('NFKC', data).translate(table)
+                assert encoder(data)[0] == expected, hex(code)
+
+    def test_normalization_table(self):
+        data = ''.join(chr(code) for first, last in translitcodec._ranges(translitcodec.nfkc_codes)
+                       for code in range(first, last + 1))
+        for encoder, table in self.modes:
+            expected = unicodedata.normalize('NFKC', data).translate(table)
+            assert encoder(data)[0] == expected
+
+    def test_assume_normalized(self):
+        data = 'cafe\u0301 \ufb01'
+        output, length = translitcodec.long_encode(data, assume_normalized=True)
+        assert output == data.translate(translitcodec.long_table)
+        assert length == len(data)
+
+
+class IncrementalTests(TestCase):
+    data = 'Za\u017co\u0301\u0142c\u0301 cafe\u0301 wo\u0308\u0301f \ufb01 \u326d\u3160 \u1112\u1161\u11a8 \u20ac\n'
+    codecs = ('transliterate', 'translit/long', 'translit/one/ascii',
+              'translit/short/iso-8859-2', 'translit/long/utf-16')
+
+    def _chunks(self, size):
+        return [self.data[i:i + size] for i in range(0, len(self.data), size)]
+
+    def _words(self):
+        # Nothing combines across a space.
+        return [word + ' ' for word in self.data.split(' ')[:-1]] + [self.data.split(' ')[-1]]
+
+    def test_iterencode(self):
+        for name in self.codecs:
+            expected = codecs.encode(self.data, name, 'replace')
+            output = list(codecs.iterencode(self._words(), name, 'replace'))
+            assert output[0][:0].join(output) == expected, name
+
+    def test_combining_chunk_start(self):
+        data = 'Ha\u0308ndel A\u030angstro\u0308m cafe\u0301 Zo\u0301\u0142w'
+        for name in ('translit/long', 'translit/short', 'translit/one', 'translit/long/ascii',
+                     'translit/short/ascii', 'translit/one/ascii', 'translit/long/utf-16'):
+            expected = codecs.encode(data, name)
+            for split in range(1, len(data)):
+                output = list(codecs.iterencode([data[:split], data[split:]], name))
+                assert output[0][:0].join(output) == expected, (name, split)
+        assert list(codecs.iterencode(['A', '\u030a'], 'translit/long')) == ['A', 'a']
+
+    def test_composed_in_charset(self):
+        output = codecs.iterencode(['A', '\u0301x'], 'translit/long/latin-1')
+        assert b''.join(output) == b'Ax'
+
+    def test_encodes_every_chunk(self):
+        encoder = codecs.getincrementalencoder('translit/long/ascii')()
+        assert encoder.encode('caf\u00e9') == b'cafe'
+        assert encoder.encode('\u20ac') == b'EUR'
+        assert encoder.encode('', final=True) == b''
+
+    def test_stream_writer(self):
+        stream = io.BytesIO()
+        writer = codecs.getwriter('translit/long/iso-8859-2')(stream, 'replace')
+        for chunk in self._words():
+            writer.write(chunk)
+        writer.reset()
+        assert stream.getvalue() == codecs.encode(self.data, 'translit/long/iso-8859-2', 'replace')
+
+    def test_text_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'out.txt')
+            with open(path, 'w', encoding='translit/long/ascii', errors='replace',
+                      newline='') as f:
+                for chunk in self._words():
+                    f.write(chunk)
+            with open(path, 'rb') as f:
+                assert f.read() == codecs.encode(self.data, 'translit/long/ascii', 'replace')
+
+    def test_text_file_combining_chunk_start(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'out.txt')
+            with open(path, 'w', encoding='translit/long/ascii') as f:
+                f.write('Ha')
+                f.write('\u0308ndel\n')
+            with open(path, 'rb') as f:
+                assert f.read() == b'Haendel\n'
+
+    def test_no_trailing_newline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'out.txt')
+            with open(path, 'w', encoding='translit/long/ascii') as f:
+                f.write('caf\u00e9')
+            with open(path, 'rb') as f:
+                assert f.read() == b'cafe'
+            with open(path, 'wb') as f:
+                with codecs.getwriter('translit/long/ascii')(f) as writer:
+                    writer.write('caf\u00e9')
+            with open(path, 'rb') as f:
+                assert f.read() == b'cafe'
+        stream = io.BytesIO()
+        writer = codecs.getwriter('translit/long/utf-16')(stream)
+        writer.write('caf\u00e9')
+        writer.flush()
+        assert stream.getvalue() == 'cafe'.encode('utf-16')
+
+
+class CountersTests(TestCase):
+    def tearDown(self):
+        translitcodec.disable_counters()
+
+    def test_disabled(self):
+        codecs.encode('caf\u00e9', 'translit/long')
+        assert translitcodec.counters() == {}
+
+    def test_hits_and_misses(self):
+        translitcodec.enable_counters()
+        codecs.encode('caf\u00e9 \u263a \u263a \u53e6 \ufb01', 'translit/one')
+        '\u00e4 \u20ac'.encode('translit/long/latin-1')
+        '\u53e6'.encode('ascii', 'replace/translit/long')
+        counts = translitcodec.counters()
+        assert counts['one'] == {'hits': {0xe9: 1, 0xfb01: 1},
+                                 'misses': {0x263a: 2, 0x53e6: 1}}
+        assert counts['long'] == {'hits': {0x20ac: 1}, 'misses': {0x53e6: 1}}
+        assert counts['short'] == {'hits': {}, 'misses': {}}
+        translitcodec.reset_counters()
+        assert translitcodec.counters()['one'] == {'hits': {}, 'misses': {}}
+
+    def test_every(self):
+        translitcodec.enable_counters(every=3)
+        for _ in range(7):
+            codecs.encode('\u00e9', 'translit/short')
+        assert translitcodec.counters()['short']['hits'] == {0xe9: 2}
+
+
+class PhasesTests(TestCase):
+    def test_phases(self):
+        with translitcodec.record_phases() as records:
+            codecs.encode('cafe\u0301 \ufb01', 'translit/long')
+            '\u00e4 \u20ac'.encode('translit/long/latin-1')
+            '\u00e9'.encode('translit/short/utf-8')
+            '\u53e6\u00e9'.encode('ascii', 'replace/translit/long')
+        assert [record[:2] + record[3:] for record in records] == [
+            ('translit/long', 'normalize', 7),
+            ('translit/long', 'translate', 7),
+            ('translit/long/latin_1', 'encode', 5),
+            ('translit/short', 'translate', 1),
+            ('utf_8', 'encode', 1),
+            ('ascii', 'error_handler', 2),
+        ]
+        assert all(record[2] >= 0 for record in records)
+        assert translitcodec._phase_hooks == []
+
+    def test_hook(self):
+        calls = []
+
+        def hook(*args):
+            calls.append(args[:2])
+        translitcodec.add_phase_hook(hook)
+        try:
+            codecs.encode('\u00e9', 'translit/one')
+        finally:
+            translitcodec.remove_phase_hook(hook)
+        codecs.encode('\u00e9', 'translit/one')
+        assert calls == [('translit/one', 'translate')]
+
+
+class UnmappedTests(TestCase):
+    def tearDown(self):
+        translitcodec.disable_unmapped_sampling()
+
+    def test_disabled(self):
+        codecs.encode('\u263a', 'translit/one')
+        assert translitcodec.unmapped_summary() == {}
+
+    def test_callback(self):
+        calls = []
+        translitcodec.enable_unmapped_sampling(lambda *args: calls.append(args), context=3)
+        codecs.encode('caf\u00e9 \u263a x \u263a', 'translit/one')
+        '\u00e4 \u20ac \u53e6'.encode('translit/long/latin-1', 'replace')
+        'ab\u53e6\u00e9'.encode('ascii', 'replace/translit/long')
+        assert calls == [
+            ('translit/one', '\u263a', 5, 'f\u00e9 \u263a x '),
+            ('translit/one', '\u263a', 9, ' x \u263a'),
+            ('translit/long/latin_1', '\u53e6', 4, ' \u20ac \u53e6'),
+            ('ascii', '\u53e6', 2, 'ab\u53e6\u00e9'),
+        ]
+        assert translitcodec.unmapped_summary() == {
+            'top': [(0x263a, 2), (0x53e6, 2)], 'total': 4, 'reported': 4, 'dropped': 0}
+
+    def test_rate_limit(self):
+        calls = []
+        translitcodec.enable_unmapped_sampling(lambda *args: calls.append(args), per_second=2)
+        codecs.encode('\u263a' * 5, 'translit/one')
+        assert len(calls) == 2
+        summary = translitcodec.unmapped_summary()
+        assert summary['total'] == 5
+        assert summary['dropped'] == 3
+
+    def test_every(self):
+        translitcodec.enable_unmapped_sampling(every=3)
+        for _ in range(7):
+            codecs.encode('\u263a', 'translit/one')
+        assert translitcodec.unmapped_summary()['top'] == [(0x263a, 2)]
+
+    def test_bounded(self):
+        translitcodec.enable_unmapped_sampling(top=3)
+        data = ''.join(chr(code) for code in range(0x4e00, 0x5e00)) + '\u263a' * 50
+        codecs.encode(data, 'translit/one')
+        summary = translitcodec.unmapped_summary()
+        assert summary['total'] == 0x1000 + 50
+        assert len(summary['top']) == 3
+        assert summary['top'][0][0] == 0x263a
+        assert summary['top'][0][1] >= 50
+
+
+class BatchTests(TestCase):
+    values = ['M\u00fcller', '\u0141\u00f3d\u017a', 'cafe', '\u0301x', 'M\u00fcller', '',
+              '\ufb01', '\u1112', '\u1161', '\u263a', 'cafe']
+
+    def test_matches_encoders(self):
+        for mode, encoder in (('long', translitcodec.long_encode),
+                              ('short', translitcodec.short_encode),
+                              ('one', translitcodec.single_encode)):
+            expected = [encoder(value)[0] for value in self.values]
+            assert translitcodec.transliterate_batch(self.values, mode) == expected
+            assert translitcodec.transliterate_batch(iter(self.values), mode) == expected
+
+    def test_values_with_separator(self):
+        values = self.values + ['a\x00\u00e9']
+        expected = [translitcodec.long_encode(value)[0] for value in values]
+        assert translitcodec.transliterate_batch(values) == expected
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            translitcodec.transliterate_batch(self.values, 'medium')
+
+
+class FileTests(TestCase):
+    data = IncrementalTests.data * 50
+
+    def test_paths(self):
+        with tempfile.TemporaryDirectory() as directory:
+            src = os.path.join(directory, 'in.txt')
+            dst = os.path.join(directory, 'out.txt')
+            with open(src, 'w', encoding='utf-8', newline='') as f:
+                f.write(self.data)
+            for mode, encoder in (('long', translitcodec.long_encode),
+                                  ('short', translitcodec.short_encode),
+                                  ('one', translitcodec.single_encode)):
+                for chunk_size in (1, 7, 1000):
+                    length = translitcodec.transliterate_file(
+                        src, dst, mode, chunk_size=chunk_size)
+                    assert length == len(self.data)
+                    with open(dst, encoding='utf-8', newline='') as f:
+                        assert f.read() == encoder(self.data)[0], (mode, chunk_size)
+
+    def test_target(self):
+        dst = io.BytesIO()
+        translitcodec.transliterate_file(io.StringIO(self.data), dst, 'short',
+                                         target='iso-8859-2', chunk_size=5,
+                                         errors='replace')
+        assert dst.getvalue() == codecs.encode(self.data, 'translit/short/iso-8859-2', 'replace')
+
+
+class CommandLineTests(TestCase):
+    data = IncrementalTests.data * 50
+
+    def run_main(self, args, input=b''):
+        return subprocess.run(
+            [sys.executable, '-m', 'translitcodec'] + args, input=input,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            cwd=os.path.join(os.path.dirname(__file__), os.pardir))
+
+    def test_stdin(self):
+        result = self.run_main(['-m', 'short', '-b', '7'], self.data.encode('utf-8'))
+        assert result.returncode == 0
+        assert result.stdout == codecs.encode(self.data, 'translit/short/utf-8')
+
+    def test_compressed(self):
+        expected = codecs.encode(self.data, 'translit/long/ascii', 'replace')
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for compression in ('gzip', 'bz2', 'xz', None):
+                path = os.path.join(directory, 'in.%s' % compression)
+                with contextlib.ExitStack() as stack:
+                    translitcodec.__main__._open_output(
+                        path, compression, -1, stack).write(self.data.encode('utf-8'))
+                paths.append(path)
+            dst = os.path.join(directory, 'out.txt.xz')
+            result = self.run_main(['-t', 'ascii', '-e', 'replace', '-o', dst] + paths)
+            assert result.returncode == 0
+            with lzma.open(dst) as f:
+                assert f.read() == expected * 4
+
+    def test_stats(self):
+        result = self.run_main(['--stats', '-m', 'one', '-t', 'ascii', '-e', 'replace'],
+                               '\u263a \u00e9 \u263a'.encode('utf-8'))
+        assert result.stdout == b'? e ?'
+        stats = result.stderr.decode('ascii').splitlines()
+        assert stats[0].startswith('5 characters read, 5 bytes written in ')
+        assert stats[1:] == ['2 unmapped characters', "  U+263A '\\u263a' 2"]
+
+    def test_buffer_size(self):
+        for size in ('0', '-1', 'x'):
+            result = self.run_main(['-b', size], b'caf\xc3\xa9\n')
+            assert result.returncode == 2
+            assert b'--buffer-size' in result.stderr
+
+    def test_error(self):
+        result = self.run_main(['-t', 'ascii'], '\u53e6'.encode('utf-8'))
+        assert result.returncode == 1
+        assert b"can't encode character" in result.stderr
+
+
+class ParallelTests(TestCase):
+    values = ['caf\u00e9 %d \u20ac' % i for i in range(100)] + ['cafe\u0301', '\u263a']
+
+    def test_transliterate_many(self):
+        for mode, encoder in (('long', translitcodec.long_encode),
+                              ('one', translitcodec.single_encode)):
+            expected = [encoder(value)[0] for value in self.values]
+            for processes in (1, 2):
+                assert translitcodec.parallel.transliterate_many(
+                    self.values, mode, processes=processes, chunksize=7) == expected
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            translitcodec.parallel.transliterate_many(self.values, 'medium')
+
+    def test_transliterate_file(self):
+        # Without newlines, slices are split before characters NFKC does
+        # not combine with anything before them.
+        data = IncrementalTests.data.replace('\n', ' ') * 5 + '\n' + IncrementalTests.data * 5
+        with tempfile.TemporaryDirectory() as directory:
+            src = os.path.join(directory, 'in.txt')
+            with open(src, 'w', encoding='utf-8', newline='') as f:
+                f.write(data)
+            for target, errors in ((None, 'strict'), ('iso-8859-2', 'replace'),
+                                   ('utf-16', 'strict'), ('utf-8-sig', 'strict')):
+                expected = io.BytesIO()
+                translitcodec.transliterate_file(src, expected, 'short', target=target or 'utf-8',
+                                                 errors=errors)
+                for processes in (1, 2):
+                    for slice_size in (1, 7, 1000):
+                        dst = io.BytesIO()
+                        length = translitcodec.parallel.transliterate_file(
+                            src, dst, 'short', target, errors, processes, slice_size)
+                        assert length == len(data)
+                        assert dst.getvalue() == expected.getvalue(), (processes, slice_size)
+
+
+class TreeTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.src = os.path.join(directory.name, 'src')
+        self.dst = os.path.join(directory.name, 'dst')
+        self.checkpoint = os.path.join(directory.name, 'checkpoint')
+        self.files = {os.path.join('a', 'b', '%d.txt' % i): 'caf\u00e9 %d \u20ac\n' % i
+                      for i in range(10)}
+        self.files['top.txt'] = IncrementalTests.data
+        for path, data in self.files.items():
+            os.makedirs(os.path.dirname(os.path.join(self.src, path)), exist_ok=True)
+            with open(os.path.join(self.src, path), 'w', encoding='utf-8', newline='') as f:
+                f.write(data)
+
+    def check_output(self):
+        for path, data in self.files.items():
+            with open(os.path.join(self.dst, path), 'rb') as f:
+                assert f.read() == codecs.encode(data, 'translit/short/utf-8'), path
+
+    def test_tree(self):
+        for processes in (1, 2):
+            summary = translitcodec.parallel.transliterate_tree(
+                self.src, self.dst, 'short', processes=processes, batch_size=3)
+            assert summary['files'] == len(self.files)
+            assert summary['skipped'] == 0
+            self.check_output()
+
+    def test_checkpoint(self):
+        with open(os.path.join(self.src, 'bad.txt'), 'wb') as f:
+            f.write(b'caf\xe9')
+        progress = []
+        summary = translitcodec.parallel.transliterate_tree(
+            self.src, self.dst, 'short', processes=2, checkpoint=self.checkpoint,
+            progress=lambda *args: progress.append(args), batch_size=4)
+        assert summary['files'] == len(self.files)
+        assert list(summary['failed']) == ['bad.txt']
+        assert not os.path.exists(os.path.join(self.dst, 'bad.txt'))
+        assert progress[-1][:2] == (len(self.files), sum(
+            os.path.getsize(os.path.join(self.src, path)) for path in self.files))
+        self.check_output()
+
+        # Resumed, only the changed and failed files are done again.
+        os.remove(os.path.join(self.dst, 'top.txt'))
+        with open(self.checkpoint, 'a') as f:
+            f.write('{"path": "cut')
+        with open(os.path.join(self.src, 'a', 'b', '3.txt'), 'w') as f:
+            f.write('\u00bd')
+        self.files[os.path.join('a', 'b', '3.txt')] = '\u00bd'
+        summary = translitcodec.parallel.transliterate_tree(
+            self.src, self.dst, 'short', processes=1, checkpoint=self.checkpoint)
+        assert summary['files'] == 2
+        assert summary['skipped'] == len(self.files) - 2
+        assert list(summary['failed']) == ['bad.txt']
+        self.check_output()
+
+    def test_special_files(self):
+        os.symlink(os.path.join(self.src, 'missing.txt'), os.path.join(self.src, 'dangling.txt'))
+        os.mkfifo(os.path.join(self.src, 'fifo'))
+        summary = translitcodec.parallel.transliterate_tree(
+            self.src, self.dst, 'short', processes=1)
+        assert summary['files'] == len(self.files)
+        assert list(summary['failed']) == ['dangling.txt']
+        assert summary['failed']['dangling.txt'].startswith('FileNotFoundError: ')
+        assert not os.path.exists(os.path.join(self.dst, 'fifo'))
+        self.check_output()
+
+    def test_command_line(self):
+        result = subprocess.run(
+            [sys.executable, '-m', 'translitcodec', '--tree', self.src, '-o', self.dst,
+             '-m', 'short', '--checkpoint', self.checkpoint, '-j', '1', '--stats'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            cwd=os.path.join(os.path.dirname(__file__), os.pardir))
+        assert result.returncode == 0
+        assert b'%d files, ' % len(self.files) in result.stderr
+        self.check_output()
+
+
 class AlphabetTests(TestCase):
     def test_vietnamese(self):
         alphabet_upper = 'AĂÂBCDĐEÊGHIKLMNOÔƠPQRSTUƯVXY'
@@ -100,3 +674,58 @@ class ErrorHandlersTests(TestCase):
     def test_strict_one(self):
         with self.assertRaises(UnicodeEncodeError):
             self._process('strict/translit/one')
+
+    def test_whole_run_per_callback(self):
+        calls = []
+
+        def handler(exc):
+            calls.append((exc.start, exc.end))
+            return translitcodec.replace_long(exc)
+        codecs.register_error('test/count', handler)
+        data = 'ab' + '€☺另' * 1000 + 'cd'
+        assert data.encode('ascii', 'test/count') == b'ab' + b'EUR:-)?' * 1000 + b'cd'
+        assert calls == [(2, 3002)]
+
+    def test_normalized_replacements(self):
+        assert 'ﬁ ¼'.encode('ascii', 'replace/translit/long') == b'fi 1/4'
+
+    def test_strict_position(self):
+        with self.assertRaises(UnicodeEncodeError) as context:
+            'ab\u20ac\u20ac\u53e6x'.encode('ascii', 'strict/translit/long')
+        assert (context.exception.start, context.exception.end) == (4, 5)
+
+    def test_independent_of_neighbours(self):
+        for handler in ('replace/translit/one', 'ignore/translit/long'):
+            for run in ('\u0238\u0f5c', '\u00c5\u0301', '\u1112\u1161', '\ufb01\u00bd'):
+                expected = b''.join(char.encode('ascii', handler) for char in run)
+                assert run.encode('ascii', handler) == expected, (handler, run)
+
+    def test_charset_codecs(self):
+        for mode in ('long', 'short', 'one'):
+            expected = codecs.encode(self.data, self.page, 'replace/translit/' + mode)
+            codec = 'translit/%s/%s' % (mode, self.page)
+            assert codecs.encode(self.data, codec, 'replace') == expected
+
+    def test_cache_info(self):
+        translitcodec.clear_caches()
+        assert translitcodec.handler_cache_info()['long'].currsize == 0
+        '€ € ™'.encode('ascii', 'replace/translit/long')
+        info = translitcodec.handler_cache_info()['long']
+        assert (info.hits, info.misses) == (1, 2)
+        '另 另'.encode('ascii', 'replace/translit/long')
+        info = translitcodec.handler_cache_info()['long']
+        assert (info.hits, info.misses) == (2, 3)
+        translitcodec.clear_caches()
+        assert translitcodec.handler_cache_info()['long'].currsize == 0
+
+    def test_clear_caches(self):
+        assert '€'.encode('ascii', 'replace/translit/long') == b'EUR'
+        assert '€'.encode('translit/long/ascii') == b'EUR'
+        translitcodec.long_table[0x20ac] = 'euro'
+        try:
+            translitcodec.clear_caches()
+            assert '€'.encode('ascii', 'replace/translit/long') == b'euro'
+            assert '€'.encode('translit/long/ascii') == b'euro'
+        finally:
+            translitcodec.long_table[0x20ac] = 'EUR'
+            translitcodec.clear_caches()
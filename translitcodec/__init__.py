@@ -9,8 +9,19 @@ the ``transtab`` collection by Markus Kuhn.
 :license: MIT, see LICENSE for more details.
 
 """
+import array
+import bisect
 import codecs
+import collections
+import contextlib
+import functools
+import gc
+import importlib
+import io
+import os
+import re
 import sys
+import time
 import unicodedata
 
 
@@ -18,59 +29,715 @@ __version_info__ = (0, 7, 0)
 __version__ = '.'.join(str(_) for _ in __version_info__)
 
 
-def long_encode(input, errors='strict'):
+# Inputs longer than this are translated block by block, so that blocks
+# of plain ASCII can be copied through without any table lookups.
+_BLOCK_SIZE = 1024
+
+
+# Module of translitcodec.tables each generated table is imported from.
+_table_modules = {
+    'long_table': 'transtab',
+    'short_table': 'transtab',
+    'single_table': 'transtab',
+    'alternatives_table': 'alternatives',
+    'nfkc_codes': 'nfkc',
+    'nfkc_sensitive': 'nfkc',
+}
+
+# Position in the runs of tables.transtab of each table's replacements.
+_transtab_columns = {'long_table': 2, 'short_table': 3, 'single_table': 4}
+
+
+def _expand(runs, values, column):
+    """Build the table of one column of range encoded runs."""
+    # The tables share the code point objects of their keys.
+    codes = _run_codes()
+    table = {}
+    start = 0
+    for first, last, index in zip(runs[0::5], runs[1::5], runs[column::5]):
+        end = start + last - first + 1
+        if index >= 0:
+            if first == last:
+                table[codes[start]] = values[index]
+            else:
+                table.update(dict.fromkeys(codes[start:end], values[index]))
+        start = end
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _run_codes():
+    """Return every code point of the runs of the transtab data, in order."""
+    runs = _transtab()[0]
+    return tuple(code for first, last in zip(runs[0::5], runs[1::5])
+                 for code in range(first, last + 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _transtab():
+    """Return the runs and replacements the long, short and single tables
+    are expanded from.
+
+    They are mapped from tables/transtab.bin when possible, and read from
+    the tables.transtab module otherwise.
+    """
+    tables = importlib.import_module(__name__ + '.tables')
+    mapped = tables.map_transtab()
+    if mapped is not None:
+        return mapped
+    module = importlib.import_module(__name__ + '.tables.transtab')
+    return module.runs, module.values
+
+
+def _build(name):
+    """Return a generated table, importing its module if needed."""
+    if name in _transtab_columns:
+        runs, values = _transtab()
+        return _expand(runs, values, _transtab_columns[name])
+    module = importlib.import_module('%s.tables.%s' % (__name__, _table_modules[name]))
+    return getattr(module, name)
+
+
+def _load(name):
+    """Return a generated table, building it on first use."""
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    table = globals()[name] = _build(name)
+    return table
+
+
+def __getattr__(name):
+    if name in _table_modules:
+        return _load(name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+_mode_tables = {'long': 'long_table', 'short': 'short_table', 'one': 'single_table'}
+
+
+@functools.lru_cache(maxsize=None)
+def _run_firsts():
+    """Return the first code point of each run of the transtab data."""
+    return _transtab()[0][0::5]
+
+
+def _run(code):
+    """Return the offset in the runs of the transtab data of the run of
+    *code*, or -1 if there is none."""
+    runs = _transtab()[0]
+    index = bisect.bisect_right(_run_firsts(), code) - 1
+    if index >= 0 and code <= runs[index * 5 + 1]:
+        return index * 5
+    return -1
+
+
+def _lookup(mode, code):
+    """Return the replacement of *code* in the table of *mode*, or None.
+
+    Unless the table was loaded, *code* is looked up in the runs of the
+    transtab data, which are shared with other processes when mapped from
+    tables/transtab.bin, rather than in a table built for the process.
+    """
+    name = _mode_tables[mode]
+    table = globals().get(name)
+    if table is not None:
+        return table.get(code)
+    run = _run(code)
+    if run < 0:
+        return None
+    runs, values = _transtab()
+    index = runs[run + _transtab_columns[name]]
+    return values[index] if index >= 0 else None
+
+
+@functools.lru_cache(maxsize=None)
+def _translation_table(mode):
+    """Return the table given to ``str.translate`` for *mode*.
+
+    ASCII characters map to themselves, as lookups that miss are much
+    slower than hits.  Characters of the tables that NFKC normalizes one
+    at a time map straight to the transliteration of their NFKC form; as
+    they never occur in normalized text, the same table serves normalized
+    input.  The other characters NFKC changes are left to the
+    normalization pass, see `_normalize_search()`.
+
+    Unless it was already loaded, the table of *mode* is only built for
+    the time it takes.
+    """
+    name = _mode_tables[mode]
+    table = globals()[name] if name in globals() else _build(name)
+    translation = {code: chr(code) for code in range(0x80)}
+    translation.update(table)
+    for code in _fused_codes():
+        translation[code] = unicodedata.normalize('NFKC', chr(code)).translate(table)
+    return translation
+
+
+def _ranges(ranges):
+    """Return the (first, last) pairs of a flat array of ranges."""
+    return zip(ranges[0::2], ranges[1::2])
+
+
+@functools.lru_cache(maxsize=None)
+def _fused_codes():
+    """Return the code points NFKC normalizes one at a time that any of
+    the long, short and single tables maps."""
+    return tuple(code for first, last in _ranges(_load('nfkc_codes'))
+                 for code in range(first, last + 1) if _run(code) >= 0)
+
+
+def _search(ranges):
+    """Return a search for the code points of *ranges* and those beyond
+    the BMP."""
+    # Code points beyond the BMP are always searched for, sre only has a
+    # fast lookup for large character sets within the BMP.
+    ranges = ''.join('%s-%s' % (re.escape(chr(start)), re.escape(chr(end)))
+                     for start, end in ranges)
+    return re.compile('[%s\\U00010000-\\U0010ffff]' % ranges).search
+
+
+@functools.lru_cache(maxsize=None)
+def _nfkc_sensitive_search():
+    """Return a search for characters that need a full NFKC pass."""
+    return _search(_ranges(_load('nfkc_sensitive')))
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize_search():
+    """Return a search for characters the translation tables can not
+    transliterate without a full NFKC pass: those of
+    `_nfkc_sensitive_search()`, and those NFKC changes that no table maps.
+    """
+    fused = set(_fused_codes())
+    ranges = list(_ranges(_load('nfkc_sensitive')))
+    for first, last in _ranges(_load('nfkc_codes')):
+        for code in range(first, last + 1):
+            if code in fused:
+                continue
+            if ranges[-1][1] == code - 1:
+                ranges[-1] = (ranges[-1][0], code)
+            else:
+                ranges.append((code, code))
+    return _search(ranges)
+
+
+# Callbacks receiving the duration of each phase of an encode call.
+_phase_hooks = []
+
+PHASES = ('normalize', 'translate', 'encode', 'error_handler')
+
+
+def add_phase_hook(hook):
+    """Call *hook* with the duration of each phase of encode calls.
+
+    *hook* is called as ``hook(codec, phase, seconds, size)``, where
+    *phase* is one of `PHASES`, *codec* the codec or encoding doing the
+    work, and *size* the length of what the phase produced: characters,
+    or bytes for 'encode'.  Error handlers run within the 'encode' phase
+    of the codec that calls them.
+
+    The phases run within calls to ``_phase()`` while a hook is
+    installed, which tools based on ``sys.monitoring`` can watch for.
+    Without hooks, the encoders only check that there are none.
+    """
+    _phase_hooks.append(hook)
+
+
+def remove_phase_hook(hook):
+    """Stop calling a hook installed with `add_phase_hook()`."""
+    _phase_hooks.remove(hook)
+
+
+@contextlib.contextmanager
+def record_phases():
+    """Record the phases of the encode calls made within the block.
+
+    Yields a list that receives a ``(codec, phase, seconds, size)`` tuple
+    per phase.
+    """
+    records = []
+
+    def record(*args):
+        records.append(args)
+    add_phase_hook(record)
+    try:
+        yield records
+    finally:
+        remove_phase_hook(record)
+
+
+def _phase(codec, phase, func, *args):
+    """Run one phase of an encode call and report it to the hooks."""
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    size = len(result[0] if isinstance(result, tuple) else result)
+    for hook in list(_phase_hooks):
+        hook(codec, phase, seconds, size)
+    return result
+
+
+def _transliterate(input, mode, assume_normalized=False):
+    """Normalize and translate a string, skipping work for ASCII text.
+
+    Unless the input contains characters that combine or reorder under
+    NFKC, normalization is done character by character by the fused
+    table, in the same pass as the transliteration.
+    """
+    if input.isascii():
+        return input
+    if _counters is not None:
+        _count(mode, input)
+    if _unmapped is not None:
+        _sample_unmapped('translit/' + mode, mode, input)
+    if not assume_normalized and _normalize_search()(input):
+        if _phase_hooks:
+            input = _phase('translit/' + mode, 'normalize', unicodedata.normalize, 'NFKC', input)
+        else:
+            input = unicodedata.normalize('NFKC', input)
+    table = _translation_table(mode)
+    if _phase_hooks:
+        return _phase('translit/' + mode, 'translate', _translate, input, table)
+    return _translate(input, table)
+
+
+def _translate(input, table):
+    """Translate *input* block by block, copying ASCII blocks through."""
+    if len(input) <= _BLOCK_SIZE:
+        return input.translate(table)
+    blocks = []
+    for start in range(0, len(input), _BLOCK_SIZE):
+        block = input[start:start + _BLOCK_SIZE]
+        if not block.isascii():
+            block = block.translate(table)
+        blocks.append(block)
+    return ''.join(blocks)
+
+
+def long_encode(input, errors='strict', assume_normalized=False):
     """Transliterate to 8 bit using as many letters as needed.
 
     For example, \u00e4 LATIN SMALL LETTER A WITH DIAERESIS ``ä`` will
     be replaced with ``ae``.
 
+    Pass ``assume_normalized=True`` for input that is already NFKC
+    normalized to skip the normalization check.
+
     """
     if not isinstance(input, str):
         input = str(input, sys.getdefaultencoding(), errors)
-    length = len(input)
-    input = unicodedata.normalize('NFKC', input)
-    return input.translate(long_table), length
+    output = _transliterate(input, 'long', assume_normalized)
+    return output, len(input)
 
 
-def short_encode(input, errors='strict'):
+def short_encode(input, errors='strict', assume_normalized=False):
     """Transliterate to 8 bit using as few letters as possible.
 
     For example, \u00e4 LATIN SMALL LETTER A WITH DIAERESIS ``ä`` will
     be replaced with ``a``.
 
+    Pass ``assume_normalized=True`` for input that is already NFKC
+    normalized to skip the normalization check.
+
     """
     if not isinstance(input, str):
         input = str(input, sys.getdefaultencoding(), errors)
-    length = len(input)
-    input = unicodedata.normalize('NFKC', input)
-    return input.translate(short_table), length
+    output = _transliterate(input, 'short', assume_normalized)
+    return output, len(input)
 
 
-def single_encode(input, errors='strict'):
+def single_encode(input, errors='strict', assume_normalized=False):
     """Transliterate to 8 bit using only single letter replacements.
 
     For example, \u2639 WHITE FROWNING FACE ``☹`` will be passed
     through unchanged.
 
+    Pass ``assume_normalized=True`` for input that is already NFKC
+    normalized to skip the normalization check.
+
     """
     if not isinstance(input, str):
         input = str(input, sys.getdefaultencoding(), errors)
-    length = len(input)
-    input = unicodedata.normalize('NFKC', input)
-    return input.translate(single_table), length
+    output = _transliterate(input, 'one', assume_normalized)
+    return output, len(input)
+
+
+def transliterate_batch(values, mode='long'):
+    """Transliterate a sequence of strings, each distinct one only once.
+
+    Returns a list with the transliteration of each of *values*, in order.
+    The distinct values are joined with NUL characters, which nothing
+    combines with, and transliterated in a single pass.
+    """
+    if mode not in ('long', 'short', 'one'):
+        raise ValueError('unknown transliteration mode %r' % (mode,))
+    values = list(values)
+    unique = list(dict.fromkeys(values))
+    joined = '\x00'.join(unique)
+    if joined.count('\x00') == len(unique) - 1:
+        results = _transliterate(joined, mode).split('\x00')
+    else:
+        results = [_transliterate(value, mode) for value in unique]
+    if len(unique) == len(values):
+        return results
+    mapping = dict(zip(unique, results))
+    return [mapping[value] for value in values]
+
+
+# Number of characters each error handler family remembers.
+_RESOLVE_CACHE_SIZE = 4096
+
+
+def _resolver(mode):
+    @functools.lru_cache(maxsize=_RESOLVE_CACHE_SIZE)
+    def resolve(char):
+        """Transliterate one character, or return None if it can not be.
+
+        ASCII characters resulting from normalization are kept, the
+        others are looked up with `_lookup()`.
+        """
+        replacement = []
+        for normalized in unicodedata.normalize('NFKC', char):
+            if normalized < '\x80':
+                new_char = normalized
+            else:
+                new_char = _lookup(mode, ord(normalized))
+                if new_char is None:
+                    return None
+            replacement.append(new_char)
+        return ''.join(replacement)
+    resolve.__name__ = 'resolve_%s' % mode
+    return resolve
+
+
+_resolvers = {mode: _resolver(mode) for mode in ('long', 'short', 'one')}
+
+
+def handler_cache_info():
+    """Return the hit and miss counts of the error handler caches.
+
+    Maps each handler family, ``'long'``, ``'short'`` and ``'one'``, to
+    the ``functools.lru_cache`` statistics of its character cache.
+    """
+    return {mode: resolve.cache_info() for mode, resolve in _resolvers.items()}
+
+
+def clear_caches():
+    """Forget everything derived from the translation tables.
 
+    Call this after changing ``long_table``, ``short_table``,
+    ``single_table`` or ``alternatives_table``.
+    """
+    for resolve in _resolvers.values():
+        resolve.cache_clear()
+    _translation_table.cache_clear()
+    _fused_codes.cache_clear()
+    _normalize_search.cache_clear()
+    _encoding_map.cache_clear()
+
+
+def prepare_for_fork(charsets=(), freeze=False):
+    """Build everything translitcodec builds on first use.
+
+    Call this in the master process of a preforking server, so that its
+    workers share the tables instead of each building their own.  The
+    encoding maps of the 'translit/<mode>/<charset>' codecs are built for
+    each of *charsets*.
+
+    Garbage collections in the workers still write to the shared pages.
+    Applications that want to avoid this call ``gc.freeze()`` before
+    forking, which moves every object of the process, not only those of
+    translitcodec, out of reach of the garbage collector.  *freeze* makes
+    that call after building the tables.
+    """
+    _nfkc_sensitive_search()
+    _normalize_search()
+    for mode in ('long', 'short', 'one'):
+        _translation_table(mode)
+        for charset in charsets:
+            codecs.lookup('translit/%s/%s' % (mode, charset))
+            _encoding_map(mode, codecs.lookup(charset).name)
+    if freeze and hasattr(gc, 'freeze'):
+        gc.freeze()
+
+
+# Per mode hit and miss counts by code point, None unless counting.
+_counters = None
+# Count the input of one in this many calls, and the calls left until then.
+_count_every = 1
+_count_countdown = 1
+
+
+def enable_counters(every=1):
+    """Start counting the non-ASCII characters each mode transliterates.
+
+    Characters the table of the mode maps, directly or after NFKC
+    normalization, count as hits, the others as misses.  The input of one
+    in *every* encode calls and error handler callbacks is counted, in a
+    single pass; when counting is disabled, checking that it is costs
+    nothing measurable.
+    """
+    global _counters, _count_every, _count_countdown
+    _count_every = _count_countdown = every
+    if _counters is None:
+        _counters = {mode: (collections.Counter(), collections.Counter())
+                     for mode in ('long', 'short', 'one')}
+
+
+def disable_counters():
+    """Stop counting and forget the counts."""
+    global _counters
+    _counters = None
+
+
+def counters():
+    """Return a snapshot of the counts.
+
+    Maps each mode to a dict of ``'hits'`` and ``'misses'``, which map
+    code points to their number of occurrences.  Empty unless counting.
+    """
+    if _counters is None:
+        return {}
+    return {mode: {'hits': dict(hits), 'misses': dict(misses)}
+            for mode, (hits, misses) in _counters.items()}
+
+
+def reset_counters():
+    """Set all counts back to zero."""
+    if _counters is not None:
+        for hits, misses in _counters.values():
+            hits.clear()
+            misses.clear()
+
+
+def _count(mode, input, charset=frozenset()):
+    """Count the characters of *input* outside ASCII and *charset*."""
+    global _count_countdown
+    _count_countdown -= 1
+    if _count_countdown > 0:
+        return
+    _count_countdown = _count_every
+    counts = _counters
+    if counts is None:
+        return
+    hits, misses = counts[mode]
+    for char, count in collections.Counter(input).items():
+        if char < '\x80' or char in charset:
+            continue
+        if _maps(mode, char):
+            hits[ord(char)] += count
+        else:
+            misses[ord(char)] += count
+
+
+def _maps(mode, char):
+    """Tell whether the table of *mode* maps *char*, directly or after NFKC."""
+    return _lookup(mode, ord(char)) is not None or all(
+        c < '\x80' or _lookup(mode, ord(c)) is not None
+        for c in unicodedata.normalize('NFKC', char))
+
+
+class _TopK:
+    """Approximate counts of the most frequent code points, in bounded memory.
+
+    A count-min sketch of *depth* rows of *width* counters, updated
+    conservatively, estimates the count of any code point, never below
+    the real count; the *size* code points with the highest estimates are
+    kept.
+    """
+
+    def __init__(self, size, width=2048, depth=4):
+        self.size = size
+        self.width = width
+        self.rows = [array.array('Q', bytes(8 * width)) for _ in range(depth)]
+        self.top = {}
+
+    def add(self, code, count=1):
+        cells = [(counts, hash((row, code)) % self.width)
+                 for row, counts in enumerate(self.rows)]
+        estimate = min(counts[index] for counts, index in cells) + count
+        for counts, index in cells:
+            if counts[index] < estimate:
+                counts[index] = estimate
+        top = self.top
+        if code in top or len(top) < self.size:
+            top[code] = estimate
+            return
+        smallest = min(top, key=top.get)
+        if estimate > top[smallest]:
+            del top[smallest]
+            top[code] = estimate
+
+    def most_common(self):
+        return sorted(self.top.items(), key=lambda item: (-item[1], item[0]))
+
+
+class _UnmappedSampler:
+    """The settings and state of `enable_unmapped_sampling()`."""
+
+    def __init__(self, callback, every, per_second, top, context):
+        self.callback = callback
+        self.every = self.countdown = every
+        self.per_second = per_second
+        self.context = context
+        self.top = _TopK(top)
+        self.total = self.reported = self.dropped = 0
+        self.window = 0.0
+        self.window_reports = 0
+
+    def report(self, codec, char, position, snippet):
+        """Pass an unmapped character to the callback, within the rate limit."""
+        if self.per_second is not None:
+            now = time.monotonic()
+            if now - self.window >= 1:
+                self.window = now
+                self.window_reports = 0
+            if self.window_reports >= self.per_second:
+                self.dropped += 1
+                return
+            self.window_reports += 1
+        self.reported += 1
+        self.callback(codec, char, position, snippet)
+
+
+# The sampler of unmapped characters, None unless sampling.
+_unmapped = None
+
+_non_ascii = re.compile('[^\x00-\x7f]')
+
+
+def enable_unmapped_sampling(callback=None, every=1, per_second=10, top=100, context=20):
+    """Start sampling the characters that the tables do not map.
+
+    In one in *every* encode calls and error handler callbacks, each
+    character outside ASCII and, for 'translit/<mode>/<charset>', outside
+    the charset, that the table of the mode does not map is counted.  It
+    is also passed to *callback*, called as ``callback(codec, char,
+    position, snippet)`` with the name of the codec or, in error
+    handlers, of the encoding, the position of *char* in the input, and
+    the input around it, *context* characters on each side.  *callback*
+    is called at most *per_second* times a second, or without limit if
+    it is None.
+
+    The counts are kept in a sketch of fixed size, see
+    `unmapped_summary()`.  When sampling is disabled, checking that it is
+    costs nothing measurable.
+    """
+    global _unmapped
+    _unmapped = _UnmappedSampler(callback, every, per_second, top, context)
 
-def _error_handle_base(exc, table, unknown_char_cb):
+
+def disable_unmapped_sampling():
+    """Stop sampling and forget the counts."""
+    global _unmapped
+    _unmapped = None
+
+
+def unmapped_summary():
+    """Return the counts of the sampled unmapped characters.
+
+    A dict of ``'top'``, a list of ``(code point, count)`` pairs, most
+    frequent first, of the code points estimated the most frequent;
+    ``'total'``, the number of unmapped characters sampled; and
+    ``'reported'`` and ``'dropped'``, the number of characters passed to
+    the callback and left out by its rate limit.  The counts in
+    ``'top'`` may be over, but never under, the real ones.  Empty unless
+    sampling.
+    """
+    sampler = _unmapped
+    if sampler is None:
+        return {}
+    return {'top': sampler.top.most_common(), 'total': sampler.total,
+            'reported': sampler.reported, 'dropped': sampler.dropped}
+
+
+def _sample_unmapped(codec, mode, input, start=0, end=None, charset=frozenset()):
+    """Sample the unmapped characters of ``input[start:end]``."""
+    sampler = _unmapped
+    if sampler is None:
+        return
+    sampler.countdown -= 1
+    if sampler.countdown > 0:
+        return
+    sampler.countdown = sampler.every
+    mapped = {}
+    counts = collections.Counter()
+    callback = sampler.callback
+    context = sampler.context
+    for match in _non_ascii.finditer(input, start, len(input) if end is None else end):
+        char = match.group()
+        if char in charset:
+            continue
+        if char not in mapped:
+            mapped[char] = _maps(mode, char)
+        if mapped[char]:
+            continue
+        counts[ord(char)] += 1
+        if callback is not None:
+            position = match.start()
+            sampler.report(codec, char, position,
+                           input[max(0, position - context):position + context + 1])
+    for code, count in counts.items():
+        sampler.top.add(code, count)
+        sampler.total += count
+
+
+def _error_handle_base(exc, mode, unknown_char_cb):
+    """Transliterate the whole run of characters that could not be encoded.
+
+    Characters without a transliteration are passed to *unknown_char_cb*.
+    """
+    # Single characters, the most common runs, go straight to the cache.
+    if (type(exc) is UnicodeEncodeError and exc.end - exc.start == 1 and
+            _counters is None and _unmapped is None and not _phase_hooks):
+        char = exc.object[exc.start]
+        new_char = _resolvers[mode](char)
+        if new_char is None:
+            if unknown_char_cb is re_reaise:
+                raise exc
+            new_char = unknown_char_cb(char, char, exc)
+        return new_char, exc.end
+    if _phase_hooks and isinstance(exc, UnicodeEncodeError):
+        return _phase(exc.encoding, 'error_handler', _handle_run, exc, mode, unknown_char_cb)
+    return _handle_run(exc, mode, unknown_char_cb)
+
+
+def _handle_run(exc, mode, unknown_char_cb):
     if isinstance(exc, UnicodeEncodeError):
-        char = unicodedata.normalize('NFKC', exc.object[exc.start:exc.end])[0]
-        new_char = char.translate(table)
-        if char == new_char:
-            new_char = unknown_char_cb(char, new_char, exc)
-        return new_char, exc.start + 1
+        run = exc.object[exc.start:exc.end]
+        if _counters is not None:
+            _count(mode, run)
+        if _unmapped is not None:
+            _sample_unmapped(exc.encoding, mode, exc.object, exc.start, exc.end)
+        # Each character is resolved on its own, so that its replacement
+        # does not depend on its neighbours in the run.
+        resolve = _resolvers[mode]
+        replacement = []
+        for char in run:
+            new_char = resolve(char)
+            if new_char is None:
+                if unknown_char_cb is re_reaise:
+                    # Report the character itself, not the whole run.
+                    position = exc.start + len(replacement)
+                    raise UnicodeEncodeError(exc.encoding, exc.object, position,
+                                             position + 1, exc.reason)
+                new_char = unknown_char_cb(char, char, exc)
+            replacement.append(new_char)
+        return ''.join(replacement), exc.end
     else:
         raise exc
 
 
+def _replace_unknown(c, n, e):
+    return '?'
+
+
+def _ignore_unknown(c, n, e):
+    return ''
+
+
 def replace_long(exc):
     """Error handler for transliterate to 8 bit using as many letters as needed.
 
@@ -79,7 +746,7 @@ def replace_long(exc):
 
     If the character is not replaced, then the '?' character is returned.
     """
-    return _error_handle_base(exc, long_table, lambda c, n, e: '?')
+    return _error_handle_base(exc, 'long', _replace_unknown)
 
 
 def replace_short(exc):
@@ -90,7 +757,7 @@ def replace_short(exc):
 
     If the character is not replaced, then the '?' character is returned.
     """
-    return _error_handle_base(exc, short_table, lambda c, n, e: '?')
+    return _error_handle_base(exc, 'short', _replace_unknown)
 
 
 def replace_single(exc):
@@ -101,7 +768,7 @@ def replace_single(exc):
 
     If the character is not replaced, then the '?' character is returned.
     """
-    return _error_handle_base(exc, single_table, lambda c, n, e: '?')
+    return _error_handle_base(exc, 'one', _replace_unknown)
 
 
 def ignore_long(exc):
@@ -112,7 +779,7 @@ def ignore_long(exc):
 
     If the character is not replaced, then it will be skipped.
     """
-    return _error_handle_base(exc, long_table, lambda c, n, e: '')
+    return _error_handle_base(exc, 'long', _ignore_unknown)
 
 
 def ignore_short(exc):
@@ -123,7 +790,7 @@ def ignore_short(exc):
 
     If the character is not replaced, then it will be skipped.
     """
-    return _error_handle_base(exc, short_table, lambda c, n, e: '')
+    return _error_handle_base(exc, 'short', _ignore_unknown)
 
 
 def ignore_single(exc):
@@ -134,7 +801,7 @@ def ignore_single(exc):
 
     If the character is not replaced, then it will be skipped.
     """
-    return _error_handle_base(exc, single_table, lambda c, n, e: '')
+    return _error_handle_base(exc, 'one', _ignore_unknown)
 
 
 def re_reaise(c, n, e):
@@ -149,7 +816,7 @@ def strict_long(exc):
 
     If the character is not replaced, then an exception is thrown.
     """
-    return _error_handle_base(exc, long_table, re_reaise)
+    return _error_handle_base(exc, 'long', re_reaise)
 
 
 def strict_short(exc):
@@ -160,7 +827,7 @@ def strict_short(exc):
 
     If the character is not replaced, then an exception is thrown.
     """
-    return _error_handle_base(exc, short_table, re_reaise)
+    return _error_handle_base(exc, 'short', re_reaise)
 
 
 def strict_single(exc):
@@ -171,7 +838,7 @@ def strict_single(exc):
 
     If the character is not replaced, then an exception is thrown.
     """
-    return _error_handle_base(exc, single_table, re_reaise)
+    return _error_handle_base(exc, 'one', re_reaise)
 
 
 def no_decode(input, errors='strict'):
@@ -182,15 +849,323 @@ def _double_encoding_factory(encoder, byte_encoder, byte_encoding):
     """Send the transliterated output to another codec."""
     def dbl_encode(input, errors='strict'):
         uni, length = encoder(input, errors)
+        if _phase_hooks:
+            return _phase(byte_encoding, 'encode', byte_encoder, uni, errors)[0], length
         return byte_encoder(uni, errors)[0], length
     dbl_encode.__name__ = '%s_%s' % (encoder.__name__, byte_encoding)
     return dbl_encode
 
 
+def _decoding_table(byte_encoding):
+    """Return the 256 character decoding table of a single byte codec.
+
+    Returns None for codecs that are not table driven, like UTF-8.
+    """
+    name = codecs.lookup(byte_encoding).name
+    if name == 'ascii':
+        return ''.join(map(chr, range(0x80))) + '\ufffe' * 0x80
+    try:
+        module = importlib.import_module('encodings.' + name.replace('-', '_'))
+    except ImportError:
+        return None
+    return getattr(module, 'decoding_table', None)
+
+
+def _charset_replacement(mode, char, charset):
+    """Transliterate *char* using only characters from *charset*.
+
+    Characters of the charset are kept.  Others are replaced by their
+    NFKC form, or else by the first transtab alternative the charset can
+    represent, starting with the one in the table of *mode*.  Returns
+    None if there is no such replacement.
+    """
+    if char in charset:
+        return char
+    normalized = unicodedata.normalize('NFKC', char)
+    if normalized != char:
+        replacements = [_charset_replacement(mode, c, charset) for c in normalized]
+        if None not in replacements:
+            return ''.join(replacements)
+    replacement = _lookup(mode, ord(char))
+    candidates = [replacement] if replacement is not None else []
+    candidates.extend(_load('alternatives_table').get(ord(char), ()))
+    for candidate in candidates:
+        if mode == 'one' and len(candidate) != 1:
+            continue
+        if charset.issuperset(candidate):
+            return candidate
+    return None
+
+
+# Bounds the number of characters an encoding map resolves and keeps.
+_ENCODING_MAP_LIMIT = 0x10000
+
+
+class _EncodingMap(dict):
+    """A ``codecs.charmap_encode`` mapping transliterating into a charset.
+
+    Characters of the charset map to their byte.  Other characters are
+    resolved the first time they are looked up; None marks those that
+    can not be encoded.
+    """
+
+    def __init__(self, mode, byte_encoding, decoding_table):
+        dict.__init__(self)
+        self.mode = mode
+        self.byte_encoding = byte_encoding
+        self.charset = frozenset(decoding_table) - {'\ufffe'}
+        for char in self.charset:
+            self[ord(char)] = char.encode(byte_encoding)[0]
+
+    def __missing__(self, code):
+        replacement = _charset_replacement(self.mode, chr(code), self.charset)
+        if replacement is not None:
+            replacement = replacement.encode(self.byte_encoding)
+        if len(self) < _ENCODING_MAP_LIMIT:
+            self[code] = replacement
+        return replacement
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding_map(mode, byte_encoding):
+    """Return the encoding map of *mode* for a single byte encoding.
+
+    Returns None if *byte_encoding* is not a single byte encoding.
+    """
+    decoding_table = _decoding_table(byte_encoding)
+    if decoding_table is None:
+        return None
+    return _EncodingMap(mode, byte_encoding, decoding_table)
+
+
+def _charmap_encoding_factory(mode, byte_encoding):
+    """Transliterate into a single byte charset and encode in one pass.
+
+    Returns None if *byte_encoding* is not a single byte encoding.
+    """
+    name = codecs.lookup(byte_encoding).name
+    encoding_map = _encoding_map(mode, name)
+    if encoding_map is None:
+        return None
+    ascii_compatible = all(encoding_map.get(code) == code for code in range(0x80))
+
+    def charmap_encode(input, errors='strict'):
+        if not isinstance(input, str):
+            input = str(input, sys.getdefaultencoding(), errors)
+        length = len(input)
+        # Looked up on each call, clear_caches() drops the map.
+        encoding_map = _encoding_map(mode, name)
+        if ascii_compatible and input.isascii():
+            return input.encode('ascii'), length
+        if _counters is not None:
+            _count(mode, input, encoding_map.charset)
+        if _unmapped is not None:
+            _sample_unmapped(codec, mode, input, charset=encoding_map.charset)
+        if _nfkc_sensitive_search()(input):
+            # Compose only, the encoding map applies the compatibility
+            # mappings to characters the charset does not have.
+            if _phase_hooks:
+                input = _phase(codec, 'normalize', unicodedata.normalize, 'NFC', input)
+            else:
+                input = unicodedata.normalize('NFC', input)
+        if _phase_hooks:
+            return _phase(codec, 'encode', _charmap_encode_blocks,
+                          input, errors, encoding_map, ascii_compatible), length
+        return _charmap_encode_blocks(input, errors, encoding_map, ascii_compatible), length
+    codec = 'translit/%s/%s' % (mode, byte_encoding)
+    charmap_encode.__name__ = 'translit_%s_%s' % (mode, byte_encoding)
+    return charmap_encode
+
+
+def _charmap_encode_blocks(input, errors, encoding_map, ascii_compatible):
+    """Encode *input* with an encoding map, copying ASCII blocks through."""
+    # BytesIO hands over its buffer without a copy at the end.
+    output = io.BytesIO()
+    for start in range(0, len(input), _BLOCK_SIZE):
+        block = input[start:start + _BLOCK_SIZE]
+        if ascii_compatible and block.isascii():
+            output.write(block.encode('ascii'))
+            continue
+        try:
+            output.write(codecs.charmap_encode(block, 'strict', encoding_map)[0])
+        except UnicodeEncodeError:
+            break
+    else:
+        return output.getvalue()
+    # Go on from the block that failed, with the error handler.
+    rest = input[start:]
+    try:
+        output.write(codecs.charmap_encode(rest, errors, encoding_map)[0])
+    except UnicodeEncodeError as exc:
+        if exc.object is not rest:
+            raise
+        # Report the position in the whole input.
+        raise UnicodeEncodeError(exc.encoding, input, start + exc.start,
+                                 start + exc.end, exc.reason) from None
+    return output.getvalue()
+
+
+# ASCII characters nothing can combine with, so a chunk ending with one
+# of them can be encoded right away.
+_inert_end = re.compile(r'[\x00-\x3b\x3f-\x40\x5b-\x60\x7b-\x7f]\Z').search
+
+
+def _starts_fresh(char):
+    """Whether NFKC can not combine *char* with anything before it."""
+    if char < '\U00010000':
+        return not _nfkc_sensitive_search()(char)
+    head = unicodedata.normalize('NFKD', char)[0]
+    if head < '\U00010000':
+        return not _nfkc_sensitive_search()(head)
+    return unicodedata.category(head)[0] not in 'MC'
+
+
+def _stream_split(input):
+    """Return how much of *input* can be encoded before the next chunk is seen.
+
+    The last character that starts fresh and everything after it are held
+    back, as combining characters at the start of the next chunk may still
+    compose with them.
+    """
+    if _inert_end(input):
+        return len(input)
+    for end in range(len(input) - 1, -1, -1):
+        if _starts_fresh(input[end]):
+            return end
+    return 0
+
+
+# Most characters kept from the end of a chunk to transliterate the
+# combining characters that start the next one with.
+_TAIL_LIMIT = 32
+
+
+def _incremental_encoder_factory(encoder, byte_encoding=None):
+    """Build an incremental encoder that encodes each chunk as it comes.
+
+    Nothing is held back, as ``open()`` never makes a final ``encode()``
+    call.  The characters at the end of a chunk that may still combine
+    with the next one are kept with what was written for them instead.
+    Combining characters starting the next chunk are transliterated
+    together with them, and what that adds is written.  When it does not
+    start with what was written, like for a charset that has the composed
+    character, they are encoded on their own, or dropped if the target
+    can not encode them.  `transliterate_file()` only splits its input
+    where characters can not combine.
+
+    When *byte_encoding* is given, *encoder* returns text that is passed
+    to the incremental encoder of *byte_encoding*.
+    """
+    class IncrementalEncoder(codecs.IncrementalEncoder):
+        def __init__(self, errors='strict'):
+            codecs.IncrementalEncoder.__init__(self, errors)
+            self.tail = ''
+            self.tail_output = None
+            if byte_encoding is not None:
+                self.byte_encoder = codecs.getincrementalencoder(byte_encoding)(errors)
+
+        def encode(self, input, final=False):
+            output = self._encode(input)
+            if final:
+                self.tail = ''
+            if byte_encoding is not None:
+                output = self.byte_encoder.encode(output, final)
+            return output
+
+        def _encode(self, input):
+            lead = 0
+            if self.tail:
+                while lead < len(input) and not _starts_fresh(input[lead]):
+                    lead += 1
+            if not lead:
+                return self._encode_chunk(input) if input else encoder(input, self.errors)[0]
+            output = self._continue(input[:lead])
+            if lead < len(input):
+                output += self._encode_chunk(input[lead:])
+            return output
+
+        def _encode_chunk(self, input):
+            """Encode a chunk starting fresh, keeping its tail."""
+            end = _stream_split(input)
+            tail = input[end:]
+            if not tail or len(tail) > _TAIL_LIMIT:
+                self.tail = ''
+                return encoder(input, self.errors)[0]
+            output = encoder(input[:end], self.errors)[0]
+            self.tail = tail
+            self.tail_output = encoder(tail, self.errors)[0]
+            return output + self.tail_output
+
+        def _continue(self, marks):
+            """Encode the combining characters following the tail."""
+            tail = self.tail + marks
+            whole = encoder(tail, self.errors)[0]
+            if whole.startswith(self.tail_output):
+                output = whole[len(self.tail_output):]
+            else:
+                try:
+                    output = encoder(marks, 'strict')[0]
+                except UnicodeEncodeError:
+                    output = whole[:0]
+            self.tail = tail if len(tail) <= _TAIL_LIMIT else ''
+            self.tail_output += output
+            return output
+
+        def reset(self):
+            self.tail = ''
+            if byte_encoding is not None:
+                self.byte_encoder.reset()
+    return IncrementalEncoder
+
+
+def _stream_writer_factory(incremental_encoder):
+    """Build a stream writer on top of an incremental encoder.
+
+    What the encoder still has to write at the end is written by
+    ``flush()``, ``reset()``, ``close()`` and on leaving a ``with`` block.
+    """
+    class StreamWriter(codecs.StreamWriter):
+        def __init__(self, stream, errors='strict'):
+            codecs.StreamWriter.__init__(self, stream, errors)
+            self.encoder = incremental_encoder(errors)
+
+        def encode(self, input, errors='strict'):
+            return self.encoder.encode(input), len(input)
+
+        def _write_tail(self):
+            output = self.encoder.encode('', final=True)
+            if output:
+                self.stream.write(output)
+
+        def flush(self):
+            self._write_tail()
+            self.stream.flush()
+
+        def reset(self):
+            self._write_tail()
+            self.encoder.reset()
+
+        def close(self):
+            self._write_tail()
+            self.stream.close()
+
+        def __exit__(self, type, value, tb):
+            self.close()
+    return StreamWriter
+
+
+def _codec_info(encoder, incremental_encoder, name):
+    return codecs.CodecInfo(
+        encoder, no_decode, name=name,
+        incrementalencoder=incremental_encoder,
+        streamwriter=_stream_writer_factory(incremental_encoder))
+
+
 def trans_search(encoding):
     """Lookup transliterating codecs."""
     if encoding == 'transliterate':
-        return codecs.CodecInfo(long_encode, no_decode)
+        return _codec_info(
+            long_encode, _incremental_encoder_factory(long_encode), 'transliterate')
 
     # translit/long/utf8
     # translit/one
@@ -201,7 +1176,7 @@ def trans_search(encoding):
         delim = '_'
 
     if encoding.startswith('translit' + delim):
-        parts = encoding.split(delim)
+        parts = encoding.split(delim, 2)
         if parts[1] == 'long':
             encoder = long_encode
         elif parts[1] == 'short':
@@ -211,15 +1186,20 @@ def trans_search(encoding):
         else:
             return None
 
+        name = 'translit/' + '/'.join(parts[1:])
         if len(parts) == 2:
-            pass
-        elif len(parts) == 3:
-            byte_enc = parts[2]
-            byte_encoder = codecs.lookup(byte_enc).encode
-            encoder = _double_encoding_factory(encoder, byte_encoder, byte_enc)
+            incremental_encoder = _incremental_encoder_factory(encoder)
         else:
-            return None
-        return codecs.CodecInfo(encoder, no_decode)
+            byte_enc = parts[2]
+            charmap_encoder = _charmap_encoding_factory(parts[1], byte_enc)
+            if charmap_encoder is not None:
+                encoder = charmap_encoder
+                incremental_encoder = _incremental_encoder_factory(encoder)
+            else:
+                incremental_encoder = _incremental_encoder_factory(encoder, byte_enc)
+                byte_encoder = codecs.lookup(byte_enc).encode
+                encoder = _double_encoding_factory(encoder, byte_encoder, byte_enc)
+        return _codec_info(encoder, incremental_encoder, name)
     return None
 
 codecs.register(trans_search)
@@ -236,2355 +1216,47 @@ codecs.register_error('strict/translit/long', strict_long)
 codecs.register_error('strict/translit/short', strict_short)
 codecs.register_error('strict/translit/one', strict_single)
 
-### Code below is generated by update_table.py; do not edit.
-### >
-
-long_table = {
-  160: ' ',
-  161: '!',
-  162: 'c',
-  163: 'GBP',
-  165: 'Y',
-  166: '|',
-  167: 'S',
-  168: '"',
-  169: '(c)',
-  170: 'a',
-  171: '<<',
-  172: '-',
-  173: '-',
-  174: '(R)',
-  175: '-',
-  176: ' ',
-  177: '+/-',
-  178: '^2',
-  179: '^3',
-  180: "'",
-  181: 'μ',
-  182: 'P',
-  183: '.',
-  184: ',',
-  185: '^1',
-  186: 'o',
-  187: '>>',
-  188: ' 1/4',
-  189: ' 1/2',
-  190: ' 3/4',
-  191: '?',
-  192: 'A',
-  193: 'A',
-  194: 'A',
-  195: 'A',
-  196: 'Ae',
-  197: 'Aa',
-  198: 'AE',
-  199: 'C',
-  200: 'E',
-  201: 'E',
-  202: 'E',
-  203: 'E',
-  204: 'I',
-  205: 'I',
-  206: 'I',
-  207: 'I',
-  208: 'D',
-  209: 'N',
-  210: 'O',
-  211: 'O',
-  212: 'O',
-  213: 'O',
-  214: 'Oe',
-  215: 'x',
-  216: 'O',
-  217: 'U',
-  218: 'U',
-  219: 'U',
-  220: 'Ue',
-  221: 'Y',
-  222: 'Th',
-  223: 'ss',
-  224: 'a',
-  225: 'a',
-  226: 'a',
-  227: 'a',
-  228: 'ae',
-  229: 'aa',
-  230: 'ae',
-  231: 'c',
-  232: 'e',
-  233: 'e',
-  234: 'e',
-  235: 'e',
-  236: 'i',
-  237: 'i',
-  238: 'i',
-  239: 'i',
-  240: 'd',
-  241: 'n',
-  242: 'o',
-  243: 'o',
-  244: 'o',
-  245: 'o',
-  246: 'oe',
-  247: ':',
-  248: 'o',
-  249: 'u',
-  250: 'u',
-  251: 'u',
-  252: 'ue',
-  253: 'y',
-  254: 'th',
-  255: 'y',
-  256: 'A',
-  257: 'a',
-  258: 'A',
-  259: 'a',
-  260: 'A',
-  261: 'a',
-  262: 'C',
-  263: 'c',
-  264: 'Ch',
-  265: 'ch',
-  266: 'C',
-  267: 'c',
-  268: 'C',
-  269: 'c',
-  270: 'D',
-  271: 'd',
-  272: 'D',
-  273: 'd',
-  274: 'E',
-  275: 'e',
-  276: 'E',
-  277: 'e',
-  278: 'E',
-  279: 'e',
-  280: 'E',
-  281: 'e',
-  282: 'E',
-  283: 'e',
-  284: 'Gh',
-  285: 'gh',
-  286: 'G',
-  287: 'g',
-  288: 'G',
-  289: 'g',
-  290: 'G',
-  291: 'g',
-  292: 'Hh',
-  293: 'hh',
-  294: 'H',
-  295: 'h',
-  296: 'I',
-  297: 'i',
-  298: 'I',
-  299: 'i',
-  300: 'I',
-  301: 'i',
-  302: 'I',
-  303: 'i',
-  304: 'I',
-  305: 'i',
-  306: 'IJ',
-  307: 'ij',
-  308: 'Jh',
-  309: 'jh',
-  310: 'K',
-  311: 'k',
-  312: 'k',
-  313: 'L',
-  314: 'l',
-  315: 'L',
-  316: 'l',
-  317: 'L',
-  318: 'l',
-  319: 'L·',
-  320: 'l·',
-  321: 'L',
-  322: 'l',
-  323: 'N',
-  324: 'n',
-  325: 'N',
-  326: 'n',
-  327: 'N',
-  328: 'n',
-  329: "'n",
-  330: 'NG',
-  331: 'ng',
-  332: 'O',
-  333: 'o',
-  334: 'O',
-  335: 'o',
-  336: 'O',
-  337: 'o',
-  338: 'OE',
-  339: 'oe',
-  340: 'R',
-  341: 'r',
-  342: 'R',
-  343: 'r',
-  344: 'R',
-  345: 'r',
-  346: 'S',
-  347: 's',
-  348: 'Sh',
-  349: 'sh',
-  350: 'S',
-  351: 's',
-  352: 'S',
-  353: 's',
-  354: 'T',
-  355: 't',
-  356: 'T',
-  357: 't',
-  358: 'T',
-  359: 't',
-  360: 'U',
-  361: 'u',
-  362: 'U',
-  363: 'u',
-  364: 'U',
-  365: 'u',
-  366: 'U',
-  367: 'u',
-  368: 'U',
-  369: 'u',
-  370: 'U',
-  371: 'u',
-  372: 'W',
-  373: 'w',
-  374: 'Y',
-  375: 'y',
-  376: 'Y',
-  377: 'Z',
-  378: 'z',
-  379: 'Z',
-  380: 'z',
-  381: 'Z',
-  382: 'z',
-  383: 's',
-  402: 'f',
-  416: 'O',
-  417: 'o',
-  431: 'U',
-  432: 'u',
-  536: 'Ş',
-  537: 'ş',
-  538: 'Ţ',
-  539: 'ţ',
-  697: '′',
-  699: '‘',
-  700: '’',
-  701: '‛',
-  710: '^',
-  712: "'",
-  713: '¯',
-  716: ',',
-  720: ':',
-  730: '°',
-  732: '~',
-  733: '"',
-  884: "'",
-  885: ',',
-  894: ';',
-  7682: 'B',
-  7683: 'b',
-  7690: 'D',
-  7691: 'd',
-  7710: 'F',
-  7711: 'f',
-  7744: 'M',
-  7745: 'm',
-  7766: 'P',
-  7767: 'p',
-  7776: 'S',
-  7777: 's',
-  7786: 'T',
-  7787: 't',
-  7808: 'W',
-  7809: 'w',
-  7810: 'W',
-  7811: 'w',
-  7812: 'W',
-  7813: 'w',
-  7918: 'U',
-  7919: 'u',
-  7922: 'Y',
-  7923: 'y',
-  8192: ' ',
-  8193: '  ',
-  8194: ' ',
-  8195: '  ',
-  8196: ' ',
-  8197: ' ',
-  8198: ' ',
-  8199: ' ',
-  8200: ' ',
-  8201: ' ',
-  8202: '',
-  8203: '',
-  8204: '',
-  8205: '',
-  8206: '',
-  8207: '',
-  8208: '-',
-  8209: '-',
-  8210: '-',
-  8211: '-',
-  8212: '--',
-  8213: '--',
-  8214: '||',
-  8215: '_',
-  8216: "'",
-  8217: "'",
-  8218: "'",
-  8219: "'",
-  8220: '"',
-  8221: '"',
-  8222: '"',
-  8223: '"',
-  8224: '+',
-  8225: '++',
-  8226: 'o',
-  8227: '>',
-  8228: '.',
-  8229: '..',
-  8230: '...',
-  8231: '-',
-  8234: '',
-  8235: '',
-  8236: '',
-  8237: '',
-  8238: '',
-  8239: ' ',
-  8240: ' 0/00',
-  8242: "'",
-  8243: '"',
-  8244: "'''",
-  8245: '`',
-  8246: '``',
-  8247: '```',
-  8249: '<',
-  8250: '>',
-  8252: '!!',
-  8254: '-',
-  8259: '-',
-  8260: '/',
-  8264: '?!',
-  8265: '!?',
-  8266: '7',
-  8304: '^0',
-  8308: '^4',
-  8309: '^5',
-  8310: '^6',
-  8311: '^7',
-  8312: '^8',
-  8313: '^9',
-  8314: '^+',
-  8315: '^-',
-  8316: '^=',
-  8317: '^(',
-  8318: '^)',
-  8319: '^n',
-  8320: '_0',
-  8321: '_1',
-  8322: '_2',
-  8323: '_3',
-  8324: '_4',
-  8325: '_5',
-  8326: '_6',
-  8327: '_7',
-  8328: '_8',
-  8329: '_9',
-  8330: '_+',
-  8331: '_-',
-  8332: '_=',
-  8333: '_(',
-  8334: '_)',
-  8364: 'EUR',
-  8448: 'a/c',
-  8449: 'a/s',
-  8451: '°C',
-  8453: 'c/o',
-  8454: 'c/u',
-  8457: '°F',
-  8467: 'l',
-  8470: 'Nº',
-  8471: '(P)',
-  8480: '[SM]',
-  8481: 'TEL',
-  8482: '[TM]',
-  8486: 'Ω',
-  8490: 'K',
-  8491: 'Å',
-  8494: 'e',
-  8531: ' 1/3',
-  8532: ' 2/3',
-  8533: ' 1/5',
-  8534: ' 2/5',
-  8535: ' 3/5',
-  8536: ' 4/5',
-  8537: ' 1/6',
-  8538: ' 5/6',
-  8539: ' 1/8',
-  8540: ' 3/8',
-  8541: ' 5/8',
-  8542: ' 7/8',
-  8543: ' 1/',
-  8544: 'I',
-  8545: 'II',
-  8546: 'III',
-  8547: 'IV',
-  8548: 'V',
-  8549: 'VI',
-  8550: 'VII',
-  8551: 'VIII',
-  8552: 'IX',
-  8553: 'X',
-  8554: 'XI',
-  8555: 'XII',
-  8556: 'L',
-  8557: 'C',
-  8558: 'D',
-  8559: 'M',
-  8560: 'i',
-  8561: 'ii',
-  8562: 'iii',
-  8563: 'iv',
-  8564: 'v',
-  8565: 'vi',
-  8566: 'vii',
-  8567: 'viii',
-  8568: 'ix',
-  8569: 'x',
-  8570: 'xi',
-  8571: 'xii',
-  8572: 'l',
-  8573: 'c',
-  8574: 'd',
-  8575: 'm',
-  8592: '<-',
-  8593: '^',
-  8594: '->',
-  8595: 'v',
-  8596: '<->',
-  8656: '<=',
-  8658: '=>',
-  8660: '<=>',
-  8722: '–',
-  8725: '/',
-  8726: '\\',
-  8727: '*',
-  8728: 'o',
-  8729: '·',
-  8734: 'inf',
-  8739: '|',
-  8741: '||',
-  8758: ':',
-  8764: '~',
-  8800: '/=',
-  8801: '=',
-  8804: '<=',
-  8805: '>=',
-  8810: '<<',
-  8811: '>>',
-  8853: '(+)',
-  8854: '(-)',
-  8855: '(x)',
-  8856: '(/)',
-  8866: '|-',
-  8867: '-|',
-  8870: '|-',
-  8871: '|=',
-  8872: '|=',
-  8873: '||-',
-  8901: '·',
-  8902: '*',
-  8917: '#',
-  8920: '<<<',
-  8921: '>>>',
-  8943: '...',
-  9001: '<',
-  9002: '>',
-  9216: 'NUL',
-  9217: 'SOH',
-  9218: 'STX',
-  9219: 'ETX',
-  9220: 'EOT',
-  9221: 'ENQ',
-  9222: 'ACK',
-  9223: 'BEL',
-  9224: 'BS',
-  9225: 'HT',
-  9226: 'LF',
-  9227: 'VT',
-  9228: 'FF',
-  9229: 'CR',
-  9230: 'SO',
-  9231: 'SI',
-  9232: 'DLE',
-  9233: 'DC1',
-  9234: 'DC2',
-  9235: 'DC3',
-  9236: 'DC4',
-  9237: 'NAK',
-  9238: 'SYN',
-  9239: 'ETB',
-  9240: 'CAN',
-  9241: 'EM',
-  9242: 'SUB',
-  9243: 'ESC',
-  9244: 'FS',
-  9245: 'GS',
-  9246: 'RS',
-  9247: 'US',
-  9248: 'SP',
-  9249: 'DEL',
-  9251: '_',
-  9252: 'NL',
-  9253: '///',
-  9254: '?',
-  9312: '(1)',
-  9313: '(2)',
-  9314: '(3)',
-  9315: '(4)',
-  9316: '(5)',
-  9317: '(6)',
-  9318: '(7)',
-  9319: '(8)',
-  9320: '(9)',
-  9321: '(10)',
-  9322: '(11)',
-  9323: '(12)',
-  9324: '(13)',
-  9325: '(14)',
-  9326: '(15)',
-  9327: '(16)',
-  9328: '(17)',
-  9329: '(18)',
-  9330: '(19)',
-  9331: '(20)',
-  9332: '(1)',
-  9333: '(2)',
-  9334: '(3)',
-  9335: '(4)',
-  9336: '(5)',
-  9337: '(6)',
-  9338: '(7)',
-  9339: '(8)',
-  9340: '(9)',
-  9341: '(10)',
-  9342: '(11)',
-  9343: '(12)',
-  9344: '(13)',
-  9345: '(14)',
-  9346: '(15)',
-  9347: '(16)',
-  9348: '(17)',
-  9349: '(18)',
-  9350: '(19)',
-  9351: '(20)',
-  9352: '1.',
-  9353: '2.',
-  9354: '3.',
-  9355: '4.',
-  9356: '5.',
-  9357: '6.',
-  9358: '7.',
-  9359: '8.',
-  9360: '9.',
-  9361: '10.',
-  9362: '11.',
-  9363: '12.',
-  9364: '13.',
-  9365: '14.',
-  9366: '15.',
-  9367: '16.',
-  9368: '17.',
-  9369: '18.',
-  9370: '19.',
-  9371: '20.',
-  9372: '(a)',
-  9373: '(b)',
-  9374: '(c)',
-  9375: '(d)',
-  9376: '(e)',
-  9377: '(f)',
-  9378: '(g)',
-  9379: '(h)',
-  9380: '(i)',
-  9381: '(j)',
-  9382: '(k)',
-  9383: '(l)',
-  9384: '(m)',
-  9385: '(n)',
-  9386: '(o)',
-  9387: '(p)',
-  9388: '(q)',
-  9389: '(r)',
-  9390: '(s)',
-  9391: '(t)',
-  9392: '(u)',
-  9393: '(v)',
-  9394: '(w)',
-  9395: '(x)',
-  9396: '(y)',
-  9397: '(z)',
-  9398: '(A)',
-  9399: '(B)',
-  9400: '(C)',
-  9401: '(D)',
-  9402: '(E)',
-  9403: '(F)',
-  9404: '(G)',
-  9405: '(H)',
-  9406: '(I)',
-  9407: '(J)',
-  9408: '(K)',
-  9409: '(L)',
-  9410: '(M)',
-  9411: '(N)',
-  9412: '(O)',
-  9413: '(P)',
-  9414: '(Q)',
-  9415: '(R)',
-  9416: '(S)',
-  9417: '(T)',
-  9418: '(U)',
-  9419: '(V)',
-  9420: '(W)',
-  9421: '(X)',
-  9422: '(Y)',
-  9423: '(Z)',
-  9424: '(a)',
-  9425: '(b)',
-  9426: '(c)',
-  9427: '(d)',
-  9428: '(e)',
-  9429: '(f)',
-  9430: '(g)',
-  9431: '(h)',
-  9432: '(i)',
-  9433: '(j)',
-  9434: '(k)',
-  9435: '(l)',
-  9436: '(m)',
-  9437: '(n)',
-  9438: '(o)',
-  9439: '(p)',
-  9440: '(q)',
-  9441: '(r)',
-  9442: '(s)',
-  9443: '(t)',
-  9444: '(u)',
-  9445: '(v)',
-  9446: '(w)',
-  9447: '(x)',
-  9448: '(y)',
-  9449: '(z)',
-  9450: '(0)',
-  9472: '-',
-  9473: '=',
-  9474: '|',
-  9475: '|',
-  9476: '-',
-  9477: '=',
-  9478: '|',
-  9479: '|',
-  9480: '-',
-  9481: '=',
-  9482: '|',
-  9483: '|',
-  9484: '+',
-  9485: '+',
-  9486: '+',
-  9487: '+',
-  9488: '+',
-  9489: '+',
-  9490: '+',
-  9491: '+',
-  9492: '+',
-  9493: '+',
-  9494: '+',
-  9495: '+',
-  9496: '+',
-  9497: '+',
-  9498: '+',
-  9499: '+',
-  9500: '+',
-  9501: '+',
-  9502: '+',
-  9503: '+',
-  9504: '+',
-  9505: '+',
-  9506: '+',
-  9507: '+',
-  9508: '+',
-  9509: '+',
-  9510: '+',
-  9511: '+',
-  9512: '+',
-  9513: '+',
-  9514: '+',
-  9515: '+',
-  9516: '+',
-  9517: '+',
-  9518: '+',
-  9519: '+',
-  9520: '+',
-  9521: '+',
-  9522: '+',
-  9523: '+',
-  9524: '+',
-  9525: '+',
-  9526: '+',
-  9527: '+',
-  9528: '+',
-  9529: '+',
-  9530: '+',
-  9531: '+',
-  9532: '+',
-  9533: '+',
-  9534: '+',
-  9535: '+',
-  9536: '+',
-  9537: '+',
-  9538: '+',
-  9539: '+',
-  9540: '+',
-  9541: '+',
-  9542: '+',
-  9543: '+',
-  9544: '+',
-  9545: '+',
-  9546: '+',
-  9547: '+',
-  9548: '-',
-  9549: '=',
-  9550: '|',
-  9551: '|',
-  9552: '=',
-  9553: '|',
-  9554: '+',
-  9555: '+',
-  9556: '+',
-  9557: '+',
-  9558: '+',
-  9559: '+',
-  9560: '+',
-  9561: '+',
-  9562: '+',
-  9563: '+',
-  9564: '+',
-  9565: '+',
-  9566: '+',
-  9567: '+',
-  9568: '+',
-  9569: '+',
-  9570: '+',
-  9571: '+',
-  9572: '+',
-  9573: '+',
-  9574: '+',
-  9575: '+',
-  9576: '+',
-  9577: '+',
-  9578: '+',
-  9579: '+',
-  9580: '+',
-  9581: '+',
-  9582: '+',
-  9583: '+',
-  9584: '+',
-  9585: '/',
-  9586: '\\',
-  9587: 'X',
-  9596: '-',
-  9597: '|',
-  9598: '-',
-  9599: '|',
-  9675: 'o',
-  9702: 'o',
-  9733: '*',
-  9734: '*',
-  9746: 'X',
-  9747: 'X',
-  9785: ':-(',
-  9786: ':-)',
-  9787: '(-:',
-  9837: 'b',
-  9839: '#',
-  9985: '%<',
-  9986: '%<',
-  9987: '%<',
-  9988: '%<',
-  9996: 'V',
-  10003: '√',
-  10004: '√',
-  10005: 'x',
-  10006: 'x',
-  10007: 'X',
-  10008: 'X',
-  10009: '+',
-  10010: '+',
-  10011: '+',
-  10012: '+',
-  10013: '+',
-  10014: '+',
-  10015: '+',
-  10016: '+',
-  10017: '*',
-  10018: '+',
-  10019: '+',
-  10020: '+',
-  10021: '+',
-  10022: '+',
-  10023: '+',
-  10025: '*',
-  10026: '*',
-  10027: '*',
-  10028: '*',
-  10029: '*',
-  10030: '*',
-  10031: '*',
-  10032: '*',
-  10033: '*',
-  10034: '*',
-  10035: '*',
-  10036: '*',
-  10037: '*',
-  10038: '*',
-  10039: '*',
-  10040: '*',
-  10041: '*',
-  10042: '*',
-  10043: '*',
-  10044: '*',
-  10045: '*',
-  10046: '*',
-  10047: '*',
-  10048: '*',
-  10049: '*',
-  10050: '*',
-  10051: '*',
-  10052: '*',
-  10053: '*',
-  10054: '*',
-  10055: '*',
-  10056: '*',
-  10057: '*',
-  10058: '*',
-  10059: '*',
-  64256: 'ff',
-  64257: 'fi',
-  64258: 'fl',
-  64259: 'ffi',
-  64260: 'ffl',
-  64261: 'ſt',
-  64262: 'st',
-  65279: '',
-  65533: '?',
-}
 
-short_table = {
-  160: ' ',
-  161: '!',
-  162: 'c',
-  163: 'GBP',
-  165: 'Y',
-  166: '|',
-  167: 'S',
-  168: '"',
-  169: 'c',
-  170: 'a',
-  171: '<<',
-  172: '-',
-  173: '-',
-  174: '(R)',
-  175: '-',
-  176: ' ',
-  177: '+/-',
-  178: '2',
-  179: '3',
-  180: "'",
-  181: 'u',
-  182: 'P',
-  183: '.',
-  184: ',',
-  185: '1',
-  186: 'o',
-  187: '>>',
-  188: ' 1/4',
-  189: ' 1/2',
-  190: ' 3/4',
-  191: '?',
-  192: 'A',
-  193: 'A',
-  194: 'A',
-  195: 'A',
-  196: 'A',
-  197: 'A',
-  198: 'A',
-  199: 'C',
-  200: 'E',
-  201: 'E',
-  202: 'E',
-  203: 'E',
-  204: 'I',
-  205: 'I',
-  206: 'I',
-  207: 'I',
-  208: 'D',
-  209: 'N',
-  210: 'O',
-  211: 'O',
-  212: 'O',
-  213: 'O',
-  214: 'O',
-  215: 'x',
-  216: 'O',
-  217: 'U',
-  218: 'U',
-  219: 'U',
-  220: 'U',
-  221: 'Y',
-  222: 'Th',
-  223: 'ss',
-  224: 'a',
-  225: 'a',
-  226: 'a',
-  227: 'a',
-  228: 'a',
-  229: 'a',
-  230: 'a',
-  231: 'c',
-  232: 'e',
-  233: 'e',
-  234: 'e',
-  235: 'e',
-  236: 'i',
-  237: 'i',
-  238: 'i',
-  239: 'i',
-  240: 'd',
-  241: 'n',
-  242: 'o',
-  243: 'o',
-  244: 'o',
-  245: 'o',
-  246: 'o',
-  247: ':',
-  248: 'o',
-  249: 'u',
-  250: 'u',
-  251: 'u',
-  252: 'u',
-  253: 'y',
-  254: 'th',
-  255: 'y',
-  256: 'A',
-  257: 'a',
-  258: 'A',
-  259: 'a',
-  260: 'A',
-  261: 'a',
-  262: 'C',
-  263: 'c',
-  264: 'C',
-  265: 'c',
-  266: 'C',
-  267: 'c',
-  268: 'C',
-  269: 'c',
-  270: 'D',
-  271: 'd',
-  272: 'D',
-  273: 'd',
-  274: 'E',
-  275: 'e',
-  276: 'E',
-  277: 'e',
-  278: 'E',
-  279: 'e',
-  280: 'E',
-  281: 'e',
-  282: 'E',
-  283: 'e',
-  284: 'G',
-  285: 'g',
-  286: 'G',
-  287: 'g',
-  288: 'G',
-  289: 'g',
-  290: 'G',
-  291: 'g',
-  292: 'H',
-  293: 'h',
-  294: 'H',
-  295: 'h',
-  296: 'I',
-  297: 'i',
-  298: 'I',
-  299: 'i',
-  300: 'I',
-  301: 'i',
-  302: 'I',
-  303: 'i',
-  304: 'I',
-  305: 'i',
-  306: 'IJ',
-  307: 'ij',
-  308: 'J',
-  309: 'j',
-  310: 'K',
-  311: 'k',
-  312: 'k',
-  313: 'L',
-  314: 'l',
-  315: 'L',
-  316: 'l',
-  317: 'L',
-  318: 'l',
-  319: 'L.',
-  320: 'l.',
-  321: 'L',
-  322: 'l',
-  323: 'N',
-  324: 'n',
-  325: 'N',
-  326: 'n',
-  327: 'N',
-  328: 'n',
-  329: "'n",
-  330: 'N',
-  331: 'n',
-  332: 'O',
-  333: 'o',
-  334: 'O',
-  335: 'o',
-  336: 'O',
-  337: 'o',
-  338: 'OE',
-  339: 'oe',
-  340: 'R',
-  341: 'r',
-  342: 'R',
-  343: 'r',
-  344: 'R',
-  345: 'r',
-  346: 'S',
-  347: 's',
-  348: 'S',
-  349: 's',
-  350: 'S',
-  351: 's',
-  352: 'S',
-  353: 's',
-  354: 'T',
-  355: 't',
-  356: 'T',
-  357: 't',
-  358: 'T',
-  359: 't',
-  360: 'U',
-  361: 'u',
-  362: 'U',
-  363: 'u',
-  364: 'U',
-  365: 'u',
-  366: 'U',
-  367: 'u',
-  368: 'U',
-  369: 'u',
-  370: 'U',
-  371: 'u',
-  372: 'W',
-  373: 'w',
-  374: 'Y',
-  375: 'y',
-  376: 'Y',
-  377: 'Z',
-  378: 'z',
-  379: 'Z',
-  380: 'z',
-  381: 'Z',
-  382: 'z',
-  383: 's',
-  402: 'f',
-  416: 'O',
-  417: 'o',
-  431: 'U',
-  432: 'u',
-  536: 'S',
-  537: 's',
-  538: 'T',
-  539: 't',
-  697: "'",
-  699: '‘',
-  700: "'",
-  701: '‛',
-  710: '^',
-  712: "'",
-  713: '¯',
-  716: ',',
-  720: ':',
-  730: '°',
-  732: '~',
-  733: '"',
-  884: "'",
-  885: ',',
-  894: ';',
-  7682: 'B',
-  7683: 'b',
-  7690: 'D',
-  7691: 'd',
-  7710: 'F',
-  7711: 'f',
-  7744: 'M',
-  7745: 'm',
-  7766: 'P',
-  7767: 'p',
-  7776: 'S',
-  7777: 's',
-  7786: 'T',
-  7787: 't',
-  7808: 'W',
-  7809: 'w',
-  7810: 'W',
-  7811: 'w',
-  7812: 'W',
-  7813: 'w',
-  7918: 'U',
-  7919: 'u',
-  7922: 'Y',
-  7923: 'y',
-  8192: ' ',
-  8193: '  ',
-  8194: ' ',
-  8195: '  ',
-  8196: ' ',
-  8197: ' ',
-  8198: ' ',
-  8199: ' ',
-  8200: ' ',
-  8201: ' ',
-  8202: '',
-  8203: '',
-  8204: '',
-  8205: '',
-  8206: '',
-  8207: '',
-  8208: '-',
-  8209: '-',
-  8210: '-',
-  8211: '-',
-  8212: '--',
-  8213: '--',
-  8214: '||',
-  8215: '_',
-  8216: "'",
-  8217: "'",
-  8218: "'",
-  8219: "'",
-  8220: '"',
-  8221: '"',
-  8222: '"',
-  8223: '"',
-  8224: '+',
-  8225: '++',
-  8226: 'o',
-  8227: '>',
-  8228: '.',
-  8229: '..',
-  8230: '...',
-  8231: '-',
-  8234: '',
-  8235: '',
-  8236: '',
-  8237: '',
-  8238: '',
-  8239: ' ',
-  8240: ' 0/00',
-  8242: "'",
-  8243: '"',
-  8244: "'''",
-  8245: '`',
-  8246: '``',
-  8247: '```',
-  8249: '<',
-  8250: '>',
-  8252: '!!',
-  8254: '-',
-  8259: '-',
-  8260: '/',
-  8264: '?!',
-  8265: '!?',
-  8266: '7',
-  8304: '0',
-  8308: '4',
-  8309: '5',
-  8310: '6',
-  8311: '7',
-  8312: '8',
-  8313: '9',
-  8314: '+',
-  8315: '-',
-  8316: '=',
-  8317: '(',
-  8318: ')',
-  8319: 'n',
-  8320: '0',
-  8321: '1',
-  8322: '2',
-  8323: '3',
-  8324: '4',
-  8325: '5',
-  8326: '6',
-  8327: '7',
-  8328: '8',
-  8329: '9',
-  8330: '+',
-  8331: '-',
-  8332: '=',
-  8333: '(',
-  8334: ')',
-  8364: 'E',
-  8448: 'a/c',
-  8449: 'a/s',
-  8451: 'C',
-  8453: 'c/o',
-  8454: 'c/u',
-  8457: 'F',
-  8467: 'l',
-  8470: 'No',
-  8471: '(P)',
-  8480: '[SM]',
-  8481: 'TEL',
-  8482: '[TM]',
-  8486: 'ohm',
-  8490: 'K',
-  8491: 'Å',
-  8494: 'e',
-  8531: ' 1/3',
-  8532: ' 2/3',
-  8533: ' 1/5',
-  8534: ' 2/5',
-  8535: ' 3/5',
-  8536: ' 4/5',
-  8537: ' 1/6',
-  8538: ' 5/6',
-  8539: ' 1/8',
-  8540: ' 3/8',
-  8541: ' 5/8',
-  8542: ' 7/8',
-  8543: ' 1/',
-  8544: 'I',
-  8545: 'II',
-  8546: 'III',
-  8547: 'IV',
-  8548: 'V',
-  8549: 'VI',
-  8550: 'VII',
-  8551: 'VIII',
-  8552: 'IX',
-  8553: 'X',
-  8554: 'XI',
-  8555: 'XII',
-  8556: 'L',
-  8557: 'C',
-  8558: 'D',
-  8559: 'M',
-  8560: 'i',
-  8561: 'ii',
-  8562: 'iii',
-  8563: 'iv',
-  8564: 'v',
-  8565: 'vi',
-  8566: 'vii',
-  8567: 'viii',
-  8568: 'ix',
-  8569: 'x',
-  8570: 'xi',
-  8571: 'xii',
-  8572: 'l',
-  8573: 'c',
-  8574: 'd',
-  8575: 'm',
-  8592: '<-',
-  8593: '^',
-  8594: '->',
-  8595: 'v',
-  8596: '<->',
-  8656: '<=',
-  8658: '=>',
-  8660: '<=>',
-  8722: '-',
-  8725: '/',
-  8726: '\\',
-  8727: '*',
-  8728: 'o',
-  8729: '·',
-  8734: 'inf',
-  8739: '|',
-  8741: '||',
-  8758: ':',
-  8764: '~',
-  8800: '/=',
-  8801: '=',
-  8804: '<=',
-  8805: '>=',
-  8810: '<<',
-  8811: '>>',
-  8853: '(+)',
-  8854: '(-)',
-  8855: '(x)',
-  8856: '(/)',
-  8866: '|-',
-  8867: '-|',
-  8870: '|-',
-  8871: '|=',
-  8872: '|=',
-  8873: '||-',
-  8901: '·',
-  8902: '*',
-  8917: '#',
-  8920: '<<<',
-  8921: '>>>',
-  8943: '...',
-  9001: '<',
-  9002: '>',
-  9216: 'NUL',
-  9217: 'SOH',
-  9218: 'STX',
-  9219: 'ETX',
-  9220: 'EOT',
-  9221: 'ENQ',
-  9222: 'ACK',
-  9223: 'BEL',
-  9224: 'BS',
-  9225: 'HT',
-  9226: 'LF',
-  9227: 'VT',
-  9228: 'FF',
-  9229: 'CR',
-  9230: 'SO',
-  9231: 'SI',
-  9232: 'DLE',
-  9233: 'DC1',
-  9234: 'DC2',
-  9235: 'DC3',
-  9236: 'DC4',
-  9237: 'NAK',
-  9238: 'SYN',
-  9239: 'ETB',
-  9240: 'CAN',
-  9241: 'EM',
-  9242: 'SUB',
-  9243: 'ESC',
-  9244: 'FS',
-  9245: 'GS',
-  9246: 'RS',
-  9247: 'US',
-  9248: 'SP',
-  9249: 'DEL',
-  9251: '_',
-  9252: 'NL',
-  9253: '///',
-  9254: '?',
-  9312: '1',
-  9313: '2',
-  9314: '3',
-  9315: '4',
-  9316: '5',
-  9317: '6',
-  9318: '7',
-  9319: '8',
-  9320: '9',
-  9321: '(10)',
-  9322: '(11)',
-  9323: '(12)',
-  9324: '(13)',
-  9325: '(14)',
-  9326: '(15)',
-  9327: '(16)',
-  9328: '(17)',
-  9329: '(18)',
-  9330: '(19)',
-  9331: '(20)',
-  9332: '1',
-  9333: '2',
-  9334: '3',
-  9335: '4',
-  9336: '5',
-  9337: '6',
-  9338: '7',
-  9339: '8',
-  9340: '9',
-  9341: '(10)',
-  9342: '(11)',
-  9343: '(12)',
-  9344: '(13)',
-  9345: '(14)',
-  9346: '(15)',
-  9347: '(16)',
-  9348: '(17)',
-  9349: '(18)',
-  9350: '(19)',
-  9351: '(20)',
-  9352: '1',
-  9353: '2',
-  9354: '3',
-  9355: '4',
-  9356: '5',
-  9357: '6',
-  9358: '7',
-  9359: '8',
-  9360: '9',
-  9361: '10.',
-  9362: '11.',
-  9363: '12.',
-  9364: '13.',
-  9365: '14.',
-  9366: '15.',
-  9367: '16.',
-  9368: '17.',
-  9369: '18.',
-  9370: '19.',
-  9371: '20.',
-  9372: 'a',
-  9373: 'b',
-  9374: 'c',
-  9375: 'd',
-  9376: 'e',
-  9377: 'f',
-  9378: 'g',
-  9379: 'h',
-  9380: 'i',
-  9381: 'j',
-  9382: 'k',
-  9383: 'l',
-  9384: 'm',
-  9385: 'n',
-  9386: 'o',
-  9387: 'p',
-  9388: 'q',
-  9389: 'r',
-  9390: 's',
-  9391: 't',
-  9392: 'u',
-  9393: 'v',
-  9394: 'w',
-  9395: 'x',
-  9396: 'y',
-  9397: 'z',
-  9398: 'A',
-  9399: 'B',
-  9400: 'C',
-  9401: 'D',
-  9402: 'E',
-  9403: 'F',
-  9404: 'G',
-  9405: 'H',
-  9406: 'I',
-  9407: 'J',
-  9408: 'K',
-  9409: 'L',
-  9410: 'M',
-  9411: 'N',
-  9412: 'O',
-  9413: 'P',
-  9414: 'Q',
-  9415: 'R',
-  9416: 'S',
-  9417: 'T',
-  9418: 'U',
-  9419: 'V',
-  9420: 'W',
-  9421: 'X',
-  9422: 'Y',
-  9423: 'Z',
-  9424: 'a',
-  9425: 'b',
-  9426: 'c',
-  9427: 'd',
-  9428: 'e',
-  9429: 'f',
-  9430: 'g',
-  9431: 'h',
-  9432: 'i',
-  9433: 'j',
-  9434: 'k',
-  9435: 'l',
-  9436: 'm',
-  9437: 'n',
-  9438: 'o',
-  9439: 'p',
-  9440: 'q',
-  9441: 'r',
-  9442: 's',
-  9443: 't',
-  9444: 'u',
-  9445: 'v',
-  9446: 'w',
-  9447: 'x',
-  9448: 'y',
-  9449: 'z',
-  9450: '0',
-  9472: '-',
-  9473: '=',
-  9474: '|',
-  9475: '|',
-  9476: '-',
-  9477: '=',
-  9478: '|',
-  9479: '|',
-  9480: '-',
-  9481: '=',
-  9482: '|',
-  9483: '|',
-  9484: '+',
-  9485: '+',
-  9486: '+',
-  9487: '+',
-  9488: '+',
-  9489: '+',
-  9490: '+',
-  9491: '+',
-  9492: '+',
-  9493: '+',
-  9494: '+',
-  9495: '+',
-  9496: '+',
-  9497: '+',
-  9498: '+',
-  9499: '+',
-  9500: '+',
-  9501: '+',
-  9502: '+',
-  9503: '+',
-  9504: '+',
-  9505: '+',
-  9506: '+',
-  9507: '+',
-  9508: '+',
-  9509: '+',
-  9510: '+',
-  9511: '+',
-  9512: '+',
-  9513: '+',
-  9514: '+',
-  9515: '+',
-  9516: '+',
-  9517: '+',
-  9518: '+',
-  9519: '+',
-  9520: '+',
-  9521: '+',
-  9522: '+',
-  9523: '+',
-  9524: '+',
-  9525: '+',
-  9526: '+',
-  9527: '+',
-  9528: '+',
-  9529: '+',
-  9530: '+',
-  9531: '+',
-  9532: '+',
-  9533: '+',
-  9534: '+',
-  9535: '+',
-  9536: '+',
-  9537: '+',
-  9538: '+',
-  9539: '+',
-  9540: '+',
-  9541: '+',
-  9542: '+',
-  9543: '+',
-  9544: '+',
-  9545: '+',
-  9546: '+',
-  9547: '+',
-  9548: '-',
-  9549: '=',
-  9550: '|',
-  9551: '|',
-  9552: '=',
-  9553: '|',
-  9554: '+',
-  9555: '+',
-  9556: '+',
-  9557: '+',
-  9558: '+',
-  9559: '+',
-  9560: '+',
-  9561: '+',
-  9562: '+',
-  9563: '+',
-  9564: '+',
-  9565: '+',
-  9566: '+',
-  9567: '+',
-  9568: '+',
-  9569: '+',
-  9570: '+',
-  9571: '+',
-  9572: '+',
-  9573: '+',
-  9574: '+',
-  9575: '+',
-  9576: '+',
-  9577: '+',
-  9578: '+',
-  9579: '+',
-  9580: '+',
-  9581: '+',
-  9582: '+',
-  9583: '+',
-  9584: '+',
-  9585: '/',
-  9586: '\\',
-  9587: 'X',
-  9596: '-',
-  9597: '|',
-  9598: '-',
-  9599: '|',
-  9675: 'o',
-  9702: 'o',
-  9733: '*',
-  9734: '*',
-  9746: 'X',
-  9747: 'X',
-  9785: ':-(',
-  9786: ':-)',
-  9787: '(-:',
-  9837: 'b',
-  9839: '#',
-  9985: '%<',
-  9986: '%<',
-  9987: '%<',
-  9988: '%<',
-  9996: 'V',
-  10003: '√',
-  10004: '√',
-  10005: 'x',
-  10006: 'x',
-  10007: 'X',
-  10008: 'X',
-  10009: '+',
-  10010: '+',
-  10011: '+',
-  10012: '+',
-  10013: '+',
-  10014: '+',
-  10015: '+',
-  10016: '+',
-  10017: '*',
-  10018: '+',
-  10019: '+',
-  10020: '+',
-  10021: '+',
-  10022: '+',
-  10023: '+',
-  10025: '*',
-  10026: '*',
-  10027: '*',
-  10028: '*',
-  10029: '*',
-  10030: '*',
-  10031: '*',
-  10032: '*',
-  10033: '*',
-  10034: '*',
-  10035: '*',
-  10036: '*',
-  10037: '*',
-  10038: '*',
-  10039: '*',
-  10040: '*',
-  10041: '*',
-  10042: '*',
-  10043: '*',
-  10044: '*',
-  10045: '*',
-  10046: '*',
-  10047: '*',
-  10048: '*',
-  10049: '*',
-  10050: '*',
-  10051: '*',
-  10052: '*',
-  10053: '*',
-  10054: '*',
-  10055: '*',
-  10056: '*',
-  10057: '*',
-  10058: '*',
-  10059: '*',
-  64256: 'ff',
-  64257: 'fi',
-  64258: 'fl',
-  64259: 'ffi',
-  64260: 'ffl',
-  64261: 'st',
-  64262: 'st',
-  65279: '',
-  65533: '?',
-}
+# Number of characters transliterate_file() reads at a time.
+_FILE_CHUNK_SIZE = 1 << 20
 
-single_table = {
-  160: ' ',
-  161: '!',
-  162: 'c',
-  165: 'Y',
-  166: '|',
-  167: 'S',
-  168: '"',
-  169: 'c',
-  170: 'a',
-  172: '-',
-  173: '-',
-  175: '-',
-  176: ' ',
-  178: '2',
-  179: '3',
-  180: "'",
-  181: 'u',
-  182: 'P',
-  183: '.',
-  184: ',',
-  185: '1',
-  186: 'o',
-  191: '?',
-  192: 'A',
-  193: 'A',
-  194: 'A',
-  195: 'A',
-  196: 'A',
-  197: 'A',
-  198: 'A',
-  199: 'C',
-  200: 'E',
-  201: 'E',
-  202: 'E',
-  203: 'E',
-  204: 'I',
-  205: 'I',
-  206: 'I',
-  207: 'I',
-  208: 'D',
-  209: 'N',
-  210: 'O',
-  211: 'O',
-  212: 'O',
-  213: 'O',
-  214: 'O',
-  215: 'x',
-  216: 'O',
-  217: 'U',
-  218: 'U',
-  219: 'U',
-  220: 'U',
-  221: 'Y',
-  223: 's',
-  224: 'a',
-  225: 'a',
-  226: 'a',
-  227: 'a',
-  228: 'a',
-  229: 'a',
-  230: 'a',
-  231: 'c',
-  232: 'e',
-  233: 'e',
-  234: 'e',
-  235: 'e',
-  236: 'i',
-  237: 'i',
-  238: 'i',
-  239: 'i',
-  240: 'd',
-  241: 'n',
-  242: 'o',
-  243: 'o',
-  244: 'o',
-  245: 'o',
-  246: 'o',
-  247: ':',
-  248: 'o',
-  249: 'u',
-  250: 'u',
-  251: 'u',
-  252: 'u',
-  253: 'y',
-  255: 'y',
-  256: 'A',
-  257: 'a',
-  258: 'A',
-  259: 'a',
-  260: 'A',
-  261: 'a',
-  262: 'C',
-  263: 'c',
-  264: 'C',
-  265: 'c',
-  266: 'C',
-  267: 'c',
-  268: 'C',
-  269: 'c',
-  270: 'D',
-  271: 'd',
-  272: 'D',
-  273: 'd',
-  274: 'E',
-  275: 'e',
-  276: 'E',
-  277: 'e',
-  278: 'E',
-  279: 'e',
-  280: 'E',
-  281: 'e',
-  282: 'E',
-  283: 'e',
-  284: 'G',
-  285: 'g',
-  286: 'G',
-  287: 'g',
-  288: 'G',
-  289: 'g',
-  290: 'G',
-  291: 'g',
-  292: 'H',
-  293: 'h',
-  294: 'H',
-  295: 'h',
-  296: 'I',
-  297: 'i',
-  298: 'I',
-  299: 'i',
-  300: 'I',
-  301: 'i',
-  302: 'I',
-  303: 'i',
-  304: 'I',
-  305: 'i',
-  308: 'J',
-  309: 'j',
-  310: 'K',
-  311: 'k',
-  312: 'k',
-  313: 'L',
-  314: 'l',
-  315: 'L',
-  316: 'l',
-  317: 'L',
-  318: 'l',
-  321: 'L',
-  322: 'l',
-  323: 'N',
-  324: 'n',
-  325: 'N',
-  326: 'n',
-  327: 'N',
-  328: 'n',
-  330: 'N',
-  331: 'n',
-  332: 'O',
-  333: 'o',
-  334: 'O',
-  335: 'o',
-  336: 'O',
-  337: 'o',
-  340: 'R',
-  341: 'r',
-  342: 'R',
-  343: 'r',
-  344: 'R',
-  345: 'r',
-  346: 'S',
-  347: 's',
-  348: 'S',
-  349: 's',
-  350: 'S',
-  351: 's',
-  352: 'S',
-  353: 's',
-  354: 'T',
-  355: 't',
-  356: 'T',
-  357: 't',
-  358: 'T',
-  359: 't',
-  360: 'U',
-  361: 'u',
-  362: 'U',
-  363: 'u',
-  364: 'U',
-  365: 'u',
-  366: 'U',
-  367: 'u',
-  368: 'U',
-  369: 'u',
-  370: 'U',
-  371: 'u',
-  372: 'W',
-  373: 'w',
-  374: 'Y',
-  375: 'y',
-  376: 'Y',
-  377: 'Z',
-  378: 'z',
-  379: 'Z',
-  380: 'z',
-  381: 'Z',
-  382: 'z',
-  383: 's',
-  402: 'f',
-  416: 'O',
-  417: 'o',
-  431: 'U',
-  432: 'u',
-  536: 'S',
-  537: 's',
-  538: 'T',
-  539: 't',
-  697: "'",
-  699: '‘',
-  700: "'",
-  701: '‛',
-  710: '^',
-  712: "'",
-  713: '¯',
-  716: ',',
-  720: ':',
-  730: '°',
-  732: '~',
-  733: '"',
-  884: "'",
-  885: ',',
-  894: ';',
-  7682: 'B',
-  7683: 'b',
-  7690: 'D',
-  7691: 'd',
-  7710: 'F',
-  7711: 'f',
-  7744: 'M',
-  7745: 'm',
-  7766: 'P',
-  7767: 'p',
-  7776: 'S',
-  7777: 's',
-  7786: 'T',
-  7787: 't',
-  7808: 'W',
-  7809: 'w',
-  7810: 'W',
-  7811: 'w',
-  7812: 'W',
-  7813: 'w',
-  7918: 'U',
-  7919: 'u',
-  7922: 'Y',
-  7923: 'y',
-  8192: ' ',
-  8194: ' ',
-  8196: ' ',
-  8197: ' ',
-  8198: ' ',
-  8199: ' ',
-  8200: ' ',
-  8201: ' ',
-  8208: '-',
-  8209: '-',
-  8210: '-',
-  8211: '-',
-  8215: '_',
-  8216: "'",
-  8217: "'",
-  8218: "'",
-  8219: "'",
-  8220: '"',
-  8221: '"',
-  8222: '"',
-  8223: '"',
-  8224: '+',
-  8226: 'o',
-  8227: '>',
-  8228: '.',
-  8231: '-',
-  8239: ' ',
-  8242: "'",
-  8243: '"',
-  8245: '`',
-  8249: '<',
-  8250: '>',
-  8254: '-',
-  8259: '-',
-  8260: '/',
-  8266: '7',
-  8304: '0',
-  8308: '4',
-  8309: '5',
-  8310: '6',
-  8311: '7',
-  8312: '8',
-  8313: '9',
-  8314: '+',
-  8315: '-',
-  8316: '=',
-  8317: '(',
-  8318: ')',
-  8319: 'n',
-  8320: '0',
-  8321: '1',
-  8322: '2',
-  8323: '3',
-  8324: '4',
-  8325: '5',
-  8326: '6',
-  8327: '7',
-  8328: '8',
-  8329: '9',
-  8330: '+',
-  8331: '-',
-  8332: '=',
-  8333: '(',
-  8334: ')',
-  8364: 'E',
-  8451: 'C',
-  8457: 'F',
-  8467: 'l',
-  8490: 'K',
-  8491: 'Å',
-  8494: 'e',
-  8544: 'I',
-  8548: 'V',
-  8553: 'X',
-  8556: 'L',
-  8557: 'C',
-  8558: 'D',
-  8559: 'M',
-  8560: 'i',
-  8564: 'v',
-  8569: 'x',
-  8572: 'l',
-  8573: 'c',
-  8574: 'd',
-  8575: 'm',
-  8593: '^',
-  8595: 'v',
-  8722: '-',
-  8725: '/',
-  8726: '\\',
-  8727: '*',
-  8728: 'o',
-  8729: '·',
-  8739: '|',
-  8758: ':',
-  8764: '~',
-  8801: '=',
-  8901: '·',
-  8902: '*',
-  8917: '#',
-  9001: '<',
-  9002: '>',
-  9251: '_',
-  9254: '?',
-  9312: '1',
-  9313: '2',
-  9314: '3',
-  9315: '4',
-  9316: '5',
-  9317: '6',
-  9318: '7',
-  9319: '8',
-  9320: '9',
-  9332: '1',
-  9333: '2',
-  9334: '3',
-  9335: '4',
-  9336: '5',
-  9337: '6',
-  9338: '7',
-  9339: '8',
-  9340: '9',
-  9352: '1',
-  9353: '2',
-  9354: '3',
-  9355: '4',
-  9356: '5',
-  9357: '6',
-  9358: '7',
-  9359: '8',
-  9360: '9',
-  9372: 'a',
-  9373: 'b',
-  9374: 'c',
-  9375: 'd',
-  9376: 'e',
-  9377: 'f',
-  9378: 'g',
-  9379: 'h',
-  9380: 'i',
-  9381: 'j',
-  9382: 'k',
-  9383: 'l',
-  9384: 'm',
-  9385: 'n',
-  9386: 'o',
-  9387: 'p',
-  9388: 'q',
-  9389: 'r',
-  9390: 's',
-  9391: 't',
-  9392: 'u',
-  9393: 'v',
-  9394: 'w',
-  9395: 'x',
-  9396: 'y',
-  9397: 'z',
-  9398: 'A',
-  9399: 'B',
-  9400: 'C',
-  9401: 'D',
-  9402: 'E',
-  9403: 'F',
-  9404: 'G',
-  9405: 'H',
-  9406: 'I',
-  9407: 'J',
-  9408: 'K',
-  9409: 'L',
-  9410: 'M',
-  9411: 'N',
-  9412: 'O',
-  9413: 'P',
-  9414: 'Q',
-  9415: 'R',
-  9416: 'S',
-  9417: 'T',
-  9418: 'U',
-  9419: 'V',
-  9420: 'W',
-  9421: 'X',
-  9422: 'Y',
-  9423: 'Z',
-  9424: 'a',
-  9425: 'b',
-  9426: 'c',
-  9427: 'd',
-  9428: 'e',
-  9429: 'f',
-  9430: 'g',
-  9431: 'h',
-  9432: 'i',
-  9433: 'j',
-  9434: 'k',
-  9435: 'l',
-  9436: 'm',
-  9437: 'n',
-  9438: 'o',
-  9439: 'p',
-  9440: 'q',
-  9441: 'r',
-  9442: 's',
-  9443: 't',
-  9444: 'u',
-  9445: 'v',
-  9446: 'w',
-  9447: 'x',
-  9448: 'y',
-  9449: 'z',
-  9450: '0',
-  9472: '-',
-  9473: '=',
-  9474: '|',
-  9475: '|',
-  9476: '-',
-  9477: '=',
-  9478: '|',
-  9479: '|',
-  9480: '-',
-  9481: '=',
-  9482: '|',
-  9483: '|',
-  9484: '+',
-  9485: '+',
-  9486: '+',
-  9487: '+',
-  9488: '+',
-  9489: '+',
-  9490: '+',
-  9491: '+',
-  9492: '+',
-  9493: '+',
-  9494: '+',
-  9495: '+',
-  9496: '+',
-  9497: '+',
-  9498: '+',
-  9499: '+',
-  9500: '+',
-  9501: '+',
-  9502: '+',
-  9503: '+',
-  9504: '+',
-  9505: '+',
-  9506: '+',
-  9507: '+',
-  9508: '+',
-  9509: '+',
-  9510: '+',
-  9511: '+',
-  9512: '+',
-  9513: '+',
-  9514: '+',
-  9515: '+',
-  9516: '+',
-  9517: '+',
-  9518: '+',
-  9519: '+',
-  9520: '+',
-  9521: '+',
-  9522: '+',
-  9523: '+',
-  9524: '+',
-  9525: '+',
-  9526: '+',
-  9527: '+',
-  9528: '+',
-  9529: '+',
-  9530: '+',
-  9531: '+',
-  9532: '+',
-  9533: '+',
-  9534: '+',
-  9535: '+',
-  9536: '+',
-  9537: '+',
-  9538: '+',
-  9539: '+',
-  9540: '+',
-  9541: '+',
-  9542: '+',
-  9543: '+',
-  9544: '+',
-  9545: '+',
-  9546: '+',
-  9547: '+',
-  9548: '-',
-  9549: '=',
-  9550: '|',
-  9551: '|',
-  9552: '=',
-  9553: '|',
-  9554: '+',
-  9555: '+',
-  9556: '+',
-  9557: '+',
-  9558: '+',
-  9559: '+',
-  9560: '+',
-  9561: '+',
-  9562: '+',
-  9563: '+',
-  9564: '+',
-  9565: '+',
-  9566: '+',
-  9567: '+',
-  9568: '+',
-  9569: '+',
-  9570: '+',
-  9571: '+',
-  9572: '+',
-  9573: '+',
-  9574: '+',
-  9575: '+',
-  9576: '+',
-  9577: '+',
-  9578: '+',
-  9579: '+',
-  9580: '+',
-  9581: '+',
-  9582: '+',
-  9583: '+',
-  9584: '+',
-  9585: '/',
-  9586: '\\',
-  9587: 'X',
-  9596: '-',
-  9597: '|',
-  9598: '-',
-  9599: '|',
-  9675: 'o',
-  9702: 'o',
-  9733: '*',
-  9734: '*',
-  9746: 'X',
-  9747: 'X',
-  9837: 'b',
-  9839: '#',
-  9996: 'V',
-  10003: '√',
-  10004: '√',
-  10005: 'x',
-  10006: 'x',
-  10007: 'X',
-  10008: 'X',
-  10009: '+',
-  10010: '+',
-  10011: '+',
-  10012: '+',
-  10013: '+',
-  10014: '+',
-  10015: '+',
-  10016: '+',
-  10017: '*',
-  10018: '+',
-  10019: '+',
-  10020: '+',
-  10021: '+',
-  10022: '+',
-  10023: '+',
-  10025: '*',
-  10026: '*',
-  10027: '*',
-  10028: '*',
-  10029: '*',
-  10030: '*',
-  10031: '*',
-  10032: '*',
-  10033: '*',
-  10034: '*',
-  10035: '*',
-  10036: '*',
-  10037: '*',
-  10038: '*',
-  10039: '*',
-  10040: '*',
-  10041: '*',
-  10042: '*',
-  10043: '*',
-  10044: '*',
-  10045: '*',
-  10046: '*',
-  10047: '*',
-  10048: '*',
-  10049: '*',
-  10050: '*',
-  10051: '*',
-  10052: '*',
-  10053: '*',
-  10054: '*',
-  10055: '*',
-  10056: '*',
-  10057: '*',
-  10058: '*',
-  10059: '*',
-  65533: '?',
-}
 
+def transliterate_file(src, dst, mode='long', target=None,
+                       chunk_size=_FILE_CHUNK_SIZE, errors='strict',
+                       encoding='utf-8'):
+    """Transliterate a text file chunk by chunk.
 
-### <
+    *src* and *dst* are paths or file objects.  Without *target* the
+    transliterated text is written, otherwise it is encoded to the
+    *target* byte encoding, like the 'translit/<mode>/<target>' codec.
+    Paths are opened with *encoding*, and a *dst* file object must be a
+    binary file when *target* is given.
+
+    At most one chunk of *chunk_size* characters and the few characters
+    held back at its end are kept in memory, and the output is the same as
+    transliterating the whole file at once.  Returns the number of
+    characters read.
+    """
+    codec = 'translit/%s' % mode if target is None else 'translit/%s/%s' % (mode, target)
+    encoder = codecs.getincrementalencoder(codec)(errors)
+    with contextlib.ExitStack() as stack:
+        if isinstance(src, (str, bytes, os.PathLike)):
+            src = stack.enter_context(open(src, encoding=encoding, newline=''))
+        if isinstance(dst, (str, bytes, os.PathLike)):
+            if target is None:
+                dst = stack.enter_context(open(dst, 'w', encoding=encoding, newline=''))
+            else:
+                dst = stack.enter_context(open(dst, 'wb'))
+        length = 0
+        # Characters that may combine with the next chunk, held back.
+        pending = ''
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                dst.write(encoder.encode(pending, final=True))
+                return length
+            length += len(chunk)
+            chunk = pending + chunk
+            end = _stream_split(chunk)
+            pending = chunk[end:]
+            dst.write(encoder.encode(chunk[:end]))
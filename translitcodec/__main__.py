@@ -0,0 +1,196 @@
+"""Transliterate files or the standard input to the standard output.
+
+    python -m translitcodec [-m MODE] [-t TARGET] [-e ERRORS] [FILE ...]
+    python -m translitcodec --tree SRC -o DST [--checkpoint FILE] [-j N]
+
+Compressed input is read transparently, and the output is compressed
+when written to a file named like ``out.txt.gz`` or with ``--compress``.
+With ``--tree``, every file under a directory is transliterated to
+another directory on a process pool.
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+
+"""
+import argparse
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import os
+import sys
+import time
+
+import translitcodec
+import translitcodec.parallel
+
+
+_compressions = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+
+_magic = [(b'\x1f\x8b', 'gzip'), (b'BZh', 'bz2'), (b'\xfd7zXZ\x00', 'xz')]
+
+_suffixes = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+
+class _CountingWriter:
+    """Forward writes to a binary file, counting the bytes."""
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return self.fh.write(data)
+
+
+def _positive(text):
+    """Parse a positive integer argument."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError('%r is not a positive integer' % text)
+    return value
+
+
+def _open_input(name, buffer_size, stack):
+    """Open a binary input, uncompressing it if it starts like a compressed file."""
+    if name == '-':
+        fh = sys.stdin.buffer
+    else:
+        fh = stack.enter_context(open(name, 'rb', buffering=buffer_size))
+    start = fh.peek(6)[:6]
+    for magic, compression in _magic:
+        if start.startswith(magic):
+            return stack.enter_context(_compressions[compression](fh, 'rb'))
+    return fh
+
+
+def _open_output(name, compression, buffer_size, stack):
+    if name == '-':
+        fh = sys.stdout.buffer
+    else:
+        fh = stack.enter_context(open(name, 'wb', buffering=buffer_size))
+        if compression is None:
+            compression = next((compression for suffix, compression in _suffixes.items()
+                                if name.endswith(suffix)), None)
+    if compression is not None:
+        fh = stack.enter_context(_compressions[compression](fh, 'wb'))
+    return fh
+
+
+def _print_stats(read, written, seconds, summary, file):
+    rate = read / seconds if seconds else 0
+    print('%d characters read, %d bytes written in %.3f s, %.0f characters/s' % (
+        read, written, seconds, rate), file=file)
+    print('%d unmapped characters' % summary['total'], file=file)
+    for code, count in summary['top']:
+        print('  U+%04X %s %d' % (code, ascii(chr(code)), count), file=file)
+
+
+def _tree(args, file):
+    """Transliterate the --tree directory, printing the progress with --stats."""
+    last = [0]
+
+    def progress(files, size, seconds):
+        if seconds - last[0] >= 1:
+            last[0] = seconds
+            print('%d files, %.1f files/s, %.1f MB/s' % (
+                files, files / seconds, size / seconds / 1e6), file=file)
+    start = time.perf_counter()
+    summary = translitcodec.parallel.transliterate_tree(
+        args.tree, args.output, args.mode, args.target, args.errors, args.processes,
+        args.checkpoint, progress if args.stats else None)
+    seconds = time.perf_counter() - start
+    for path, error in sorted(summary['failed'].items()):
+        print('%s: %s' % (path, error), file=file)
+    if args.stats:
+        print('%d files, %d bytes in %.3f s, %.1f files/s, %.1f MB/s, %d skipped, %d failed' % (
+            summary['files'], summary['bytes'], seconds, summary['files'] / seconds,
+            summary['bytes'] / seconds / 1e6, summary['skipped'], len(summary['failed'])),
+            file=file)
+    return 1 if summary['failed'] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m translitcodec',
+        description='Transliterate files or the standard input to the standard output.')
+    parser.add_argument('files', nargs='*', default=['-'], metavar='FILE',
+                        help="input files, gzip, bz2 or xz compressed or not, "
+                             "'-' for the standard input, the default")
+    parser.add_argument('-m', '--mode', choices=('long', 'short', 'one'), default='long')
+    parser.add_argument('-t', '--target',
+                        help='charset of the output, like ascii or iso-8859-2, '
+                             'the --encoding by default')
+    parser.add_argument('-e', '--errors', default='strict',
+                        help='error handler of the output encoding, like replace '
+                             'or ignore, strict by default')
+    parser.add_argument('--encoding', default='utf-8',
+                        help='encoding of the input, utf-8 by default')
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file, compressed if named like *.gz, *.bz2 or "
+                             "*.xz, '-' for the standard output, the default")
+    parser.add_argument('--compress', choices=sorted(_compressions),
+                        help='compression of the output')
+    parser.add_argument('-b', '--buffer-size', type=_positive, default=translitcodec._FILE_CHUNK_SIZE,
+                        help='characters transliterated at a time and bytes of '
+                             'the file buffers, %(default)s by default')
+    parser.add_argument('--stats', action='store_true',
+                        help='print the throughput and the most frequent unmapped '
+                             'characters to the standard error')
+    parser.add_argument('--tree', metavar='SRC',
+                        help='transliterate every file under the directory SRC, in '
+                             'UTF-8, to the directory given with --output')
+    parser.add_argument('--checkpoint', metavar='FILE',
+                        help='with --tree, record the files done in FILE and skip '
+                             'those it lists, to resume an interrupted run')
+    parser.add_argument('-j', '--processes', type=_positive,
+                        help='with --tree, number of processes, the number of CPUs '
+                             'by default')
+    args = parser.parse_args(argv)
+    if args.tree is not None:
+        if args.output == '-' or args.files != ['-']:
+            parser.error('--tree takes no FILE and needs an --output directory')
+        try:
+            return _tree(args, sys.stderr)
+        except (OSError, LookupError) as exc:
+            print('%s: %s' % (parser.prog, exc), file=sys.stderr)
+            return 1
+
+    target = args.target or args.encoding
+    if args.stats:
+        translitcodec.enable_unmapped_sampling(per_second=None, top=10)
+    read = 0
+    start = time.perf_counter()
+    try:
+        with contextlib.ExitStack() as stack:
+            output = _CountingWriter(_open_output(args.output, args.compress,
+                                                  args.buffer_size, stack))
+            for name in args.files:
+                with contextlib.ExitStack() as input_stack:
+                    src = io.TextIOWrapper(_open_input(name, args.buffer_size, input_stack),
+                                           encoding=args.encoding, newline='')
+                    read += translitcodec.transliterate_file(
+                        src, output, args.mode, target, chunk_size=args.buffer_size,
+                        errors=args.errors)
+                    # Leave the standard input open.
+                    src.detach()
+            output.fh.flush()
+    except BrokenPipeError:
+        # The reader went away, like head does; do not fail on the flush
+        # of the standard output at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, UnicodeError, LookupError) as exc:
+        print('%s: %s' % (parser.prog, exc), file=sys.stderr)
+        return 1
+    if args.stats:
+        _print_stats(read, output.size, time.perf_counter() - start,
+                     translitcodec.unmapped_summary(), sys.stderr)
+        translitcodec.disable_unmapped_sampling()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
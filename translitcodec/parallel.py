@@ -0,0 +1,340 @@
+"""Transliterate many strings, large files or trees of files on several
+processes.
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+
+"""
+import codecs
+import collections
+import concurrent.futures
+import contextlib
+import json
+import mmap
+import os
+import stat
+import time
+
+import translitcodec
+
+
+_encoders = {
+    'long': translitcodec.long_encode,
+    'short': translitcodec.short_encode,
+    'one': translitcodec.single_encode,
+}
+
+# The encoder of the pool a worker process belongs to.
+_encoder = None
+
+
+def _warm(mode):
+    """Build the tables the encoders of *mode* compile on first use."""
+    translitcodec._translation_table(mode)
+    translitcodec._normalize_search()
+
+
+def _initialize(mode):
+    global _encoder
+    _warm(mode)
+    _encoder = _encoders[mode]
+
+
+def _transliterate(value):
+    return _encoder(value)[0]
+
+
+def transliterate_many(iterable, mode='long', processes=None, chunksize=256):
+    """Transliterate the strings of *iterable* on *processes* processes.
+
+    Returns a list of the transliterated strings, in order.  The tables are
+    built once per worker process, and the strings are sent to the workers
+    in batches of *chunksize*.  *processes* defaults to the number of CPUs;
+    with a single process, the strings are transliterated in this process.
+    """
+    if mode not in _encoders:
+        raise ValueError('unknown transliteration mode %r' % (mode,))
+    # Built before the pool starts, forked workers inherit the tables.
+    _warm(mode)
+    if processes == 1:
+        encoder = _encoders[mode]
+        return [encoder(value)[0] for value in iterable]
+    with concurrent.futures.ProcessPoolExecutor(
+            processes, initializer=_initialize, initargs=(mode,)) as executor:
+        return list(executor.map(_transliterate, iterable, chunksize=chunksize))
+
+
+# Bytes of input each task of transliterate_file() reads.
+_SLICE_SIZE = 1 << 24
+
+# Bytes searched for a newline after the nominal end of a slice.
+_NEWLINE_WINDOW = 1 << 16
+
+# The memory maps of the input files, by path, in worker processes.
+_maps = {}
+
+
+def _split_point(data, offset, window):
+    """Return the first place at or after *offset* to split UTF-8 *data*.
+
+    That is after the first newline within *window* bytes, or else before
+    the first character that NFKC can not combine with anything before it,
+    so that the parts transliterate to the same as the whole.  Slices
+    ending at nominal offsets at least *window* apart use the same split
+    point as the next slice starts at.
+    """
+    size = len(data)
+    if offset <= 0:
+        return 0
+    newline = data.find(b'\n', offset, min(offset + window, size))
+    if newline != -1:
+        return newline + 1
+    position = offset
+    while position < size:
+        end = position + 1
+        while end < size and data[end] & 0xc0 == 0x80 and end - position < 4:
+            end += 1
+        if data[position] & 0xc0 != 0x80:
+            char = str(data[position:end], 'utf-8', 'replace')[0]
+            if translitcodec._starts_fresh(char):
+                return position
+        position = end
+    return size
+
+
+def _encode_slice(data, start, end, window, codec, errors):
+    """Transliterate the part of *data* split at *start* and *end*."""
+    begin = _split_point(data, start, window)
+    end = _split_point(data, end, window)
+    text = str(data[begin:end], 'utf-8') if end > begin else ''
+    return codecs.encode(text, codec, errors), len(text)
+
+
+def _transliterate_slice(path, start, end, window, codec, errors):
+    data = _maps.get(path)
+    if data is None:
+        with open(path, 'rb') as fh:
+            data = _maps[path] = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    return _encode_slice(data, start, end, window, codec, errors)
+
+
+def transliterate_file(src, dst, mode='long', target=None, errors='strict',
+                       processes=None, slice_size=_SLICE_SIZE):
+    """Transliterate a UTF-8 file on *processes* processes.
+
+    The workers map the file *src* into memory, and each transliterates
+    slices of about *slice_size* bytes, split where it does not change the
+    result.  The output is written to *dst*, a path or a binary file, in
+    order, and is the same as that of `translitcodec.transliterate_file()`:
+    the transliterated text encoded to UTF-8, or, if *target* is given,
+    encoded to *target* like the 'translit/<mode>/<target>' codec.
+    *processes* defaults to the number of CPUs; with a single process, the
+    slices are transliterated in this process.  Returns the number of
+    characters read.
+    """
+    if mode not in _encoders:
+        raise ValueError('unknown transliteration mode %r' % (mode,))
+    target = codecs.lookup(target or 'utf-8').name
+    if translitcodec._encoding_map(mode, target) is not None:
+        # Single byte charsets are transliterated and encoded in one pass
+        # by the workers, statelessly.
+        codec = 'translit/%s/%s' % (mode, target)
+        byte_encoder = None
+    else:
+        # Encoded here, so that what the encoding writes once, like the
+        # byte order mark of UTF-16, is written once.
+        codec = 'translit/' + mode
+        byte_encoder = codecs.getincrementalencoder(target)(errors)
+    size = os.path.getsize(src)
+    window = min(_NEWLINE_WINDOW, slice_size)
+    slices = [(start, start + slice_size) for start in range(0, size, slice_size)]
+    _warm(mode)
+    length = 0
+    with contextlib.ExitStack() as stack:
+        if isinstance(dst, (str, bytes, os.PathLike)):
+            dst = stack.enter_context(open(dst, 'wb'))
+
+        def write(result):
+            nonlocal length
+            output, count = result
+            dst.write(output if byte_encoder is None else byte_encoder.encode(output))
+            length += count
+
+        if processes == 1 or len(slices) < 2:
+            if slices:
+                with open(src, 'rb') as fh, \
+                        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    for start, end in slices:
+                        write(_encode_slice(data, start, end, window, codec, errors))
+        else:
+            executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(
+                processes, initializer=_initialize, initargs=(mode,)))
+            # Enough slices in flight to keep the workers busy while the
+            # output is written in order, without holding the whole of it.
+            in_flight = 2 * (processes or os.cpu_count() or 1)
+            pending = collections.deque()
+            for start, end in slices:
+                pending.append(executor.submit(
+                    _transliterate_slice, src, start, end, window, codec, errors))
+                if len(pending) >= in_flight:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+        if byte_encoder is not None:
+            dst.write(byte_encoder.encode('', final=True))
+    return length
+
+
+def _transliterate_files(batch, mode, target, errors):
+    """Transliterate the files of *batch*, writing each output atomically.
+
+    Returns the entries of *batch* with the error message of the files
+    that failed, None for the others.
+    """
+    results = []
+    for entry in batch:
+        path, size, mtime_ns, src, dst = entry
+        temporary = '%s.%d.tmp' % (dst, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            translitcodec.transliterate_file(src, temporary, mode, target or 'utf-8',
+                                             errors=errors)
+            os.replace(temporary, dst)
+        except (OSError, UnicodeError) as exc:
+            with contextlib.suppress(OSError):
+                os.remove(temporary)
+            results.append(entry[:3] + ('%s: %s' % (type(exc).__name__, exc),))
+        else:
+            results.append(entry[:3] + (None,))
+    return results
+
+
+def _read_checkpoint(path):
+    """Return the files recorded as done in the checkpoint at *path*.
+
+    Maps their relative paths to the size and modification time they had.
+    Lines that are not complete records, like one cut by an interruption,
+    are ignored.
+    """
+    done = {}
+    try:
+        fh = open(path, encoding='utf-8')
+    except FileNotFoundError:
+        return done
+    with fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+                done[record['path']] = (record['size'], record['mtime_ns'])
+            except (ValueError, KeyError, TypeError):
+                continue
+    return done
+
+
+def transliterate_tree(src, dst, mode='long', target=None, errors='strict',
+                       processes=None, checkpoint=None, progress=None, batch_size=64):
+    """Transliterate every regular file under the directory *src* into *dst*.
+
+    Each file is transliterated like `translitcodec.transliterate_file()`
+    to the file of the same relative path under *dst*, encoded to UTF-8 or
+    to *target*.  Outputs are written to a temporary file renamed into
+    place, so none is ever partly written.  The files are sent to
+    *processes* worker processes in batches of *batch_size*; with a single
+    process, they are transliterated in this process.
+
+    If *checkpoint* is a path, each transliterated file is appended to it,
+    and the files it lists with the same size and modification time, and
+    whose output exists, are skipped: an interrupted run resumes where it
+    stopped when started again with the same checkpoint.
+
+    *progress*, if given, is called as ``progress(files, size, seconds)``
+    after each batch, with the number of files and of input bytes
+    transliterated so far and the seconds since the start.
+
+    Returns a dict of the numbers of ``'files'`` transliterated, input
+    ``'bytes'`` and ``'skipped'`` files, and of ``'failed'``, mapping the
+    relative paths of the files that could not be transliterated to the
+    error.  These are not recorded in the checkpoint.
+    """
+    if mode not in _encoders:
+        raise ValueError('unknown transliteration mode %r' % (mode,))
+    codecs.lookup('translit/%s/%s' % (mode, target or 'utf-8'))
+    done = _read_checkpoint(checkpoint) if checkpoint is not None else {}
+    summary = {'files': 0, 'bytes': 0, 'skipped': 0, 'failed': {}}
+    start = time.perf_counter()
+
+    # Outputs and the checkpoint may be under src, they are no input.
+    excluded = {os.path.realpath(path) for path in (dst, checkpoint) if path is not None}
+
+    def batches():
+        batch = []
+        for directory, dirnames, filenames in os.walk(src):
+            dirnames[:] = sorted(name for name in dirnames
+                                 if os.path.realpath(os.path.join(directory, name))
+                                 not in excluded)
+            for filename in sorted(filenames):
+                source = os.path.join(directory, filename)
+                if os.path.realpath(source) in excluded:
+                    continue
+                relative = os.path.relpath(source, src)
+                target_path = os.path.join(dst, relative)
+                try:
+                    info = os.stat(source)
+                except OSError as exc:
+                    # Like a dangling symbolic link, or a file removed since.
+                    summary['failed'][relative] = '%s: %s' % (type(exc).__name__, exc)
+                    continue
+                if not stat.S_ISREG(info.st_mode):
+                    continue
+                if (done.get(relative) == (info.st_size, info.st_mtime_ns)
+                        and os.path.exists(target_path)):
+                    summary['skipped'] += 1
+                    continue
+                batch.append((relative, info.st_size, info.st_mtime_ns, source, target_path))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    with contextlib.ExitStack() as stack:
+        record = None
+        if checkpoint is not None:
+            record = stack.enter_context(open(checkpoint, 'a', encoding='utf-8'))
+
+        def collect(results):
+            for relative, size, mtime_ns, error in results:
+                if error is not None:
+                    summary['failed'][relative] = error
+                    continue
+                summary['files'] += 1
+                summary['bytes'] += size
+                if record is not None:
+                    record.write(json.dumps(
+                        {'path': relative, 'size': size, 'mtime_ns': mtime_ns}) + '\n')
+            if record is not None:
+                record.flush()
+            if progress is not None:
+                progress(summary['files'], summary['bytes'], time.perf_counter() - start)
+
+        _warm(mode)
+        if processes == 1:
+            for batch in batches():
+                collect(_transliterate_files(batch, mode, target, errors))
+            return summary
+        executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(
+            processes, initializer=_initialize, initargs=(mode,)))
+        # The executor queue is shared by the workers; keep it short so
+        # that walking millions of files does not hold them all.
+        in_flight = 2 * (processes or os.cpu_count() or 1)
+        pending = set()
+        for batch in batches():
+            pending.add(executor.submit(_transliterate_files, batch, mode, target, errors))
+            if len(pending) >= in_flight:
+                finished, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    collect(future.result())
+        for future in concurrent.futures.as_completed(pending):
+            collect(future.result())
+    return summary
@@ -0,0 +1,62 @@
+"""Translation tables.
+
+The modules are generated by scripts/update_table.py and imported by
+translitcodec on first use of a table: transtab holds the long, short
+and single tables, as runs of code points over one pool of
+replacements, alternatives the transtab alternatives, and nfkc the
+ranges of code points NFKC changes or combines.
+
+The generator also writes transtab.bin, the data of the transtab module
+in a form that is mapped into memory instead of being parsed, so that
+processes share its pages.  Integers are little endian:
+
+- a header of the magic ``b'TLTB'``, then the format version, the number
+  of runs and the number of replacements, as 4 byte unsigned integers,
+- the runs, five 4 byte signed integers each, as in ``transtab.runs``,
+- the offsets of the replacements in the pool, as 4 byte unsigned
+  integers, one more than there are replacements,
+- the pool of UTF-8 encoded replacements.
+
+:copyright: the translitcodec authors and developers, see AUTHORS.
+:license: MIT, see LICENSE for more details.
+
+"""
+import mmap
+import os
+import struct
+import sys
+
+
+BINARY_PATH = os.path.join(os.path.dirname(__file__), 'transtab.bin')
+
+_header = struct.Struct('<4sIII')
+
+
+def map_transtab(path=BINARY_PATH):
+    """Map the binary transtab data into memory.
+
+    Returns the runs as a read-only memoryview of integers and the list of
+    replacements, or None if the file is missing, of another format
+    version, or the platform does not use little endian 4 byte integers.
+    """
+    if sys.byteorder != 'little' or struct.calcsize('i') != 4:
+        return None
+    try:
+        with open(path, 'rb') as fh:
+            data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(data) < _header.size:
+        return None
+    magic, version, run_count, value_count = _header.unpack_from(data)
+    runs_end = _header.size + run_count * 5 * 4
+    offsets_end = runs_end + (value_count + 1) * 4
+    if magic != b'TLTB' or version != 1 or len(data) < offsets_end:
+        return None
+    view = memoryview(data)
+    runs = view[_header.size:runs_end].cast('i')
+    offsets = view[runs_end:offsets_end].cast('I')
+    pool = view[offsets_end:]
+    values = [str(pool[offsets[i]:offsets[i + 1]], 'utf-8')
+              for i in range(value_count)]
+    return runs, values
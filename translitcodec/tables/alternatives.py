@@ -0,0 +1,181 @@
+"""Generated by scripts/update_table.py; do not edit."""
+
+alternatives_table = {
+  169: ('(c)', 'c'),
+  178: ('^2', '2'),
+  179: ('^3', '3'),
+  181: ('μ', 'u'),
+  185: ('^1', '1'),
+  196: ('Ae', 'A'),
+  197: ('Aa', 'A'),
+  198: ('AE', 'A'),
+  214: ('Oe', 'O'),
+  220: ('Ue', 'U'),
+  223: ('ss', 'β'),
+  228: ('ae', 'a'),
+  229: ('aa', 'a'),
+  230: ('ae', 'a'),
+  246: ('oe', 'o'),
+  252: ('ue', 'u'),
+  264: ('Ch', 'C'),
+  265: ('ch', 'c'),
+  284: ('Gh', 'G'),
+  285: ('gh', 'g'),
+  292: ('Hh', 'H'),
+  293: ('hh', 'h'),
+  308: ('Jh', 'J'),
+  309: ('jh', 'j'),
+  319: ('L·', 'L.', 'L'),
+  320: ('l·', 'l.', 'l'),
+  330: ('NG', 'N'),
+  331: ('ng', 'n'),
+  348: ('Sh', 'S'),
+  349: ('sh', 's'),
+  536: ('Ş', 'S'),
+  537: ('ş', 's'),
+  538: ('Ţ', 'T'),
+  539: ('ţ', 't'),
+  697: ('′', "'"),
+  700: ('’', "'"),
+  8304: ('^0', '0'),
+  8308: ('^4', '4'),
+  8309: ('^5', '5'),
+  8310: ('^6', '6'),
+  8311: ('^7', '7'),
+  8312: ('^8', '8'),
+  8313: ('^9', '9'),
+  8314: ('^+', '+'),
+  8315: ('^-', '-'),
+  8316: ('^=', '='),
+  8317: ('^(', '('),
+  8318: ('^)', ')'),
+  8319: ('^n', 'n'),
+  8320: ('_0', '0'),
+  8321: ('_1', '1'),
+  8322: ('_2', '2'),
+  8323: ('_3', '3'),
+  8324: ('_4', '4'),
+  8325: ('_5', '5'),
+  8326: ('_6', '6'),
+  8327: ('_7', '7'),
+  8328: ('_8', '8'),
+  8329: ('_9', '9'),
+  8330: ('_+', '+'),
+  8331: ('_-', '-'),
+  8332: ('_=', '='),
+  8333: ('_(', '('),
+  8334: ('_)', ')'),
+  8364: ('EUR', 'E'),
+  8451: ('°C', 'C'),
+  8457: ('°F', 'F'),
+  8470: ('Nº', 'No'),
+  8486: ('Ω', 'ohm', 'O'),
+  8722: ('–', '-'),
+  9312: ('(1)', '1'),
+  9313: ('(2)', '2'),
+  9314: ('(3)', '3'),
+  9315: ('(4)', '4'),
+  9316: ('(5)', '5'),
+  9317: ('(6)', '6'),
+  9318: ('(7)', '7'),
+  9319: ('(8)', '8'),
+  9320: ('(9)', '9'),
+  9332: ('(1)', '1'),
+  9333: ('(2)', '2'),
+  9334: ('(3)', '3'),
+  9335: ('(4)', '4'),
+  9336: ('(5)', '5'),
+  9337: ('(6)', '6'),
+  9338: ('(7)', '7'),
+  9339: ('(8)', '8'),
+  9340: ('(9)', '9'),
+  9352: ('1.', '1'),
+  9353: ('2.', '2'),
+  9354: ('3.', '3'),
+  9355: ('4.', '4'),
+  9356: ('5.', '5'),
+  9357: ('6.', '6'),
+  9358: ('7.', '7'),
+  9359: ('8.', '8'),
+  9360: ('9.', '9'),
+  9372: ('(a)', 'a'),
+  9373: ('(b)', 'b'),
+  9374: ('(c)', 'c'),
+  9375: ('(d)', 'd'),
+  9376: ('(e)', 'e'),
+  9377: ('(f)', 'f'),
+  9378: ('(g)', 'g'),
+  9379: ('(h)', 'h'),
+  9380: ('(i)', 'i'),
+  9381: ('(j)', 'j'),
+  9382: ('(k)', 'k'),
+  9383: ('(l)', 'l'),
+  9384: ('(m)', 'm'),
+  9385: ('(n)', 'n'),
+  9386: ('(o)', 'o'),
+  9387: ('(p)', 'p'),
+  9388: ('(q)', 'q'),
+  9389: ('(r)', 'r'),
+  9390: ('(s)', 's'),
+  9391: ('(t)', 't'),
+  9392: ('(u)', 'u'),
+  9393: ('(v)', 'v'),
+  9394: ('(w)', 'w'),
+  9395: ('(x)', 'x'),
+  9396: ('(y)', 'y'),
+  9397: ('(z)', 'z'),
+  9398: ('(A)', 'A'),
+  9399: ('(B)', 'B'),
+  9400: ('(C)', 'C'),
+  9401: ('(D)', 'D'),
+  9402: ('(E)', 'E'),
+  9403: ('(F)', 'F'),
+  9404: ('(G)', 'G'),
+  9405: ('(H)', 'H'),
+  9406: ('(I)', 'I'),
+  9407: ('(J)', 'J'),
+  9408: ('(K)', 'K'),
+  9409: ('(L)', 'L'),
+  9410: ('(M)', 'M'),
+  9411: ('(N)', 'N'),
+  9412: ('(O)', 'O'),
+  9413: ('(P)', 'P'),
+  9414: ('(Q)', 'Q'),
+  9415: ('(R)', 'R'),
+  9416: ('(S)', 'S'),
+  9417: ('(T)', 'T'),
+  9418: ('(U)', 'U'),
+  9419: ('(V)', 'V'),
+  9420: ('(W)', 'W'),
+  9421: ('(X)', 'X'),
+  9422: ('(Y)', 'Y'),
+  9423: ('(Z)', 'Z'),
+  9424: ('(a)', 'a'),
+  9425: ('(b)', 'b'),
+  9426: ('(c)', 'c'),
+  9427: ('(d)', 'd'),
+  9428: ('(e)', 'e'),
+  9429: ('(f)', 'f'),
+  9430: ('(g)', 'g'),
+  9431: ('(h)', 'h'),
+  9432: ('(i)', 'i'),
+  9433: ('(j)', 'j'),
+  9434: ('(k)', 'k'),
+  9435: ('(l)', 'l'),
+  9436: ('(m)', 'm'),
+  9437: ('(n)', 'n'),
+  9438: ('(o)', 'o'),
+  9439: ('(p)', 'p'),
+  9440: ('(q)', 'q'),
+  9441: ('(r)', 'r'),
+  9442: ('(s)', 's'),
+  9443: ('(t)', 't'),
+  9444: ('(u)', 'u'),
+  9445: ('(v)', 'v'),
+  9446: ('(w)', 'w'),
+  9447: ('(x)', 'x'),
+  9448: ('(y)', 'y'),
+  9449: ('(z)', 'z'),
+  9450: ('(0)', '0'),
+  64261: ('ſt', 'st'),
+}
@@ -0,0 +1,613 @@
+"""Generated by scripts/update_table.py; do not edit."""
+
+from array import array
+
+# Ranges of code points, as their first and last code point.
+nfkc_codes = array('i', (
+  160, 160,
+  168, 168,
+  170, 170,
+  175, 175,
+  178, 181,
+  184, 186,
+  188, 190,
+  306, 307,
+  319, 320,
+  329, 329,
+  383, 383,
+  452, 460,
+  497, 499,
+  688, 696,
+  728, 733,
+  736, 740,
+  884, 884,
+  890, 890,
+  894, 894,
+  900, 901,
+  903, 903,
+  976, 982,
+  1008, 1010,
+  1012, 1013,
+  1017, 1017,
+  1415, 1415,
+  1653, 1656,
+  2392, 2399,
+  2524, 2525,
+  2527, 2527,
+  2611, 2611,
+  2614, 2614,
+  2649, 2651,
+  2654, 2654,
+  2908, 2909,
+  3635, 3635,
+  3763, 3763,
+  3804, 3805,
+  3852, 3852,
+  3907, 3907,
+  3917, 3917,
+  3922, 3922,
+  3927, 3927,
+  3932, 3932,
+  3945, 3945,
+  3958, 3961,
+  3987, 3987,
+  3997, 3997,
+  4002, 4002,
+  4007, 4007,
+  4012, 4012,
+  4025, 4025,
+  4348, 4348,
+  7468, 7470,
+  7472, 7482,
+  7484, 7501,
+  7503, 7530,
+  7544, 7544,
+  7579, 7615,
+  7834, 7835,
+  8049, 8049,
+  8051, 8051,
+  8053, 8053,
+  8055, 8055,
+  8057, 8057,
+  8059, 8059,
+  8061, 8061,
+  8123, 8123,
+  8125, 8129,
+  8137, 8137,
+  8139, 8139,
+  8141, 8143,
+  8147, 8147,
+  8155, 8155,
+  8157, 8159,
+  8163, 8163,
+  8171, 8171,
+  8173, 8175,
+  8185, 8185,
+  8187, 8187,
+  8189, 8190,
+  8192, 8202,
+  8209, 8209,
+  8215, 8215,
+  8228, 8230,
+  8239, 8239,
+  8243, 8244,
+  8246, 8247,
+  8252, 8252,
+  8254, 8254,
+  8263, 8265,
+  8279, 8279,
+  8287, 8287,
+  8304, 8305,
+  8308, 8334,
+  8336, 8348,
+  8360, 8360,
+  8448, 8451,
+  8453, 8455,
+  8457, 8467,
+  8469, 8470,
+  8473, 8477,
+  8480, 8482,
+  8484, 8484,
+  8486, 8486,
+  8488, 8488,
+  8490, 8493,
+  8495, 8497,
+  8499, 8505,
+  8507, 8512,
+  8517, 8521,
+  8528, 8575,
+  8585, 8585,
+  8748, 8749,
+  8751, 8752,
+  9001, 9002,
+  9312, 9450,
+  10764, 10764,
+  10868, 10870,
+  10972, 10972,
+  11388, 11389,
+  11631, 11631,
+  11935, 11935,
+  12019, 12019,
+  12032, 12245,
+  12288, 12288,
+  12342, 12342,
+  12344, 12346,
+  12443, 12444,
+  12447, 12447,
+  12543, 12543,
+  12593, 12594,
+  12596, 12596,
+  12599, 12601,
+  12608, 12622,
+  12644, 12686,
+  12690, 12703,
+  12800, 12830,
+  12832, 12871,
+  12880, 12926,
+  12928, 13311,
+  42652, 42653,
+  42864, 42864,
+  42994, 42996,
+  43000, 43001,
+  43868, 43871,
+  43881, 43881,
+  63744, 64013,
+  64016, 64016,
+  64018, 64018,
+  64021, 64030,
+  64032, 64032,
+  64034, 64034,
+  64037, 64038,
+  64042, 64109,
+  64112, 64217,
+  64256, 64262,
+  64275, 64279,
+  64285, 64285,
+  64287, 64310,
+  64312, 64316,
+  64318, 64318,
+  64320, 64321,
+  64323, 64324,
+  64326, 64433,
+  64467, 64829,
+  64848, 64911,
+  64914, 64967,
+  65008, 65020,
+  65040, 65049,
+  65072, 65092,
+  65095, 65106,
+  65108, 65126,
+  65128, 65131,
+  65136, 65138,
+  65140, 65140,
+  65142, 65276,
+  65281, 65437,
+  65440, 65442,
+  65444, 65444,
+  65447, 65449,
+  65456, 65470,
+  65504, 65510,
+  65512, 65518,
+))
+
+nfkc_sensitive = array('i', (
+  768, 846,
+  848, 879,
+  888, 889,
+  896, 899,
+  907, 907,
+  909, 909,
+  930, 930,
+  1155, 1159,
+  1328, 1328,
+  1367, 1368,
+  1419, 1420,
+  1424, 1469,
+  1471, 1471,
+  1473, 1474,
+  1476, 1477,
+  1479, 1487,
+  1515, 1518,
+  1525, 1535,
+  1552, 1562,
+  1611, 1631,
+  1648, 1648,
+  1750, 1756,
+  1759, 1764,
+  1767, 1768,
+  1770, 1773,
+  1806, 1806,
+  1809, 1809,
+  1840, 1868,
+  1970, 1983,
+  2027, 2035,
+  2043, 2045,
+  2070, 2073,
+  2075, 2083,
+  2085, 2087,
+  2089, 2095,
+  2111, 2111,
+  2137, 2141,
+  2143, 2143,
+  2155, 2159,
+  2191, 2191,
+  2194, 2207,
+  2250, 2273,
+  2275, 2303,
+  2364, 2364,
+  2381, 2381,
+  2385, 2388,
+  2436, 2436,
+  2445, 2446,
+  2449, 2450,
+  2473, 2473,
+  2481, 2481,
+  2483, 2485,
+  2490, 2492,
+  2494, 2494,
+  2501, 2502,
+  2505, 2506,
+  2509, 2509,
+  2511, 2523,
+  2526, 2526,
+  2532, 2533,
+  2558, 2560,
+  2564, 2564,
+  2571, 2574,
+  2577, 2578,
+  2601, 2601,
+  2609, 2609,
+  2612, 2612,
+  2615, 2615,
+  2618, 2621,
+  2627, 2630,
+  2633, 2634,
+  2637, 2640,
+  2642, 2648,
+  2653, 2653,
+  2655, 2661,
+  2679, 2688,
+  2692, 2692,
+  2702, 2702,
+  2706, 2706,
+  2729, 2729,
+  2737, 2737,
+  2740, 2740,
+  2746, 2748,
+  2758, 2758,
+  2762, 2762,
+  2765, 2767,
+  2769, 2783,
+  2788, 2789,
+  2802, 2808,
+  2816, 2816,
+  2820, 2820,
+  2829, 2830,
+  2833, 2834,
+  2857, 2857,
+  2865, 2865,
+  2868, 2868,
+  2874, 2876,
+  2878, 2878,
+  2885, 2886,
+  2889, 2890,
+  2893, 2900,
+  2902, 2907,
+  2910, 2910,
+  2916, 2917,
+  2936, 2945,
+  2948, 2948,
+  2955, 2957,
+  2961, 2961,
+  2966, 2968,
+  2971, 2971,
+  2973, 2973,
+  2976, 2978,
+  2981, 2983,
+  2987, 2989,
+  3002, 3006,
+  3011, 3013,
+  3017, 3017,
+  3021, 3023,
+  3025, 3045,
+  3067, 3071,
+  3085, 3085,
+  3089, 3089,
+  3113, 3113,
+  3130, 3132,
+  3141, 3141,
+  3145, 3145,
+  3149, 3159,
+  3163, 3164,
+  3166, 3167,
+  3172, 3173,
+  3184, 3190,
+  3213, 3213,
+  3217, 3217,
+  3241, 3241,
+  3252, 3252,
+  3258, 3260,
+  3266, 3266,
+  3269, 3269,
+  3273, 3273,
+  3277, 3292,
+  3295, 3295,
+  3300, 3301,
+  3312, 3312,
+  3315, 3327,
+  3341, 3341,
+  3345, 3345,
+  3387, 3388,
+  3390, 3390,
+  3397, 3397,
+  3401, 3401,
+  3405, 3405,
+  3408, 3411,
+  3415, 3415,
+  3428, 3429,
+  3456, 3456,
+  3460, 3460,
+  3479, 3481,
+  3506, 3506,
+  3516, 3516,
+  3518, 3519,
+  3527, 3535,
+  3541, 3541,
+  3543, 3543,
+  3551, 3557,
+  3568, 3569,
+  3573, 3584,
+  3640, 3646,
+  3656, 3659,
+  3676, 3712,
+  3715, 3715,
+  3717, 3717,
+  3723, 3723,
+  3748, 3748,
+  3750, 3750,
+  3768, 3770,
+  3774, 3775,
+  3781, 3781,
+  3783, 3787,
+  3790, 3791,
+  3802, 3803,
+  3808, 3839,
+  3864, 3865,
+  3893, 3893,
+  3895, 3895,
+  3897, 3897,
+  3912, 3912,
+  3949, 3957,
+  3962, 3965,
+  3968, 3972,
+  3974, 3975,
+  3992, 3992,
+  4021, 4021,
+  4023, 4023,
+  4029, 4029,
+  4038, 4038,
+  4045, 4045,
+  4059, 4095,
+  4142, 4142,
+  4151, 4151,
+  4153, 4154,
+  4237, 4237,
+  4294, 4294,
+  4296, 4300,
+  4302, 4303,
+  4449, 4469,
+  4520, 4546,
+  4681, 4681,
+  4686, 4687,
+  4695, 4695,
+  4697, 4697,
+  4702, 4703,
+  4745, 4745,
+  4750, 4751,
+  4785, 4785,
+  4790, 4791,
+  4799, 4799,
+  4801, 4801,
+  4806, 4807,
+  4823, 4823,
+  4881, 4881,
+  4886, 4887,
+  4955, 4959,
+  4989, 4991,
+  5018, 5023,
+  5110, 5111,
+  5118, 5119,
+  5789, 5791,
+  5881, 5887,
+  5908, 5918,
+  5940, 5940,
+  5943, 5951,
+  5972, 5983,
+  5997, 5997,
+  6001, 6001,
+  6004, 6015,
+  6098, 6098,
+  6109, 6111,
+  6122, 6127,
+  6138, 6143,
+  6170, 6175,
+  6265, 6271,
+  6313, 6313,
+  6315, 6319,
+  6390, 6399,
+  6431, 6431,
+  6444, 6447,
+  6457, 6463,
+  6465, 6467,
+  6510, 6511,
+  6517, 6527,
+  6572, 6575,
+  6602, 6607,
+  6619, 6621,
+  6679, 6680,
+  6684, 6685,
+  6751, 6752,
+  6773, 6783,
+  6794, 6799,
+  6810, 6815,
+  6830, 6845,
+  6847, 6911,
+  6964, 6965,
+  6980, 6980,
+  6989, 6991,
+  7019, 7027,
+  7039, 7039,
+  7082, 7083,
+  7142, 7142,
+  7154, 7163,
+  7223, 7226,
+  7242, 7244,
+  7305, 7311,
+  7355, 7356,
+  7368, 7378,
+  7380, 7392,
+  7394, 7400,
+  7405, 7405,
+  7412, 7412,
+  7416, 7417,
+  7419, 7423,
+  7616, 7679,
+  7958, 7959,
+  7966, 7967,
+  8006, 8007,
+  8014, 8015,
+  8024, 8024,
+  8026, 8026,
+  8028, 8028,
+  8030, 8030,
+  8062, 8063,
+  8117, 8117,
+  8133, 8133,
+  8148, 8149,
+  8156, 8156,
+  8176, 8177,
+  8181, 8181,
+  8191, 8191,
+  8293, 8293,
+  8306, 8307,
+  8335, 8335,
+  8349, 8351,
+  8385, 8412,
+  8417, 8417,
+  8421, 8447,
+  8588, 8591,
+  9255, 9279,
+  9291, 9311,
+  11124, 11125,
+  11158, 11158,
+  11503, 11505,
+  11508, 11512,
+  11558, 11558,
+  11560, 11564,
+  11566, 11567,
+  11624, 11630,
+  11633, 11647,
+  11671, 11679,
+  11687, 11687,
+  11695, 11695,
+  11703, 11703,
+  11711, 11711,
+  11719, 11719,
+  11727, 11727,
+  11735, 11735,
+  11743, 11775,
+  11870, 11903,
+  11930, 11930,
+  12020, 12031,
+  12246, 12271,
+  12284, 12287,
+  12330, 12335,
+  12352, 12352,
+  12439, 12442,
+  12544, 12548,
+  12592, 12592,
+  12595, 12595,
+  12597, 12598,
+  12602, 12607,
+  12623, 12643,
+  12687, 12687,
+  12772, 12783,
+  12831, 12831,
+  42125, 42127,
+  42183, 42191,
+  42540, 42559,
+  42607, 42607,
+  42612, 42621,
+  42654, 42655,
+  42736, 42737,
+  42744, 42751,
+  42955, 42959,
+  42962, 42962,
+  42964, 42964,
+  42970, 42993,
+  43014, 43014,
+  43052, 43055,
+  43066, 43071,
+  43128, 43135,
+  43204, 43204,
+  43206, 43213,
+  43226, 43249,
+  43307, 43309,
+  43347, 43358,
+  43389, 43391,
+  43443, 43443,
+  43456, 43456,
+  43470, 43470,
+  43482, 43485,
+  43519, 43519,
+  43575, 43583,
+  43598, 43599,
+  43610, 43611,
+  43696, 43696,
+  43698, 43700,
+  43703, 43704,
+  43710, 43711,
+  43713, 43713,
+  43715, 43738,
+  43766, 43776,
+  43783, 43784,
+  43791, 43792,
+  43799, 43807,
+  43815, 43815,
+  43823, 43823,
+  43884, 43887,
+  44013, 44015,
+  44026, 44031,
+  55204, 55215,
+  55239, 55242,
+  55292, 55295,
+  64110, 64111,
+  64218, 64255,
+  64263, 64274,
+  64280, 64284,
+  64286, 64286,
+  64311, 64311,
+  64317, 64317,
+  64319, 64319,
+  64322, 64322,
+  64325, 64325,
+  64451, 64466,
+  64912, 64913,
+  64968, 64974,
+  64976, 65007,
+  65050, 65071,
+  65107, 65107,
+  65127, 65127,
+  65132, 65135,
+  65141, 65141,
+  65277, 65278,
+  65280, 65280,
+  65438, 65439,
+  65443, 65443,
+  65445, 65446,
+  65450, 65455,
+  65471, 65503,
+  65511, 65511,
+  65519, 65528,
+  65534, 65535,
+))
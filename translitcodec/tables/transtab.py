@@ -0,0 +1,1246 @@
+"""Generated by scripts/update_table.py; do not edit."""
+
+from array import array
+
+# Replacements shared by the long, short and single tables.
+values = (
+  '',
+  ' ',
+  '  ',
+  ' 0/00',
+  ' 1/',
+  ' 1/2',
+  ' 1/3',
+  ' 1/4',
+  ' 1/5',
+  ' 1/6',
+  ' 1/8',
+  ' 2/3',
+  ' 2/5',
+  ' 3/4',
+  ' 3/5',
+  ' 3/8',
+  ' 4/5',
+  ' 5/6',
+  ' 5/8',
+  ' 7/8',
+  '!',
+  '!!',
+  '!?',
+  '"',
+  '#',
+  '%<',
+  "'",
+  "'''",
+  "'n",
+  '(',
+  '(+)',
+  '(-)',
+  '(-:',
+  '(/)',
+  '(0)',
+  '(1)',
+  '(10)',
+  '(11)',
+  '(12)',
+  '(13)',
+  '(14)',
+  '(15)',
+  '(16)',
+  '(17)',
+  '(18)',
+  '(19)',
+  '(2)',
+  '(20)',
+  '(3)',
+  '(4)',
+  '(5)',
+  '(6)',
+  '(7)',
+  '(8)',
+  '(9)',
+  '(A)',
+  '(B)',
+  '(C)',
+  '(D)',
+  '(E)',
+  '(F)',
+  '(G)',
+  '(H)',
+  '(I)',
+  '(J)',
+  '(K)',
+  '(L)',
+  '(M)',
+  '(N)',
+  '(O)',
+  '(P)',
+  '(Q)',
+  '(R)',
+  '(S)',
+  '(T)',
+  '(U)',
+  '(V)',
+  '(W)',
+  '(X)',
+  '(Y)',
+  '(Z)',
+  '(a)',
+  '(b)',
+  '(c)',
+  '(d)',
+  '(e)',
+  '(f)',
+  '(g)',
+  '(h)',
+  '(i)',
+  '(j)',
+  '(k)',
+  '(l)',
+  '(m)',
+  '(n)',
+  '(o)',
+  '(p)',
+  '(q)',
+  '(r)',
+  '(s)',
+  '(t)',
+  '(u)',
+  '(v)',
+  '(w)',
+  '(x)',
+  '(y)',
+  '(z)',
+  ')',
+  '*',
+  '+',
+  '++',
+  '+/-',
+  ',',
+  '-',
+  '--',
+  '->',
+  '-|',
+  '.',
+  '..',
+  '...',
+  '/',
+  '///',
+  '/=',
+  '0',
+  '1',
+  '1.',
+  '10.',
+  '11.',
+  '12.',
+  '13.',
+  '14.',
+  '15.',
+  '16.',
+  '17.',
+  '18.',
+  '19.',
+  '2',
+  '2.',
+  '20.',
+  '3',
+  '3.',
+  '4',
+  '4.',
+  '5',
+  '5.',
+  '6',
+  '6.',
+  '7',
+  '7.',
+  '8',
+  '8.',
+  '9',
+  '9.',
+  ':',
+  ':-(',
+  ':-)',
+  ';',
+  '<',
+  '<-',
+  '<->',
+  '<<',
+  '<<<',
+  '<=',
+  '<=>',
+  '=',
+  '=>',
+  '>',
+  '>=',
+  '>>',
+  '>>>',
+  '?',
+  '?!',
+  'A',
+  'ACK',
+  'AE',
+  'Aa',
+  'Ae',
+  'B',
+  'BEL',
+  'BS',
+  'C',
+  'CAN',
+  'CR',
+  'Ch',
+  'D',
+  'DC1',
+  'DC2',
+  'DC3',
+  'DC4',
+  'DEL',
+  'DLE',
+  'E',
+  'EM',
+  'ENQ',
+  'EOT',
+  'ESC',
+  'ETB',
+  'ETX',
+  'EUR',
+  'F',
+  'FF',
+  'FS',
+  'G',
+  'GBP',
+  'GS',
+  'Gh',
+  'H',
+  'HT',
+  'Hh',
+  'I',
+  'II',
+  'III',
+  'IJ',
+  'IV',
+  'IX',
+  'J',
+  'Jh',
+  'K',
+  'L',
+  'L.',
+  'LF',
+  'L·',
+  'M',
+  'N',
+  'NAK',
+  'NG',
+  'NL',
+  'NUL',
+  'No',
+  'Nº',
+  'O',
+  'OE',
+  'Oe',
+  'P',
+  'Q',
+  'R',
+  'RS',
+  'S',
+  'SI',
+  'SO',
+  'SOH',
+  'SP',
+  'STX',
+  'SUB',
+  'SYN',
+  'Sh',
+  'T',
+  'TEL',
+  'Th',
+  'U',
+  'US',
+  'Ue',
+  'V',
+  'VI',
+  'VII',
+  'VIII',
+  'VT',
+  'W',
+  'X',
+  'XI',
+  'XII',
+  'Y',
+  'Z',
+  '[SM]',
+  '[TM]',
+  '\\',
+  '^',
+  '^(',
+  '^)',
+  '^+',
+  '^-',
+  '^0',
+  '^1',
+  '^2',
+  '^3',
+  '^4',
+  '^5',
+  '^6',
+  '^7',
+  '^8',
+  '^9',
+  '^=',
+  '^n',
+  '_',
+  '_(',
+  '_)',
+  '_+',
+  '_-',
+  '_0',
+  '_1',
+  '_2',
+  '_3',
+  '_4',
+  '_5',
+  '_6',
+  '_7',
+  '_8',
+  '_9',
+  '_=',
+  '`',
+  '``',
+  '```',
+  'a',
+  'a/c',
+  'a/s',
+  'aa',
+  'ae',
+  'b',
+  'c',
+  'c/o',
+  'c/u',
+  'ch',
+  'd',
+  'e',
+  'f',
+  'ff',
+  'ffi',
+  'ffl',
+  'fi',
+  'fl',
+  'g',
+  'gh',
+  'h',
+  'hh',
+  'i',
+  'ii',
+  'iii',
+  'ij',
+  'inf',
+  'iv',
+  'ix',
+  'j',
+  'jh',
+  'k',
+  'l',
+  'l.',
+  'l·',
+  'm',
+  'n',
+  'ng',
+  'o',
+  'oe',
+  'ohm',
+  'p',
+  'q',
+  'r',
+  's',
+  'sh',
+  'ss',
+  'st',
+  't',
+  'th',
+  'u',
+  'ue',
+  'v',
+  'vi',
+  'vii',
+  'viii',
+  'w',
+  'x',
+  'xi',
+  'xii',
+  'y',
+  'z',
+  '|',
+  '|-',
+  '|=',
+  '||',
+  '||-',
+  '~',
+  '¯',
+  '°',
+  '°C',
+  '°F',
+  '·',
+  'Å',
+  'Ş',
+  'ş',
+  'Ţ',
+  'ţ',
+  'ſt',
+  'Ω',
+  'μ',
+  '–',
+  '‘',
+  '’',
+  '‛',
+  '′',
+  '√',
+)
+
+# Runs of code points with the same replacements, as five integers:
+# the first and last code point, and the indexes in values of their
+# long, short and single replacement, or -1 for none.
+runs = array('i', (
+  160, 160, 1, 1, 1,
+  161, 161, 20, 20, 20,
+  162, 162, 308, 308, 308,
+  163, 163, 203, 203, -1,
+  165, 165, 261, 261, 261,
+  166, 166, 364, 364, 364,
+  167, 167, 237, 237, 237,
+  168, 168, 23, 23, 23,
+  169, 169, 83, 308, 308,
+  170, 170, 302, 302, 302,
+  171, 171, 160, 160, -1,
+  172, 172, 113, 113, 113,
+  173, 173, 113, 113, 113,
+  174, 174, 72, 72, -1,
+  175, 175, 113, 113, 113,
+  176, 176, 1, 1, 1,
+  177, 177, 111, 111, -1,
+  178, 178, 273, 136, 136,
+  179, 179, 274, 139, 139,
+  180, 180, 26, 26, 26,
+  181, 181, 382, 352, 352,
+  182, 182, 233, 233, 233,
+  183, 183, 117, 117, 117,
+  184, 184, 112, 112, 112,
+  185, 185, 272, 124, 124,
+  186, 186, 340, 340, 340,
+  187, 187, 168, 168, -1,
+  188, 188, 7, 7, -1,
+  189, 189, 5, 5, -1,
+  190, 190, 13, 13, -1,
+  191, 191, 170, 170, 170,
+  192, 192, 172, 172, 172,
+  193, 193, 172, 172, 172,
+  194, 194, 172, 172, 172,
+  195, 195, 172, 172, 172,
+  196, 196, 176, 172, 172,
+  197, 197, 175, 172, 172,
+  198, 198, 174, 172, 172,
+  199, 199, 180, 180, 180,
+  200, 200, 191, 191, 191,
+  201, 201, 191, 191, 191,
+  202, 202, 191, 191, 191,
+  203, 203, 191, 191, 191,
+  204, 204, 209, 209, 209,
+  205, 205, 209, 209, 209,
+  206, 206, 209, 209, 209,
+  207, 207, 209, 209, 209,
+  208, 208, 184, 184, 184,
+  209, 209, 223, 223, 223,
+  210, 210, 230, 230, 230,
+  211, 211, 230, 230, 230,
+  212, 212, 230, 230, 230,
+  213, 213, 230, 230, 230,
+  214, 214, 232, 230, 230,
+  215, 215, 359, 359, 359,
+  216, 216, 230, 230, 230,
+  217, 217, 249, 249, 249,
+  218, 218, 249, 249, 249,
+  219, 219, 249, 249, 249,
+  220, 220, 251, 249, 249,
+  221, 221, 261, 261, 261,
+  222, 222, 248, 248, -1,
+  223, 223, 348, 348, 346,
+  224, 224, 302, 302, 302,
+  225, 225, 302, 302, 302,
+  226, 226, 302, 302, 302,
+  227, 227, 302, 302, 302,
+  228, 228, 306, 302, 302,
+  229, 229, 305, 302, 302,
+  230, 230, 306, 302, 302,
+  231, 231, 308, 308, 308,
+  232, 232, 313, 313, 313,
+  233, 233, 313, 313, 313,
+  234, 234, 313, 313, 313,
+  235, 235, 313, 313, 313,
+  236, 236, 324, 324, 324,
+  237, 237, 324, 324, 324,
+  238, 238, 324, 324, 324,
+  239, 239, 324, 324, 324,
+  240, 240, 312, 312, 312,
+  241, 241, 338, 338, 338,
+  242, 242, 340, 340, 340,
+  243, 243, 340, 340, 340,
+  244, 244, 340, 340, 340,
+  245, 245, 340, 340, 340,
+  246, 246, 341, 340, 340,
+  247, 247, 153, 153, 153,
+  248, 248, 340, 340, 340,
+  249, 249, 352, 352, 352,
+  250, 250, 352, 352, 352,
+  251, 251, 352, 352, 352,
+  252, 252, 353, 352, 352,
+  253, 253, 362, 362, 362,
+  254, 254, 351, 351, -1,
+  255, 255, 362, 362, 362,
+  256, 256, 172, 172, 172,
+  257, 257, 302, 302, 302,
+  258, 258, 172, 172, 172,
+  259, 259, 302, 302, 302,
+  260, 260, 172, 172, 172,
+  261, 261, 302, 302, 302,
+  262, 262, 180, 180, 180,
+  263, 263, 308, 308, 308,
+  264, 264, 183, 180, 180,
+  265, 265, 311, 308, 308,
+  266, 266, 180, 180, 180,
+  267, 267, 308, 308, 308,
+  268, 268, 180, 180, 180,
+  269, 269, 308, 308, 308,
+  270, 270, 184, 184, 184,
+  271, 271, 312, 312, 312,
+  272, 272, 184, 184, 184,
+  273, 273, 312, 312, 312,
+  274, 274, 191, 191, 191,
+  275, 275, 313, 313, 313,
+  276, 276, 191, 191, 191,
+  277, 277, 313, 313, 313,
+  278, 278, 191, 191, 191,
+  279, 279, 313, 313, 313,
+  280, 280, 191, 191, 191,
+  281, 281, 313, 313, 313,
+  282, 282, 191, 191, 191,
+  283, 283, 313, 313, 313,
+  284, 284, 205, 202, 202,
+  285, 285, 321, 320, 320,
+  286, 286, 202, 202, 202,
+  287, 287, 320, 320, 320,
+  288, 288, 202, 202, 202,
+  289, 289, 320, 320, 320,
+  290, 290, 202, 202, 202,
+  291, 291, 320, 320, 320,
+  292, 292, 208, 206, 206,
+  293, 293, 323, 322, 322,
+  294, 294, 206, 206, 206,
+  295, 295, 322, 322, 322,
+  296, 296, 209, 209, 209,
+  297, 297, 324, 324, 324,
+  298, 298, 209, 209, 209,
+  299, 299, 324, 324, 324,
+  300, 300, 209, 209, 209,
+  301, 301, 324, 324, 324,
+  302, 302, 209, 209, 209,
+  303, 303, 324, 324, 324,
+  304, 304, 209, 209, 209,
+  305, 305, 324, 324, 324,
+  306, 306, 212, 212, -1,
+  307, 307, 327, 327, -1,
+  308, 308, 216, 215, 215,
+  309, 309, 332, 331, 331,
+  310, 310, 217, 217, 217,
+  311, 311, 333, 333, 333,
+  312, 312, 333, 333, 333,
+  313, 313, 218, 218, 218,
+  314, 314, 334, 334, 334,
+  315, 315, 218, 218, 218,
+  316, 316, 334, 334, 334,
+  317, 317, 218, 218, 218,
+  318, 318, 334, 334, 334,
+  319, 319, 221, 219, -1,
+  320, 320, 336, 335, -1,
+  321, 321, 218, 218, 218,
+  322, 322, 334, 334, 334,
+  323, 323, 223, 223, 223,
+  324, 324, 338, 338, 338,
+  325, 325, 223, 223, 223,
+  326, 326, 338, 338, 338,
+  327, 327, 223, 223, 223,
+  328, 328, 338, 338, 338,
+  329, 329, 28, 28, -1,
+  330, 330, 225, 223, 223,
+  331, 331, 339, 338, 338,
+  332, 332, 230, 230, 230,
+  333, 333, 340, 340, 340,
+  334, 334, 230, 230, 230,
+  335, 335, 340, 340, 340,
+  336, 336, 230, 230, 230,
+  337, 337, 340, 340, 340,
+  338, 338, 231, 231, -1,
+  339, 339, 341, 341, -1,
+  340, 340, 235, 235, 235,
+  341, 341, 345, 345, 345,
+  342, 342, 235, 235, 235,
+  343, 343, 345, 345, 345,
+  344, 344, 235, 235, 235,
+  345, 345, 345, 345, 345,
+  346, 346, 237, 237, 237,
+  347, 347, 346, 346, 346,
+  348, 348, 245, 237, 237,
+  349, 349, 347, 346, 346,
+  350, 350, 237, 237, 237,
+  351, 351, 346, 346, 346,
+  352, 352, 237, 237, 237,
+  353, 353, 346, 346, 346,
+  354, 354, 246, 246, 246,
+  355, 355, 350, 350, 350,
+  356, 356, 246, 246, 246,
+  357, 357, 350, 350, 350,
+  358, 358, 246, 246, 246,
+  359, 359, 350, 350, 350,
+  360, 360, 249, 249, 249,
+  361, 361, 352, 352, 352,
+  362, 362, 249, 249, 249,
+  363, 363, 352, 352, 352,
+  364, 364, 249, 249, 249,
+  365, 365, 352, 352, 352,
+  366, 366, 249, 249, 249,
+  367, 367, 352, 352, 352,
+  368, 368, 249, 249, 249,
+  369, 369, 352, 352, 352,
+  370, 370, 249, 249, 249,
+  371, 371, 352, 352, 352,
+  372, 372, 257, 257, 257,
+  373, 373, 358, 358, 358,
+  374, 374, 261, 261, 261,
+  375, 375, 362, 362, 362,
+  376, 376, 261, 261, 261,
+  377, 377, 262, 262, 262,
+  378, 378, 363, 363, 363,
+  379, 379, 262, 262, 262,
+  380, 380, 363, 363, 363,
+  381, 381, 262, 262, 262,
+  382, 382, 363, 363, 363,
+  383, 383, 346, 346, 346,
+  402, 402, 314, 314, 314,
+  416, 416, 230, 230, 230,
+  417, 417, 340, 340, 340,
+  431, 431, 249, 249, 249,
+  432, 432, 352, 352, 352,
+  536, 536, 376, 237, 237,
+  537, 537, 377, 346, 346,
+  538, 538, 378, 246, 246,
+  539, 539, 379, 350, 350,
+  697, 697, 387, 26, 26,
+  699, 699, 384, 384, 384,
+  700, 700, 385, 26, 26,
+  701, 701, 386, 386, 386,
+  710, 710, 266, 266, 266,
+  712, 712, 26, 26, 26,
+  713, 713, 370, 370, 370,
+  716, 716, 112, 112, 112,
+  720, 720, 153, 153, 153,
+  730, 730, 371, 371, 371,
+  732, 732, 369, 369, 369,
+  733, 733, 23, 23, 23,
+  884, 884, 26, 26, 26,
+  885, 885, 112, 112, 112,
+  894, 894, 156, 156, 156,
+  7682, 7682, 177, 177, 177,
+  7683, 7683, 307, 307, 307,
+  7690, 7690, 184, 184, 184,
+  7691, 7691, 312, 312, 312,
+  7710, 7710, 199, 199, 199,
+  7711, 7711, 314, 314, 314,
+  7744, 7744, 222, 222, 222,
+  7745, 7745, 337, 337, 337,
+  7766, 7766, 233, 233, 233,
+  7767, 7767, 343, 343, 343,
+  7776, 7776, 237, 237, 237,
+  7777, 7777, 346, 346, 346,
+  7786, 7786, 246, 246, 246,
+  7787, 7787, 350, 350, 350,
+  7808, 7808, 257, 257, 257,
+  7809, 7809, 358, 358, 358,
+  7810, 7810, 257, 257, 257,
+  7811, 7811, 358, 358, 358,
+  7812, 7812, 257, 257, 257,
+  7813, 7813, 358, 358, 358,
+  7918, 7918, 249, 249, 249,
+  7919, 7919, 352, 352, 352,
+  7922, 7922, 261, 261, 261,
+  7923, 7923, 362, 362, 362,
+  8192, 8192, 1, 1, 1,
+  8193, 8193, 2, 2, -1,
+  8194, 8194, 1, 1, 1,
+  8195, 8195, 2, 2, -1,
+  8196, 8196, 1, 1, 1,
+  8197, 8197, 1, 1, 1,
+  8198, 8198, 1, 1, 1,
+  8199, 8199, 1, 1, 1,
+  8200, 8200, 1, 1, 1,
+  8201, 8201, 1, 1, 1,
+  8202, 8202, 0, 0, -1,
+  8203, 8203, 0, 0, -1,
+  8204, 8204, 0, 0, -1,
+  8205, 8205, 0, 0, -1,
+  8206, 8206, 0, 0, -1,
+  8207, 8207, 0, 0, -1,
+  8208, 8208, 113, 113, 113,
+  8209, 8209, 113, 113, 113,
+  8210, 8210, 113, 113, 113,
+  8211, 8211, 113, 113, 113,
+  8212, 8212, 114, 114, -1,
+  8213, 8213, 114, 114, -1,
+  8214, 8214, 367, 367, -1,
+  8215, 8215, 283, 283, 283,
+  8216, 8216, 26, 26, 26,
+  8217, 8217, 26, 26, 26,
+  8218, 8218, 26, 26, 26,
+  8219, 8219, 26, 26, 26,
+  8220, 8220, 23, 23, 23,
+  8221, 8221, 23, 23, 23,
+  8222, 8222, 23, 23, 23,
+  8223, 8223, 23, 23, 23,
+  8224, 8224, 109, 109, 109,
+  8225, 8225, 110, 110, -1,
+  8226, 8226, 340, 340, 340,
+  8227, 8227, 166, 166, 166,
+  8228, 8228, 117, 117, 117,
+  8229, 8229, 118, 118, -1,
+  8230, 8230, 119, 119, -1,
+  8231, 8231, 113, 113, 113,
+  8234, 8234, 0, 0, -1,
+  8235, 8235, 0, 0, -1,
+  8236, 8236, 0, 0, -1,
+  8237, 8237, 0, 0, -1,
+  8238, 8238, 0, 0, -1,
+  8239, 8239, 1, 1, 1,
+  8240, 8240, 3, 3, -1,
+  8242, 8242, 26, 26, 26,
+  8243, 8243, 23, 23, 23,
+  8244, 8244, 27, 27, -1,
+  8245, 8245, 299, 299, 299,
+  8246, 8246, 300, 300, -1,
+  8247, 8247, 301, 301, -1,
+  8249, 8249, 157, 157, 157,
+  8250, 8250, 166, 166, 166,
+  8252, 8252, 21, 21, -1,
+  8254, 8254, 113, 113, 113,
+  8259, 8259, 113, 113, 113,
+  8260, 8260, 120, 120, 120,
+  8264, 8264, 171, 171, -1,
+  8265, 8265, 22, 22, -1,
+  8266, 8266, 147, 147, 147,
+  8304, 8304, 271, 123, 123,
+  8308, 8308, 275, 141, 141,
+  8309, 8309, 276, 143, 143,
+  8310, 8310, 277, 145, 145,
+  8311, 8311, 278, 147, 147,
+  8312, 8312, 279, 149, 149,
+  8313, 8313, 280, 151, 151,
+  8314, 8314, 269, 109, 109,
+  8315, 8315, 270, 113, 113,
+  8316, 8316, 281, 164, 164,
+  8317, 8317, 267, 29, 29,
+  8318, 8318, 268, 107, 107,
+  8319, 8319, 282, 338, 338,
+  8320, 8320, 288, 123, 123,
+  8321, 8321, 289, 124, 124,
+  8322, 8322, 290, 136, 136,
+  8323, 8323, 291, 139, 139,
+  8324, 8324, 292, 141, 141,
+  8325, 8325, 293, 143, 143,
+  8326, 8326, 294, 145, 145,
+  8327, 8327, 295, 147, 147,
+  8328, 8328, 296, 149, 149,
+  8329, 8329, 297, 151, 151,
+  8330, 8330, 286, 109, 109,
+  8331, 8331, 287, 113, 113,
+  8332, 8332, 298, 164, 164,
+  8333, 8333, 284, 29, 29,
+  8334, 8334, 285, 107, 107,
+  8364, 8364, 198, 191, 191,
+  8448, 8448, 303, 303, -1,
+  8449, 8449, 304, 304, -1,
+  8451, 8451, 372, 180, 180,
+  8453, 8453, 309, 309, -1,
+  8454, 8454, 310, 310, -1,
+  8457, 8457, 373, 199, 199,
+  8467, 8467, 334, 334, 334,
+  8470, 8470, 229, 228, -1,
+  8471, 8471, 70, 70, -1,
+  8480, 8480, 263, 263, -1,
+  8481, 8481, 247, 247, -1,
+  8482, 8482, 264, 264, -1,
+  8486, 8486, 381, 342, -1,
+  8490, 8490, 217, 217, 217,
+  8491, 8491, 375, 375, 375,
+  8494, 8494, 313, 313, 313,
+  8531, 8531, 6, 6, -1,
+  8532, 8532, 11, 11, -1,
+  8533, 8533, 8, 8, -1,
+  8534, 8534, 12, 12, -1,
+  8535, 8535, 14, 14, -1,
+  8536, 8536, 16, 16, -1,
+  8537, 8537, 9, 9, -1,
+  8538, 8538, 17, 17, -1,
+  8539, 8539, 10, 10, -1,
+  8540, 8540, 15, 15, -1,
+  8541, 8541, 18, 18, -1,
+  8542, 8542, 19, 19, -1,
+  8543, 8543, 4, 4, -1,
+  8544, 8544, 209, 209, 209,
+  8545, 8545, 210, 210, -1,
+  8546, 8546, 211, 211, -1,
+  8547, 8547, 213, 213, -1,
+  8548, 8548, 252, 252, 252,
+  8549, 8549, 253, 253, -1,
+  8550, 8550, 254, 254, -1,
+  8551, 8551, 255, 255, -1,
+  8552, 8552, 214, 214, -1,
+  8553, 8553, 258, 258, 258,
+  8554, 8554, 259, 259, -1,
+  8555, 8555, 260, 260, -1,
+  8556, 8556, 218, 218, 218,
+  8557, 8557, 180, 180, 180,
+  8558, 8558, 184, 184, 184,
+  8559, 8559, 222, 222, 222,
+  8560, 8560, 324, 324, 324,
+  8561, 8561, 325, 325, -1,
+  8562, 8562, 326, 326, -1,
+  8563, 8563, 329, 329, -1,
+  8564, 8564, 354, 354, 354,
+  8565, 8565, 355, 355, -1,
+  8566, 8566, 356, 356, -1,
+  8567, 8567, 357, 357, -1,
+  8568, 8568, 330, 330, -1,
+  8569, 8569, 359, 359, 359,
+  8570, 8570, 360, 360, -1,
+  8571, 8571, 361, 361, -1,
+  8572, 8572, 334, 334, 334,
+  8573, 8573, 308, 308, 308,
+  8574, 8574, 312, 312, 312,
+  8575, 8575, 337, 337, 337,
+  8592, 8592, 158, 158, -1,
+  8593, 8593, 266, 266, 266,
+  8594, 8594, 115, 115, -1,
+  8595, 8595, 354, 354, 354,
+  8596, 8596, 159, 159, -1,
+  8656, 8656, 162, 162, -1,
+  8658, 8658, 165, 165, -1,
+  8660, 8660, 163, 163, -1,
+  8722, 8722, 383, 113, 113,
+  8725, 8725, 120, 120, 120,
+  8726, 8726, 265, 265, 265,
+  8727, 8727, 108, 108, 108,
+  8728, 8728, 340, 340, 340,
+  8729, 8729, 374, 374, 374,
+  8734, 8734, 328, 328, -1,
+  8739, 8739, 364, 364, 364,
+  8741, 8741, 367, 367, -1,
+  8758, 8758, 153, 153, 153,
+  8764, 8764, 369, 369, 369,
+  8800, 8800, 122, 122, -1,
+  8801, 8801, 164, 164, 164,
+  8804, 8804, 162, 162, -1,
+  8805, 8805, 167, 167, -1,
+  8810, 8810, 160, 160, -1,
+  8811, 8811, 168, 168, -1,
+  8853, 8853, 30, 30, -1,
+  8854, 8854, 31, 31, -1,
+  8855, 8855, 104, 104, -1,
+  8856, 8856, 33, 33, -1,
+  8866, 8866, 365, 365, -1,
+  8867, 8867, 116, 116, -1,
+  8870, 8870, 365, 365, -1,
+  8871, 8871, 366, 366, -1,
+  8872, 8872, 366, 366, -1,
+  8873, 8873, 368, 368, -1,
+  8901, 8901, 374, 374, 374,
+  8902, 8902, 108, 108, 108,
+  8917, 8917, 24, 24, 24,
+  8920, 8920, 161, 161, -1,
+  8921, 8921, 169, 169, -1,
+  8943, 8943, 119, 119, -1,
+  9001, 9001, 157, 157, 157,
+  9002, 9002, 166, 166, 166,
+  9216, 9216, 227, 227, -1,
+  9217, 9217, 240, 240, -1,
+  9218, 9218, 242, 242, -1,
+  9219, 9219, 197, 197, -1,
+  9220, 9220, 194, 194, -1,
+  9221, 9221, 193, 193, -1,
+  9222, 9222, 173, 173, -1,
+  9223, 9223, 178, 178, -1,
+  9224, 9224, 179, 179, -1,
+  9225, 9225, 207, 207, -1,
+  9226, 9226, 220, 220, -1,
+  9227, 9227, 256, 256, -1,
+  9228, 9228, 200, 200, -1,
+  9229, 9229, 182, 182, -1,
+  9230, 9230, 239, 239, -1,
+  9231, 9231, 238, 238, -1,
+  9232, 9232, 190, 190, -1,
+  9233, 9233, 185, 185, -1,
+  9234, 9234, 186, 186, -1,
+  9235, 9235, 187, 187, -1,
+  9236, 9236, 188, 188, -1,
+  9237, 9237, 224, 224, -1,
+  9238, 9238, 244, 244, -1,
+  9239, 9239, 196, 196, -1,
+  9240, 9240, 181, 181, -1,
+  9241, 9241, 192, 192, -1,
+  9242, 9242, 243, 243, -1,
+  9243, 9243, 195, 195, -1,
+  9244, 9244, 201, 201, -1,
+  9245, 9245, 204, 204, -1,
+  9246, 9246, 236, 236, -1,
+  9247, 9247, 250, 250, -1,
+  9248, 9248, 241, 241, -1,
+  9249, 9249, 189, 189, -1,
+  9251, 9251, 283, 283, 283,
+  9252, 9252, 226, 226, -1,
+  9253, 9253, 121, 121, -1,
+  9254, 9254, 170, 170, 170,
+  9312, 9312, 35, 124, 124,
+  9313, 9313, 46, 136, 136,
+  9314, 9314, 48, 139, 139,
+  9315, 9315, 49, 141, 141,
+  9316, 9316, 50, 143, 143,
+  9317, 9317, 51, 145, 145,
+  9318, 9318, 52, 147, 147,
+  9319, 9319, 53, 149, 149,
+  9320, 9320, 54, 151, 151,
+  9321, 9321, 36, 36, -1,
+  9322, 9322, 37, 37, -1,
+  9323, 9323, 38, 38, -1,
+  9324, 9324, 39, 39, -1,
+  9325, 9325, 40, 40, -1,
+  9326, 9326, 41, 41, -1,
+  9327, 9327, 42, 42, -1,
+  9328, 9328, 43, 43, -1,
+  9329, 9329, 44, 44, -1,
+  9330, 9330, 45, 45, -1,
+  9331, 9331, 47, 47, -1,
+  9332, 9332, 35, 124, 124,
+  9333, 9333, 46, 136, 136,
+  9334, 9334, 48, 139, 139,
+  9335, 9335, 49, 141, 141,
+  9336, 9336, 50, 143, 143,
+  9337, 9337, 51, 145, 145,
+  9338, 9338, 52, 147, 147,
+  9339, 9339, 53, 149, 149,
+  9340, 9340, 54, 151, 151,
+  9341, 9341, 36, 36, -1,
+  9342, 9342, 37, 37, -1,
+  9343, 9343, 38, 38, -1,
+  9344, 9344, 39, 39, -1,
+  9345, 9345, 40, 40, -1,
+  9346, 9346, 41, 41, -1,
+  9347, 9347, 42, 42, -1,
+  9348, 9348, 43, 43, -1,
+  9349, 9349, 44, 44, -1,
+  9350, 9350, 45, 45, -1,
+  9351, 9351, 47, 47, -1,
+  9352, 9352, 125, 124, 124,
+  9353, 9353, 137, 136, 136,
+  9354, 9354, 140, 139, 139,
+  9355, 9355, 142, 141, 141,
+  9356, 9356, 144, 143, 143,
+  9357, 9357, 146, 145, 145,
+  9358, 9358, 148, 147, 147,
+  9359, 9359, 150, 149, 149,
+  9360, 9360, 152, 151, 151,
+  9361, 9361, 126, 126, -1,
+  9362, 9362, 127, 127, -1,
+  9363, 9363, 128, 128, -1,
+  9364, 9364, 129, 129, -1,
+  9365, 9365, 130, 130, -1,
+  9366, 9366, 131, 131, -1,
+  9367, 9367, 132, 132, -1,
+  9368, 9368, 133, 133, -1,
+  9369, 9369, 134, 134, -1,
+  9370, 9370, 135, 135, -1,
+  9371, 9371, 138, 138, -1,
+  9372, 9372, 81, 302, 302,
+  9373, 9373, 82, 307, 307,
+  9374, 9374, 83, 308, 308,
+  9375, 9375, 84, 312, 312,
+  9376, 9376, 85, 313, 313,
+  9377, 9377, 86, 314, 314,
+  9378, 9378, 87, 320, 320,
+  9379, 9379, 88, 322, 322,
+  9380, 9380, 89, 324, 324,
+  9381, 9381, 90, 331, 331,
+  9382, 9382, 91, 333, 333,
+  9383, 9383, 92, 334, 334,
+  9384, 9384, 93, 337, 337,
+  9385, 9385, 94, 338, 338,
+  9386, 9386, 95, 340, 340,
+  9387, 9387, 96, 343, 343,
+  9388, 9388, 97, 344, 344,
+  9389, 9389, 98, 345, 345,
+  9390, 9390, 99, 346, 346,
+  9391, 9391, 100, 350, 350,
+  9392, 9392, 101, 352, 352,
+  9393, 9393, 102, 354, 354,
+  9394, 9394, 103, 358, 358,
+  9395, 9395, 104, 359, 359,
+  9396, 9396, 105, 362, 362,
+  9397, 9397, 106, 363, 363,
+  9398, 9398, 55, 172, 172,
+  9399, 9399, 56, 177, 177,
+  9400, 9400, 57, 180, 180,
+  9401, 9401, 58, 184, 184,
+  9402, 9402, 59, 191, 191,
+  9403, 9403, 60, 199, 199,
+  9404, 9404, 61, 202, 202,
+  9405, 9405, 62, 206, 206,
+  9406, 9406, 63, 209, 209,
+  9407, 9407, 64, 215, 215,
+  9408, 9408, 65, 217, 217,
+  9409, 9409, 66, 218, 218,
+  9410, 9410, 67, 222, 222,
+  9411, 9411, 68, 223, 223,
+  9412, 9412, 69, 230, 230,
+  9413, 9413, 70, 233, 233,
+  9414, 9414, 71, 234, 234,
+  9415, 9415, 72, 235, 235,
+  9416, 9416, 73, 237, 237,
+  9417, 9417, 74, 246, 246,
+  9418, 9418, 75, 249, 249,
+  9419, 9419, 76, 252, 252,
+  9420, 9420, 77, 257, 257,
+  9421, 9421, 78, 258, 258,
+  9422, 9422, 79, 261, 261,
+  9423, 9423, 80, 262, 262,
+  9424, 9424, 81, 302, 302,
+  9425, 9425, 82, 307, 307,
+  9426, 9426, 83, 308, 308,
+  9427, 9427, 84, 312, 312,
+  9428, 9428, 85, 313, 313,
+  9429, 9429, 86, 314, 314,
+  9430, 9430, 87, 320, 320,
+  9431, 9431, 88, 322, 322,
+  9432, 9432, 89, 324, 324,
+  9433, 9433, 90, 331, 331,
+  9434, 9434, 91, 333, 333,
+  9435, 9435, 92, 334, 334,
+  9436, 9436, 93, 337, 337,
+  9437, 9437, 94, 338, 338,
+  9438, 9438, 95, 340, 340,
+  9439, 9439, 96, 343, 343,
+  9440, 9440, 97, 344, 344,
+  9441, 9441, 98, 345, 345,
+  9442, 9442, 99, 346, 346,
+  9443, 9443, 100, 350, 350,
+  9444, 9444, 101, 352, 352,
+  9445, 9445, 102, 354, 354,
+  9446, 9446, 103, 358, 358,
+  9447, 9447, 104, 359, 359,
+  9448, 9448, 105, 362, 362,
+  9449, 9449, 106, 363, 363,
+  9450, 9450, 34, 123, 123,
+  9472, 9472, 113, 113, 113,
+  9473, 9473, 164, 164, 164,
+  9474, 9474, 364, 364, 364,
+  9475, 9475, 364, 364, 364,
+  9476, 9476, 113, 113, 113,
+  9477, 9477, 164, 164, 164,
+  9478, 9478, 364, 364, 364,
+  9479, 9479, 364, 364, 364,
+  9480, 9480, 113, 113, 113,
+  9481, 9481, 164, 164, 164,
+  9482, 9482, 364, 364, 364,
+  9483, 9483, 364, 364, 364,
+  9484, 9484, 109, 109, 109,
+  9485, 9485, 109, 109, 109,
+  9486, 9486, 109, 109, 109,
+  9487, 9487, 109, 109, 109,
+  9488, 9488, 109, 109, 109,
+  9489, 9489, 109, 109, 109,
+  9490, 9490, 109, 109, 109,
+  9491, 9491, 109, 109, 109,
+  9492, 9492, 109, 109, 109,
+  9493, 9493, 109, 109, 109,
+  9494, 9494, 109, 109, 109,
+  9495, 9495, 109, 109, 109,
+  9496, 9496, 109, 109, 109,
+  9497, 9497, 109, 109, 109,
+  9498, 9498, 109, 109, 109,
+  9499, 9499, 109, 109, 109,
+  9500, 9500, 109, 109, 109,
+  9501, 9501, 109, 109, 109,
+  9502, 9502, 109, 109, 109,
+  9503, 9503, 109, 109, 109,
+  9504, 9504, 109, 109, 109,
+  9505, 9505, 109, 109, 109,
+  9506, 9506, 109, 109, 109,
+  9507, 9507, 109, 109, 109,
+  9508, 9508, 109, 109, 109,
+  9509, 9509, 109, 109, 109,
+  9510, 9510, 109, 109, 109,
+  9511, 9511, 109, 109, 109,
+  9512, 9512, 109, 109, 109,
+  9513, 9513, 109, 109, 109,
+  9514, 9514, 109, 109, 109,
+  9515, 9515, 109, 109, 109,
+  9516, 9516, 109, 109, 109,
+  9517, 9517, 109, 109, 109,
+  9518, 9518, 109, 109, 109,
+  9519, 9519, 109, 109, 109,
+  9520, 9520, 109, 109, 109,
+  9521, 9521, 109, 109, 109,
+  9522, 9522, 109, 109, 109,
+  9523, 9523, 109, 109, 109,
+  9524, 9524, 109, 109, 109,
+  9525, 9525, 109, 109, 109,
+  9526, 9526, 109, 109, 109,
+  9527, 9527, 109, 109, 109,
+  9528, 9528, 109, 109, 109,
+  9529, 9529, 109, 109, 109,
+  9530, 9530, 109, 109, 109,
+  9531, 9531, 109, 109, 109,
+  9532, 9532, 109, 109, 109,
+  9533, 9533, 109, 109, 109,
+  9534, 9534, 109, 109, 109,
+  9535, 9535, 109, 109, 109,
+  9536, 9536, 109, 109, 109,
+  9537, 9537, 109, 109, 109,
+  9538, 9538, 109, 109, 109,
+  9539, 9539, 109, 109, 109,
+  9540, 9540, 109, 109, 109,
+  9541, 9541, 109, 109, 109,
+  9542, 9542, 109, 109, 109,
+  9543, 9543, 109, 109, 109,
+  9544, 9544, 109, 109, 109,
+  9545, 9545, 109, 109, 109,
+  9546, 9546, 109, 109, 109,
+  9547, 9547, 109, 109, 109,
+  9548, 9548, 113, 113, 113,
+  9549, 9549, 164, 164, 164,
+  9550, 9550, 364, 364, 364,
+  9551, 9551, 364, 364, 364,
+  9552, 9552, 164, 164, 164,
+  9553, 9553, 364, 364, 364,
+  9554, 9554, 109, 109, 109,
+  9555, 9555, 109, 109, 109,
+  9556, 9556, 109, 109, 109,
+  9557, 9557, 109, 109, 109,
+  9558, 9558, 109, 109, 109,
+  9559, 9559, 109, 109, 109,
+  9560, 9560, 109, 109, 109,
+  9561, 9561, 109, 109, 109,
+  9562, 9562, 109, 109, 109,
+  9563, 9563, 109, 109, 109,
+  9564, 9564, 109, 109, 109,
+  9565, 9565, 109, 109, 109,
+  9566, 9566, 109, 109, 109,
+  9567, 9567, 109, 109, 109,
+  9568, 9568, 109, 109, 109,
+  9569, 9569, 109, 109, 109,
+  9570, 9570, 109, 109, 109,
+  9571, 9571, 109, 109, 109,
+  9572, 9572, 109, 109, 109,
+  9573, 9573, 109, 109, 109,
+  9574, 9574, 109, 109, 109,
+  9575, 9575, 109, 109, 109,
+  9576, 9576, 109, 109, 109,
+  9577, 9577, 109, 109, 109,
+  9578, 9578, 109, 109, 109,
+  9579, 9579, 109, 109, 109,
+  9580, 9580, 109, 109, 109,
+  9581, 9581, 109, 109, 109,
+  9582, 9582, 109, 109, 109,
+  9583, 9583, 109, 109, 109,
+  9584, 9584, 109, 109, 109,
+  9585, 9585, 120, 120, 120,
+  9586, 9586, 265, 265, 265,
+  9587, 9587, 258, 258, 258,
+  9596, 9596, 113, 113, 113,
+  9597, 9597, 364, 364, 364,
+  9598, 9598, 113, 113, 113,
+  9599, 9599, 364, 364, 364,
+  9675, 9675, 340, 340, 340,
+  9702, 9702, 340, 340, 340,
+  9733, 9733, 108, 108, 108,
+  9734, 9734, 108, 108, 108,
+  9746, 9746, 258, 258, 258,
+  9747, 9747, 258, 258, 258,
+  9785, 9785, 154, 154, -1,
+  9786, 9786, 155, 155, -1,
+  9787, 9787, 32, 32, -1,
+  9837, 9837, 307, 307, 307,
+  9839, 9839, 24, 24, 24,
+  9985, 9985, 25, 25, -1,
+  9986, 9986, 25, 25, -1,
+  9987, 9987, 25, 25, -1,
+  9988, 9988, 25, 25, -1,
+  9996, 9996, 252, 252, 252,
+  10003, 10003, 388, 388, 388,
+  10004, 10004, 388, 388, 388,
+  10005, 10005, 359, 359, 359,
+  10006, 10006, 359, 359, 359,
+  10007, 10007, 258, 258, 258,
+  10008, 10008, 258, 258, 258,
+  10009, 10009, 109, 109, 109,
+  10010, 10010, 109, 109, 109,
+  10011, 10011, 109, 109, 109,
+  10012, 10012, 109, 109, 109,
+  10013, 10013, 109, 109, 109,
+  10014, 10014, 109, 109, 109,
+  10015, 10015, 109, 109, 109,
+  10016, 10016, 109, 109, 109,
+  10017, 10017, 108, 108, 108,
+  10018, 10018, 109, 109, 109,
+  10019, 10019, 109, 109, 109,
+  10020, 10020, 109, 109, 109,
+  10021, 10021, 109, 109, 109,
+  10022, 10022, 109, 109, 109,
+  10023, 10023, 109, 109, 109,
+  10025, 10025, 108, 108, 108,
+  10026, 10026, 108, 108, 108,
+  10027, 10027, 108, 108, 108,
+  10028, 10028, 108, 108, 108,
+  10029, 10029, 108, 108, 108,
+  10030, 10030, 108, 108, 108,
+  10031, 10031, 108, 108, 108,
+  10032, 10032, 108, 108, 108,
+  10033, 10033, 108, 108, 108,
+  10034, 10034, 108, 108, 108,
+  10035, 10035, 108, 108, 108,
+  10036, 10036, 108, 108, 108,
+  10037, 10037, 108, 108, 108,
+  10038, 10038, 108, 108, 108,
+  10039, 10039, 108, 108, 108,
+  10040, 10040, 108, 108, 108,
+  10041, 10041, 108, 108, 108,
+  10042, 10042, 108, 108, 108,
+  10043, 10043, 108, 108, 108,
+  10044, 10044, 108, 108, 108,
+  10045, 10045, 108, 108, 108,
+  10046, 10046, 108, 108, 108,
+  10047, 10047, 108, 108, 108,
+  10048, 10048, 108, 108, 108,
+  10049, 10049, 108, 108, 108,
+  10050, 10050, 108, 108, 108,
+  10051, 10051, 108, 108, 108,
+  10052, 10052, 108, 108, 108,
+  10053, 10053, 108, 108, 108,
+  10054, 10054, 108, 108, 108,
+  10055, 10055, 108, 108, 108,
+  10056, 10056, 108, 108, 108,
+  10057, 10057, 108, 108, 108,
+  10058, 10058, 108, 108, 108,
+  10059, 10059, 108, 108, 108,
+  64256, 64256, 315, 315, -1,
+  64257, 64257, 318, 318, -1,
+  64258, 64258, 319, 319, -1,
+  64259, 64259, 316, 316, -1,
+  64260, 64260, 317, 317, -1,
+  64261, 64261, 380, 349, -1,
+  64262, 64262, 349, 349, -1,
+  65279, 65279, 0, 0, -1,
+  65533, 65533, 170, 170, 170,
+))